@@ -1,7 +1,148 @@
 # battle/ai.py
 
-import random
-from battle.engine import calculate_damage
+import time
+from collections import OrderedDict, namedtuple
+from battle.battle_pokemon import as_battle_pokemon
+from battle.engine import NO_DAMAGE, damage_distribution, damage_distributions
+from battle.opening_book import get_opening_book, has_species_stats, level_band
+from battle.rng import get_stream
+from battle.simulator import STRUGGLE, STRUGGLE_INDEX, move_action
+from core.config import AI_DECISION_CACHE_SIZE
+from data.moves_loader import get_move_by_name
+from data.pokemon_loader import get_learnset
+
+# Bonus d'une mise K.O. certaine, en fraction des PV restants de la cible
+KO_BONUS = 0.5
+
+# Niveau de compétence à partir duquel les attaques à statut sont favorisées
+STATUS_SKILL_LEVEL = 32
+
+# Nombre de tranches de PV dans la signature d'une décision
+HP_BUCKETS = 32
+
+
+def _boosts_key(pokemon) -> tuple:
+    """Boosts non nuls d'un Pokémon, triés (forme hachable)."""
+    return tuple(sorted((stat, value) for stat, value in pokemon.boosts.items() if value))
+
+
+def decision_signature(attacker, defender, moves, skill_level=0) -> tuple:
+    """
+    Signature compacte d'une décision : espèces, niveaux, tranches de PV, statuts, boosts et attaques.
+
+    Deux situations de même signature reçoivent la même décision de BattleAI.
+
+    Args:
+        attacker (BattlePokemon): Pokémon de l'IA.
+        defender (BattlePokemon): Pokémon adverse.
+        moves (list): Attaques disponibles (l'ordre compte : la décision est un index).
+        skill_level (int): Niveau de compétence de l'IA.
+
+    Returns:
+        tuple: Clé de cache.
+    """
+    return (
+        skill_level,
+        attacker.id, attacker.level, attacker.hp * HP_BUCKETS // max(1, attacker.max_hp),
+        attacker.status, _boosts_key(attacker),
+        defender.id, defender.level, defender.hp * HP_BUCKETS // max(1, defender.max_hp),
+        defender.status, _boosts_key(defender),
+        tuple(move.get("id") or move["name"] for move in moves),
+    )
+
+
+class DecisionCache:
+    """
+    Cache LRU des décisions de BattleAI, borné en nombre d'entrées.
+
+    Attributes:
+        max_entries (int): Nombre maximal d'entrées (les moins récemment utilisées sont évincées).
+        hits, misses, evictions (int): Compteurs depuis la création ou le dernier clear().
+    """
+
+    def __init__(self, max_entries: int = AI_DECISION_CACHE_SIZE):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        """Retourne la décision mise en cache (index d'attaque), ou None."""
+        value = self._entries.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key, value):
+        """Enregistre une décision, en évinçant les plus anciennes au-delà de max_entries."""
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        self._evict()
+
+    def resize(self, max_entries: int):
+        """Change la taille maximale du cache (les entrées en trop sont évincées)."""
+        self.max_entries = max_entries
+        self._evict()
+
+    def _evict(self):
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    @property
+    def hit_rate(self) -> float:
+        """Part des recherches servies par le cache."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self) -> dict:
+        """Compteurs du cache."""
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hit_rate,
+        }
+
+    def clear(self):
+        """Vide le cache et remet les compteurs à zéro."""
+        self._entries.clear()
+        self.hits = self.misses = self.evictions = 0
+
+
+_decision_cache = None
+
+
+def _is_opening(attacker, defender) -> bool:
+    """
+    Situation couverte par le livre d'ouverture : PV pleins, ni statut ni boost,
+    même tranche de niveaux et statistiques de l'espèce (celles de la table).
+    """
+    return (
+        attacker.hp == attacker.max_hp and defender.hp == defender.max_hp
+        and not attacker.status and not defender.status
+        and not any(attacker.boosts.values()) and not any(defender.boosts.values())
+        and level_band(attacker.level) == level_band(defender.level)
+        and has_species_stats(attacker) and has_species_stats(defender)
+    )
+
+
+def get_decision_cache() -> DecisionCache:
+    """Retourne le cache de décisions partagé par le processus (conservé d'un combat à l'autre)."""
+    global _decision_cache
+    if _decision_cache is None:
+        _decision_cache = DecisionCache()
+    return _decision_cache
+
 
 class BattleAI:
     """
@@ -9,50 +150,421 @@ class BattleAI:
     
     Attributes:
         skill_level (int): Niveau de compétence de l'IA, influence la prise en compte des effets de statut.
+        cache (DecisionCache | None): Cache des décisions (None = désactivé).
+        use_book (bool): Consulte le livre d'ouverture (battle.opening_book) s'il a été construit.
     """
-    def __init__(self, skill_level=0):
+    def __init__(self, skill_level=0, use_cache=True, cache=None, use_book=True):
         """
         Initialise une instance de l'IA avec un niveau de compétence donné.
 
         Args:
             skill_level (int): Niveau de compétence de l'IA (par défaut : 0).
+            use_cache (bool): Met en cache les décisions (par signature de la situation).
+            cache (DecisionCache, optional): Cache à utiliser (par défaut, le cache partagé).
+            use_book (bool): Consulte le livre d'ouverture (construit par tools/build_opening_book.py).
         """
         self.skill_level = skill_level
+        self.cache = (cache if cache is not None else get_decision_cache()) if use_cache else None
+        # Le livre est calculé sans le bonus des attaques à statut
+        self.use_book = use_book and skill_level < STATUS_SKILL_LEVEL
 
-    def choose_move(self, attacker, defender, moves):
+    def choose_move(self, attacker, defender, moves, rng=None):
         """
-        Choisit la meilleure attaque à utiliser parmi celles disponibles.
+        Choisit l'attaque offensive de meilleure valeur espérée.
+
+        Toutes les attaques sont évaluées en un seul lot (damage_distributions :
+        stats et types lus une fois), à partir de la loi exacte des dégâts que
+        move_handler.use_move applique (même formule, engine.calculate_damage) :
+        aucun tirage, donc une décision déterministe. Le score d'une attaque est
+
+            précision × (E[min(dégâts, PV adverses)] + KO_BONUS × PV adverses × P(K.O.))
+
+        où l'espérance comprend le facteur aléatoire, les critiques et le multiplicateur de types.
+        En début d'affrontement (voir _is_opening), la décision est lue dans le
+        livre d'ouverture s'il existe ; sinon, une situation déjà rencontrée
+        (même decision_signature) est servie par le cache.
 
         Args:
-            attacker (dict): Dictionnaire représentant le Pokémon attaquant.
-            defender (dict): Dictionnaire représentant le Pokémon défenseur.
+            attacker (BattlePokemon | dict): Le Pokémon attaquant.
+            defender (BattlePokemon | dict): Le Pokémon défenseur.
             moves (list): Liste des attaques disponibles (chaque attaque est un dictionnaire).
+            rng (BattleRNG, optional): Générateur du combat (seulement si aucune attaque n'inflige de dégâts).
 
         Returns:
-            dict: L'attaque choisie.
+            dict: L'attaque choisie (Lutte, simulator.STRUGGLE, si moves est vide).
         """
-        best_score = float("-inf")
-        best_move = None
+        if not moves:
+            return STRUGGLE
 
-        for move in moves:
-            power = move.get("power")
-            if not power:
-                continue
+        attacker = as_battle_pokemon(attacker)
+        defender = as_battle_pokemon(defender)
 
-            damage, _, type_multiplier = calculate_damage(attacker, defender, move)
+        move = self._opening_move(attacker, defender, moves)
+        if move is not None:
+            return move
 
-            score = damage * (move.get("accuracy", 100) / 100)
+        key = None
+        if self.cache is not None:
+            key = decision_signature(attacker, defender, moves, self.skill_level)
+            index = self.cache.get(key)
+            if index is not None:
+                return moves[index]
 
-            if type_multiplier > 1:
-                score *= 1.5
-            elif type_multiplier < 1:
-                score *= 0.5
+        index = self.best_move_index(attacker, defender, moves)
+        if index is None:
+            # Aucune attaque offensive : choix au hasard, non mis en cache
+            return get_stream(rng, "ai").choice(moves)
+        if key is not None:
+            self.cache.put(key, index)
+        return moves[index]
 
-            if move.get("effects", {}).get("status") and self.skill_level >= 32:
+    def _opening_move(self, attacker, defender, moves):
+        """
+        Attaque conseillée par le livre d'ouverture, ou None (livre désactivé,
+        absent, ou situation qu'il ne couvre pas).
+
+        L'index du livre désigne une attaque apprise au niveau ; il n'est suivi
+        que si moves contient bien cette attaque à cette position.
+        """
+        if not self.use_book or not _is_opening(attacker, defender):
+            return None
+        book = get_opening_book()
+        if book is None:
+            return None
+        index = book.lookup(attacker.id, defender.id, attacker.level)
+        if index is None or index >= len(moves):
+            return None
+        learnset = get_learnset(attacker.id)
+        if learnset is None or index >= len(learnset.moves) or learnset.moves[index]["name"] != moves[index].get("name"):
+            return None
+        return moves[index]
+
+    def best_move_index(self, attacker, defender, moves):
+        """
+        Index de l'attaque de meilleur score (voir choose_move), sans livre ni cache.
+
+        Args:
+            attacker (BattlePokemon): Le Pokémon attaquant.
+            defender (BattlePokemon): Le Pokémon défenseur.
+            moves (list): Attaques disponibles.
+
+        Returns:
+            int | None: Index dans moves, ou None si aucune attaque n'inflige de dégâts.
+        """
+        target_hp = max(1, defender.hp)
+        status_bonus = self.skill_level >= STATUS_SKILL_LEVEL
+
+        best_score = float("-inf")
+        best_index = None
+        for index, distribution in enumerate(damage_distributions(attacker, defender, moves)):
+            if distribution is NO_DAMAGE:
+                continue
+            if distribution.damages[-1] < target_hp:
+                # Aucun tirage ne met K.O. : dégâts utiles = dégâts moyens, P(K.O.) = 0
+                score = distribution.mean
+            else:
+                score = distribution.capped_mean(target_hp) + KO_BONUS * target_hp * distribution.ko_probability(target_hp)
+
+            # Précision absente (None) : l'attaque ne peut pas échouer
+            move = moves[index]
+            score *= (move.get("accuracy") or 100) / 100
+
+            if status_bonus and move.get("effects", {}).get("status"):
                 score += 10
 
             if score > best_score:
                 best_score = score
-                best_move = move
+                best_index = index
+
+        return best_index
+
+    def observe_opponent_move(self, index):
+        """
+        Indique l'attaque jouée par l'adversaire (index dans ses attaques).
+
+        Ignoré par défaut ; les IA qui gardent un arbre de recherche d'un tour à l'autre s'en servent.
+        """
+
+    def close(self):
+        """Libère les ressources de l'IA (aucune par défaut)."""
+
+# Valeur d'un combat gagné (une position non terminale vaut entre -1 et 1)
+WIN_VALUE = 2.0
+
+# Bonus par tour restant : une victoire rapide vaut mieux qu'une victoire lente
+DEPTH_BONUS = 0.01
+
+# Nombre maximal d'entrées d'une table de transposition (vidée au-delà)
+TRANSPOSITION_LIMIT = 200000
+
+# Nombre de nœuds explorés entre deux vérifications du temps restant
+TIME_CHECK_INTERVAL = 16
+
+# Marge retirée du budget de temps : la vérification n'a lieu que tous les
+# TIME_CHECK_INTERVAL nœuds, la réponse doit arriver avant la fin du budget
+SEARCH_MARGIN_MS = 2
+
+# Modèle d'une attaque pour la recherche : priorité et issues (dégâts, probabilité), échec compris
+MoveOption = namedtuple("MoveOption", ("priority", "outcomes"))
+
+
+class _SearchTimeout(Exception):
+    """Le budget de temps de la décision est épuisé."""
+
+
+def damage_buckets(distribution, buckets: int) -> tuple:
+    """
+    Regroupe une loi de dégâts en quelques tranches de même probabilité.
+
+    Args:
+        distribution (DamageDistribution): Loi exacte des dégâts.
+        buckets (int): Nombre de tranches.
+
+    Returns:
+        tuple[tuple[int, float]]: (dégâts moyens de la tranche, probabilité) par tranche.
+    """
+    result = []
+    target = 1.0 / buckets
+    mass = weighted = 0.0
+    for damage, probability in zip(distribution.damages, distribution.probabilities):
+        mass += probability
+        weighted += damage * probability
+        if mass >= target - 1e-12:
+            result.append((int(round(weighted / mass)), mass))
+            mass = weighted = 0.0
+    if mass > 1e-12:
+        result.append((int(round(weighted / mass)), mass))
+    return tuple(result)
+
+
+def build_move_option(attacker, defender, move, buckets: int) -> MoveOption:
+    """
+    Modélise une attaque pour la recherche : précision, puis tranches de dégâts (critiques compris).
+
+    Args:
+        attacker (BattlePokemon): Lanceur.
+        defender (BattlePokemon): Cible.
+        move (dict): Attaque (résolue dans le registre si possible).
+        buckets (int): Nombre de tranches de dégâts.
+
+    Returns:
+        MoveOption: Priorité et issues (dégâts, probabilité) ; l'échec est une issue à 0 dégât.
+    """
+    move = get_move_by_name(move["name"], language="fr") or move
+    accuracy = move.get("accuracy")
+    hit = 1.0 if accuracy is None else accuracy / 100
+
+    outcomes = {}
+    if hit < 1.0:
+        outcomes[0] = 1.0 - hit
+    for damage, probability in damage_buckets(damage_distribution(attacker, defender, move), buckets):
+        outcomes[damage] = outcomes.get(damage, 0.0) + hit * probability
+    return MoveOption(move.get("priority") or 0, tuple(sorted(outcomes.items())))
+
+
+class ExpectiminimaxAI(BattleAI):
+    """
+    IA de recherche : expectiminimax à profondeur limitée sur un modèle du combat 1 contre 1.
+
+    Chaque tour est un nœud max (attaque de l'IA), puis min (réponse de
+    l'adversaire), puis des nœuds de hasard pour chaque attaque dans l'ordre
+    de priorité et de vitesse : précision, puis tranches de la loi exacte des
+    dégâts (critiques compris, voir engine.damage_distribution).
+
+    Les positions déjà évaluées sont gardées dans une table de transposition,
+    indexée par (PV de l'IA, PV de l'adversaire, profondeur) pour un affrontement
+    donné. La recherche s'approfondit tour par tour tant que le budget de temps
+    n'est pas épuisé.
+
+    Attributes:
+        max_depth (int): Nombre maximal de tours explorés.
+        time_budget_ms (float | None): Budget de temps par décision (None = pas de limite).
+        buckets (int): Tranches de dégâts par attaque.
+        tables (dict): Tables de transposition, par affrontement.
+        last_depth (int): Profondeur complètement explorée lors de la dernière décision.
+        nodes (int): Nœuds explorés lors de la dernière décision.
+    """
+
+    def __init__(self, skill_level=0, max_depth=3, time_budget_ms=50, buckets=3, use_book=True):
+        """
+        Args:
+            skill_level (int): Niveau de compétence (utilisé par le repli glouton, avec le cache partagé).
+            max_depth (int): Nombre maximal de tours explorés.
+            time_budget_ms (float, optional): Budget de temps par décision, en millisecondes.
+            buckets (int): Tranches de dégâts par attaque.
+            use_book (bool): Joue l'ouverture d'un affrontement depuis le livre d'ouverture, sans recherche.
+        """
+        super().__init__(skill_level, use_book=use_book)
+        self.max_depth = max_depth
+        self.time_budget_ms = time_budget_ms
+        self.buckets = buckets
+        self.tables = {}
+        self.last_depth = 0
+        self.nodes = 0
+
+        # Contexte de la recherche en cours
+        self._table = None
+        self._deadline = None
+        self._mine = self._theirs = ()
+        self._max_hp = (1, 1)
+        self._speeds = (0, 0)
+
+    def choose_move(self, attacker, defender, moves, rng=None):
+        """
+        Choisit l'attaque qui maximise la valeur espérée de la position après recherche.
+
+        Args:
+            attacker (BattlePokemon | dict): Pokémon de l'IA.
+            defender (BattlePokemon | dict): Pokémon adverse.
+            moves (list): Attaques disponibles de l'IA.
+            rng (BattleRNG, optional): Générateur du combat (utilisé seulement par le repli glouton).
+
+        Returns:
+            dict: L'attaque choisie (Lutte si moves est vide).
+        """
+        start = time.perf_counter()
+        attacker = as_battle_pokemon(attacker)
+        defender = as_battle_pokemon(defender)
+        move = self._opening_move(attacker, defender, moves)
+        if move is not None:
+            return move
+        opponent_moves = [move for move, pp in zip(defender.moves, defender.pp) if pp > 0] or defender.moves
+
+        mine = tuple(build_move_option(attacker, defender, move, self.buckets) for move in moves)
+        theirs = tuple(build_move_option(defender, attacker, move, self.buckets) for move in opponent_moves)
+        if not any(damage for option in mine for damage, _ in option.outcomes) or not theirs:
+            # Aucune attaque offensive (ou adversaire sans attaque) : rien à explorer
+            return super().choose_move(attacker, defender, moves, rng=rng)
+
+        self._mine, self._theirs = mine, theirs
+        self._max_hp = (attacker.max_hp, defender.max_hp)
+        self._speeds = (attacker.speed, defender.speed)
+
+        context = (mine, theirs, self._max_hp, self._speeds)
+        table = self.tables.get(context)
+        if table is None:
+            if sum(len(t) for t in self.tables.values()) > TRANSPOSITION_LIMIT:
+                self.tables.clear()
+            table = self.tables[context] = {}
+        self._table = table
+
+        # Le budget court depuis l'appel (construction des modèles d'attaque comprise)
+        self._deadline = None if self.time_budget_ms is None \
+            else start + (self.time_budget_ms - SEARCH_MARGIN_MS) / 1000
+        self.nodes = 0
+        self.last_depth = 0
+
+        # Approfondissement itératif : on garde le choix de la dernière profondeur complète
+        best = max(range(len(mine)), key=lambda i: sum(d * p for d, p in mine[i].outcomes))
+        for depth in range(1, self.max_depth + 1):
+            try:
+                scores = []
+                for i in range(len(mine)):
+                    # Vérifié avant chaque attaque racine (et donc avant chaque passe)
+                    self._check_deadline()
+                    scores.append(self._root_value(i, attacker.hp, defender.hp, depth))
+            except _SearchTimeout:
+                break
+            best = max(range(len(mine)), key=scores.__getitem__)
+            self.last_depth = depth
+
+        return moves[best]
+
+    def _check_deadline(self):
+        """
+        Raises:
+            _SearchTimeout: Si le budget de temps de la décision est épuisé.
+        """
+        if self._deadline is not None and time.perf_counter() >= self._deadline:
+            raise _SearchTimeout()
+
+    def _root_value(self, index, hp_a, hp_b, depth):
+        """Valeur de l'attaque n° index : pire réponse de l'adversaire."""
+        return min(self._turn_value(self._mine[index], theirs, hp_a, hp_b, depth) for theirs in self._theirs)
+
+    def _value(self, hp_a, hp_b, depth):
+        """
+        Valeur d'une position (du point de vue de l'IA) avant un tour.
+
+        Seul endroit où une position terminale reçoit son bonus de profondeur :
+        un K.O. au tour de profondeur depth est évalué ici avec depth - 1, quel
+        que soit le Pokémon qui a agi en premier.
+        """
+        if hp_a <= 0:
+            return -WIN_VALUE - DEPTH_BONUS * depth
+        if hp_b <= 0:
+            return WIN_VALUE + DEPTH_BONUS * depth
+        if depth == 0:
+            return hp_a / self._max_hp[0] - hp_b / self._max_hp[1]
+
+        key = (hp_a, hp_b, depth)
+        value = self._table.get(key)
+        if value is not None:
+            return value
+
+        self.nodes += 1
+        if self.nodes % TIME_CHECK_INTERVAL == 0:
+            self._check_deadline()
+
+        value = max(
+            min(self._turn_value(mine, theirs, hp_a, hp_b, depth) for theirs in self._theirs)
+            for mine in self._mine
+        )
+        if len(self._table) < TRANSPOSITION_LIMIT:
+            self._table[key] = value
+        return value
+
+    def _turn_value(self, mine, theirs, hp_a, hp_b, depth):
+        """Espérance sur les nœuds de hasard d'un tour où les deux attaques sont choisies."""
+        # À priorité et vitesse égales, l'IA suppose que l'adversaire agit en premier
+        ai_first = (mine.priority, self._speeds[0]) > (theirs.priority, self._speeds[1])
+        total = 0.0
+
+        if ai_first:
+            for damage, probability in mine.outcomes:
+                remaining_b = hp_b - damage
+                if remaining_b <= 0:
+                    # L'adversaire est K.O. avant de répondre
+                    total += probability * self._value(hp_a, remaining_b, depth - 1)
+                    continue
+                for counter, counter_probability in theirs.outcomes:
+                    total += probability * counter_probability * self._value(hp_a - counter, remaining_b, depth - 1)
+        else:
+            for counter, counter_probability in theirs.outcomes:
+                remaining_a = hp_a - counter
+                if remaining_a <= 0:
+                    # L'IA est K.O. avant d'agir
+                    total += counter_probability * self._value(remaining_a, hp_b, depth - 1)
+                    continue
+                for damage, probability in mine.outcomes:
+                    total += counter_probability * probability * self._value(remaining_a, hp_b - damage, depth - 1)
+        return total
+
+
+class AIPolicy:
+    """
+    Politique du simulateur (battle.simulator) qui confie le choix des attaques à une IA.
+
+    Les instances sont picklables : elles peuvent être passées à estimate_matchup.
+    """
+
+    def __init__(self, ai):
+        """
+        Args:
+            ai (BattleAI): IA utilisée pour choisir l'attaque du Pokémon actif.
+        """
+        self.ai = ai
+
+    def __call__(self, state, side):
+        pokemon = state.active(side)
+        opponent = state.active("b" if side == "a" else "a")
+        indexes = [i for i, pp in enumerate(pokemon.pp) if pp > 0]
+        if not indexes:
+            return move_action(STRUGGLE_INDEX)
 
-        return best_move if best_move else random.choice(moves)
+        moves = [pokemon.moves[i] for i in indexes]
+        chosen = self.ai.choose_move(pokemon, opponent, moves, rng=state.rng)
+        for i, move in zip(indexes, moves):
+            if move is chosen:
+                return move_action(i)
+        return move_action(indexes[0])
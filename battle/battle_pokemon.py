@@ -0,0 +1,188 @@
+# battle/battle_pokemon.py
+
+"""
+Modèle compact d'un Pokémon pendant un combat.
+
+Les entrées d'équipe de la run sont des dicts libres (stats, base_stats, hp,
+moves...). Pendant un combat, chaque Pokémon est converti une seule fois en
+BattlePokemon : statistiques, boosts, statut, états temporaires et PP sont des
+attributs à emplacement fixe (__slots__), lus sans recherche de clé ni
+construction de dict à chaque tour.
+"""
+
+from data.types_loader import get_type_chart
+
+# Clé de pokemon.json → attribut de BattlePokemon
+STAT_ATTRIBUTES = {
+    "hp": "max_hp",
+    "attack": "attack",
+    "defense": "defense",
+    "special-attack": "special_attack",
+    "special-defense": "special_defense",
+    "speed": "speed",
+}
+
+
+class BattlePokemon:
+    """
+    Pokémon au combat.
+
+    Attributes:
+        entry (dict | None): Entrée d'équipe d'origine (PV et statut mis à jour par to_team_entry).
+        id (int), name (str), level (int): Identité du Pokémon.
+        types (tuple[str]): Types (noms de pokemon.json).
+        type_ids (tuple[int]): Identifiants TypeChart des types.
+        max_hp, hp (int): PV maximum et actuels.
+        attack, defense, special_attack, special_defense, speed (int): Statistiques.
+        boosts (dict[str, int]): Modificateurs de stats ("atk", "def", "acc"...), propres au combat.
+        status (str | None): Statut durable (ex: "poison").
+        moves (list[dict]): Attaques connues (partagées avec l'entrée d'équipe).
+        pp (list[int]): PP restants, dans l'ordre de moves.
+        capture_rate (int): Taux de capture de base.
+        protected, recharging, flinched, charging (bool): États temporaires.
+    """
+
+    __slots__ = (
+        "entry", "id", "name", "level", "types", "type_ids",
+        "max_hp", "hp", "attack", "defense", "special_attack", "special_defense", "speed",
+        "boosts", "status", "moves", "pp", "capture_rate",
+        "protected", "recharging", "flinched", "charging",
+    )
+
+    def __init__(self, pokemon_id: int, name: str, level: int, types, stats: dict, hp: int = None,
+                 moves=None, status=None, boosts=None, capture_rate: int = 150, entry: dict = None):
+        self.entry = entry
+        self.id = pokemon_id
+        self.name = name
+        self.level = level
+        self.types = tuple(types)
+        self.type_ids = get_type_chart().type_ids(self.types)
+
+        self.max_hp = stats.get("hp", 1)
+        self.attack = stats.get("attack", 10)
+        self.defense = stats.get("defense", 10)
+        self.special_attack = stats.get("special-attack", 10)
+        self.special_defense = stats.get("special-defense", 10)
+        self.speed = stats.get("speed", 0)
+        self.hp = self.max_hp if hp is None else hp
+
+        self.boosts = dict(boosts) if boosts else {}
+        self.status = status
+        self.moves = moves if moves is not None else []
+        self.pp = [move.get("pp", 0) for move in self.moves]
+        self.capture_rate = capture_rate
+
+        self.protected = False
+        self.recharging = False
+        self.flinched = False
+        self.charging = False
+
+    @classmethod
+    def from_team_entry(cls, entry: dict):
+        """
+        Construit un BattlePokemon à partir d'une entrée d'équipe (ou d'un Pokémon du Pokédex).
+
+        Le Pokémon entre au combat sans boost : seuls les PV et le statut viennent de l'entrée.
+
+        Args:
+            entry (dict): Pokémon de la run (stats ou base_stats, hp, moves...).
+
+        Returns:
+            BattlePokemon: Pokémon de combat lié à cette entrée.
+        """
+        stats = entry.get("stats") or entry.get("base_stats") or {}
+        return cls(
+            entry.get("id", 0),
+            entry.get("name", ""),
+            entry.get("level", 5),
+            entry.get("types", ()),
+            stats,
+            hp=entry.get("hp"),
+            moves=entry.get("moves"),
+            status=entry.get("status"),
+            capture_rate=entry.get("base_capture_rate", 150),
+            entry=entry,
+        )
+
+    def to_team_entry(self) -> dict:
+        """
+        Reporte l'état durable du combat (PV, statut) dans l'entrée d'équipe.
+
+        Les boosts ne durent que le temps du combat : ils ne sont pas écrits
+        (et une clé "boosts" laissée par une ancienne version est retirée).
+
+        Returns:
+            dict: L'entrée d'origine mise à jour, ou une nouvelle entrée si le
+            Pokémon n'a pas été créé depuis l'équipe.
+        """
+        entry = self.entry
+        if entry is None:
+            entry = self.entry = {
+                "id": self.id,
+                "name": self.name,
+                "level": self.level,
+                "types": list(self.types),
+                "stats": self.stats_dict(),
+                "base_stats": self.stats_dict(),
+                "moves": self.moves,
+            }
+        entry["hp"] = self.hp
+        if self.status:
+            entry["status"] = self.status
+        else:
+            entry.pop("status", None)
+        entry.pop("boosts", None)
+        return entry
+
+    def stats_dict(self) -> dict:
+        """Retourne les statistiques au format de pokemon.json."""
+        return {key: getattr(self, attribute) for key, attribute in STAT_ATTRIBUTES.items()}
+
+    def copy(self):
+        """Copie indépendante (boosts et PP dupliqués, attaques et entrée partagées)."""
+        clone = BattlePokemon.__new__(BattlePokemon)
+        for attribute in BattlePokemon.__slots__:
+            setattr(clone, attribute, getattr(self, attribute))
+        clone.boosts = dict(self.boosts)
+        clone.pp = list(self.pp)
+        return clone
+
+    def use_pp(self, index: int) -> bool:
+        """Décompte un PP de l'attaque n° index ; False s'il n'en reste plus."""
+        if self.pp[index] <= 0:
+            return False
+        self.pp[index] -= 1
+        return True
+
+    def reset_volatile(self):
+        """Réinitialise les états temporaires qui ne durent qu'un tour (protection, peur)."""
+        self.protected = False
+        self.flinched = False
+
+    @property
+    def fainted(self) -> bool:
+        """Indique si le Pokémon est K.O."""
+        return self.hp <= 0
+
+    def __repr__(self):
+        return f"BattlePokemon(id={self.id!r}, name={self.name!r}, level={self.level}, hp={self.hp}/{self.max_hp})"
+
+
+def as_battle_pokemon(pokemon):
+    """Retourne pokemon s'il s'agit déjà d'un BattlePokemon, sinon le convertit depuis un dict."""
+    if isinstance(pokemon, BattlePokemon):
+        return pokemon
+    return BattlePokemon.from_team_entry(pokemon)
+
+
+def sync_converted(*pairs):
+    """
+    Reporte l'état des Pokémon convertis par as_battle_pokemon dans les dicts d'origine.
+
+    Args:
+        *pairs: Couples (valeur reçue par l'appelant, BattlePokemon utilisé) ; les
+            couples où l'appelant a déjà passé un BattlePokemon sont ignorés.
+    """
+    for original, pokemon in pairs:
+        if original is not pokemon:
+            pokemon.to_team_entry()
@@ -1,7 +1,11 @@
 # battle/capture_handler.py
 
-import random
 import math
+from collections import namedtuple
+from functools import lru_cache
+from battle.battle_pokemon import as_battle_pokemon
+from battle.events import BrokeFree, Captured
+from battle.rng import get_stream
 
 # Modificateurs appliqués selon le statut du Pokémon
 STATUS_MODIFIERS = {
@@ -20,6 +24,15 @@ BALL_MODIFIERS = {
     "master ball": 255.0  # capture garantie
 }
 
+# Précision de la fraction de PV dans la clé du cache de capture_probabilities
+HP_FRACTION_STEPS = 4096
+
+# success : probabilité de capture ; shakes[k] : probabilité de s'échapper après k secousses ;
+# threshold : seuil b des tests de secousse (None si la capture est garantie)
+CaptureOdds = namedtuple("CaptureOdds", ("success", "shakes", "threshold"))
+
+_CERTAIN = CaptureOdds(1.0, (0.0, 0.0, 0.0, 0.0), None)
+
 def get_ball_modifier(ball_name):
     """
     Renvoie le multiplicateur associé à une Poké Ball.
@@ -46,56 +59,95 @@ def get_status_modifier(status):
         return 1.0
     return STATUS_MODIFIERS.get(status.lower(), 1.0)
 
-def attempt_capture(pokemon, ball_name, status=None):
+def shake_threshold(a):
+    """
+    Seuil b de la formule de la 3e génération : chaque secousse réussit si randint(0, 65535) < b.
+
+    Args:
+        a (float): Taux de capture modifié (0 à 255).
+
+    Returns:
+        int: Seuil des 4 tests de secousse.
+    """
+    try:
+        return int(1048560 / math.sqrt(math.sqrt(16711680 / a)))
+    except ZeroDivisionError:
+        return 0
+
+@lru_cache(maxsize=4096)
+def _capture_odds(catch_rate, hp_step, ball_mod, status_mod):
+    """Probabilités de capture pour une clé quantifiée (voir capture_probabilities)."""
+    if ball_mod >= 255:
+        return _CERTAIN
+
+    hp_fraction = hp_step / HP_FRACTION_STEPS
+    a = (3 - 2 * hp_fraction) * catch_rate * ball_mod * status_mod / 3
+    if a >= 255:
+        return _CERTAIN
+
+    # Probabilité qu'un test de secousse (randint(0, 65535) < b) réussisse
+    b = shake_threshold(a)
+    p = min(1.0, b / 65536)
+    shakes = tuple(p ** k * (1 - p) for k in range(4))
+    return CaptureOdds(p ** 4, shakes, b)
+
+def capture_probabilities(pokemon, ball_name, status=None):
+    """
+    Probabilités exactes d'une tentative de capture, sans tirage.
+
+    C'est la formule de attempt_capture, qui tire ses secousses avec le seuil
+    retourné ici. Le résultat est mis en cache sur (taux de capture, fraction
+    de PV à 1/HP_FRACTION_STEPS près, Ball, statut).
+
+    Args:
+        pokemon (BattlePokemon | dict): Pokémon ciblé (PV, PV max, taux de capture).
+        ball_name (str): Type de Poké Ball utilisée.
+        status (str, optional): Statut du Pokémon.
+
+    Returns:
+        CaptureOdds: (success, shakes, threshold), où success est la probabilité de
+        capture, shakes[k] la probabilité que le Pokémon s'échappe après k secousses
+        (k = 0 à 3) et threshold le seuil b des secousses (None si la capture est garantie).
+    """
+    pokemon = as_battle_pokemon(pokemon)
+    hp_step = round(HP_FRACTION_STEPS * pokemon.hp / pokemon.max_hp) if pokemon.max_hp else 0
+    return _capture_odds(pokemon.capture_rate, hp_step, get_ball_modifier(ball_name), get_status_modifier(status))
+
+def attempt_capture(pokemon, ball_name, status=None, rng=None):
     """
     Tente de capturer un Pokémon en utilisant la formule officielle.
 
+    Les probabilités viennent de capture_probabilities : un lancer suit
+    exactement les chances qu'elle annonce.
+
     Args:
-        pokemon (dict): Dictionnaire contenant les infos du Pokémon (hp, stats, capture rate...).
+        pokemon (BattlePokemon | dict): Pokémon ciblé (PV, PV max, taux de capture...).
         ball_name (str): Type de Poké Ball utilisée.
         status (str, optional): Statut du Pokémon (par défaut: None).
+        rng (BattleRNG, optional): Générateur du combat (module random global si absent).
 
     Returns:
         dict: {
             "success": bool,
             "shakes": int,
-            "messages": list[str]
+            "events": list (Captured ou BrokeFree, voir battle.events)
         }
     """
-    max_hp = pokemon["stats"]["hp"]
-    current_hp = pokemon["hp"]
-    catch_rate = pokemon.get("base_capture_rate", 150)
-
-    ball_mod = get_ball_modifier(ball_name)
-    status_mod = get_status_modifier(status)
+    pokemon = as_battle_pokemon(pokemon)
+    odds = capture_probabilities(pokemon, ball_name, status)
 
-    # Master Ball = réussite automatique
-    if ball_mod >= 255:
+    # Master Ball ou taux suffisant = réussite automatique
+    if odds.threshold is None:
         return {
             "success": True,
             "shakes": 3,
-            "messages": [f"{pokemon['name']} est capturé !"]
+            "events": [Captured(pokemon.name)]
         }
 
-    # Calcul du taux de capture
-    a = ((3 * max_hp - 2 * current_hp) * catch_rate * ball_mod * status_mod) / (3 * max_hp)
-
-    if a >= 255:
-        return {
-            "success": True,
-            "shakes": 3,
-            "messages": [f"{pokemon['name']} est capturé !"]
-        }
-
-    # Calcul du seuil b (probabilité de secousses)
-    try:
-        b = int(1048560 / math.sqrt(math.sqrt(16711680 / a)))
-    except ZeroDivisionError:
-        b = 0
-
+    capture_rng = get_stream(rng, "capture")
     shakes = 0
     for _ in range(4):
-        if random.randint(0, 65535) < b:
+        if capture_rng.randint(0, 65535) < odds.threshold:
             shakes += 1
         else:
             break
@@ -104,11 +156,11 @@ def attempt_capture(pokemon, ball_name, status=None):
         return {
             "success": True,
             "shakes": 3,
-            "messages": [f"{pokemon['name']} est capturé !"]
+            "events": [Captured(pokemon.name)]
         }
     
     return {
         "success": False,
         "shakes": shakes,
-        "messages": [f"{pokemon['name']} s'est échappé !"]
+        "events": [BrokeFree(pokemon.name, shakes)]
     }
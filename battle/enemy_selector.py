@@ -1,9 +1,10 @@
 # battle/enemy_selector.py
 
-import random
-from data.pokemon_loader import get_all_pokemon
+from battle.rng import get_stream
+from data.pokemon_loader import get_all_pokemon, get_pokedex
+from data.stat_table import get_stat_table
 
-def get_balanced_enemy(ally_pokemon, level_margin=1, stat_margin=0.15):
+def get_balanced_enemy(ally_pokemon, level_margin=1, stat_margin=0.15, rng=None):
     """
     Sélectionne un Pokémon ennemi équilibré en fonction d'un Pokémon allié donné.
 
@@ -11,11 +12,14 @@ def get_balanced_enemy(ally_pokemon, level_margin=1, stat_margin=0.15):
         ally_pokemon (dict): Le Pokémon de l'utilisateur (doit contenir "level" et "base_stats").
         level_margin (int, optional): Marge de niveau autorisée autour de celui de l'allié.
         stat_margin (float, optional): Marge de tolérance sur le total des statistiques de base.
+        rng (BattleRNG, optional): Générateur du combat (flux "encounter", module random global si absent).
 
     Returns:
         dict: Un Pokémon adverse équilibré avec un niveau assigné.
     """
     all_pokemon = get_all_pokemon()
+    stat_table = get_stat_table()
+    encounter_rng = get_stream(rng, "encounter")
 
     ally_level = ally_pokemon.get("level", 5)
     ally_base_stats = ally_pokemon.get("base_stats", {})
@@ -25,19 +29,12 @@ def get_balanced_enemy(ally_pokemon, level_margin=1, stat_margin=0.15):
     stat_min = int(ally_total_stats * (1.0 - stat_margin))
     stat_max = int(ally_total_stats * (1.0 + stat_margin))
 
-    filtered = []
-    for pkm in all_pokemon:
-        base_stats = pkm.get("stats", {})
-        total_stats = sum(base_stats.values())
+    # On exclut les Pokémon qui n'ont pas d'évolution (stade final)
+    candidates = stat_table.species_in_bst_range(stat_min, stat_max, evolving_only=True)
+    if not candidates:
+        return encounter_rng.choice(all_pokemon)
 
-        # On exclut les Pokémon qui n'ont pas d'évolution (stade final)
-        if not pkm.get("evolution", {}).get("evolves_to"):
-            continue
-
-        if stat_min <= total_stats <= stat_max:
-            filtered.append({
-                **pkm,
-                "level": random.choice(level_range)
-            })
-
-    return random.choice(filtered) if filtered else random.choice(all_pokemon)
+    return {
+        **get_pokedex().get_by_id(encounter_rng.choice(candidates)),
+        "level": encounter_rng.choice(level_range)
+    }
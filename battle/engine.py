@@ -1,30 +1,55 @@
 # battle/engine.py
 
-import random
-from data.types_loader import get_all_types
+from array import array
+from bisect import bisect_left
+from functools import lru_cache
+from battle.battle_pokemon import as_battle_pokemon
+from battle.rng import get_stream
+from data.types_loader import get_type_chart
 
-# Chargement du tableau de types
-TYPE_CHART = get_all_types()
+# Probabilité de coup critique (6.25 %)
+CRIT_CHANCE = 0.0625
+
+# Tirages aléatoires possibles, en % (16 valeurs équiprobables de 85 à 100)
+DAMAGE_ROLLS = tuple(range(85, 101))
+
+# Nombre de distributions de dégâts gardées en cache
+DISTRIBUTION_CACHE_SIZE = 4096
+
+def roll_random_factor(rng=None):
+    """Tire le facteur aléatoire des dégâts (un des 16 tirages de DAMAGE_ROLLS, divisé par 100)."""
+    return get_stream(rng, "damage").randint(DAMAGE_ROLLS[0], DAMAGE_ROLLS[-1]) / 100
+
+def is_special_move(move) -> bool:
+    """
+    Indique si une attaque utilise l'Attaque Spéciale et la Défense Spéciale.
+
+    Les attaques du registre ont un champ "damage_class" ; les fiches des
+    learnsets (data.pokemon_loader) le nomment "category".
+    """
+    return (move.get("damage_class") or move.get("category")) == "special"
 
 def find_type_info(type_name):
     """
     Recherche les relations de type pour un type donné.
 
     Args:
-        type_name (str): Le nom du type (ex. "Feu").
+        type_name (str): Le nom du type, français ou anglais (ex. "Feu", "fire").
 
     Returns:
         dict | None: Les données du type ou None si introuvable.
     """
-    for type_info in TYPE_CHART:
-        if type_info["name"].lower() == type_name.lower():
-            return type_info
-    return None
+    chart = get_type_chart()
+    type_id = chart.type_id(type_name)
+    return chart.types[type_id] if type_id != chart.neutral_id else None
 
 def get_type_multiplier(move_type, defender_types):
     """
     Calcule le multiplicateur de dégâts selon les types du défenseur.
 
+    Les noms (français ou anglais) sont convertis en identifiants puis lus
+    dans la matrice dense de TypeChart : un double type = deux lectures.
+
     Args:
         move_type (str): Le type de l'attaque.
         defender_types (list[str]): Les types du Pokémon adverse.
@@ -32,54 +57,334 @@ def get_type_multiplier(move_type, defender_types):
     Returns:
         float: Multiplicateur total (0.0 à 4.0+).
     """
+    chart = get_type_chart()
+    matrix = chart.matrix
+    row = chart.type_id(move_type) * chart.size
+
     multiplier = 1.0
-    move_info = find_type_info(move_type)
-    if not move_info:
-        return multiplier
+    for target_type in defender_types:
+        multiplier *= matrix[row + chart.type_id(target_type)]
+    return multiplier
 
-    relations = move_info.get("damage_relations", {})
+def damage_formula(level, power, atk_stat, def_stat, stab, type_multiplier, is_crit, random_factor):
+    """
+    Formule de dégâts commune au calcul unitaire et au calcul par lots.
 
-    for target_type in defender_types:
-        if target_type in relations.get("double_damage_to", []):
-            multiplier *= 2.0
-        elif target_type in relations.get("half_damage_to", []):
-            multiplier *= 0.5
-        elif target_type in relations.get("no_damage_to", []):
-            multiplier *= 0.0
+    Args:
+        level (int): Niveau de l'attaquant.
+        power (int): Puissance de l'attaque (non nulle).
+        atk_stat (int): Attaque (ou Attaque Spéciale) de l'attaquant.
+        def_stat (int): Défense (ou Défense Spéciale) du défenseur.
+        stab (float): 1.5 si l'attaque est du type de l'attaquant, sinon 1.0.
+        type_multiplier (float): Multiplicateur de types.
+        is_crit (bool): Coup critique.
+        random_factor (float): Facteur aléatoire entre 0.85 et 1.0.
 
-    return multiplier
+    Returns:
+        int: Dégâts infligés (au moins 1).
+    """
+    base = (((2 * level / 5 + 2) * power * atk_stat / def_stat) / 50) + 2
+    crit_multiplier = 1.5 if is_crit else 1.0
+    return max(1, int(base * stab * type_multiplier * crit_multiplier * random_factor))
 
-def calculate_damage(attacker, defender, move):
+def calculate_damage(attacker, defender, move, crit_roll=None, random_factor=None, rng=None):
     """
     Calcule les dégâts infligés par une attaque.
 
     Args:
-        attacker (dict): Le Pokémon attaquant.
-        defender (dict): Le Pokémon défenseur.
+        attacker (BattlePokemon | dict): Le Pokémon attaquant.
+        defender (BattlePokemon | dict): Le Pokémon défenseur.
         move (dict): Les données de l'attaque.
+        crit_roll (float, optional): Tirage dans [0, 1) pour le critique (tiré au hasard si absent).
+        random_factor (float, optional): Facteur dans [0.85, 1.0] (tiré parmi DAMAGE_ROLLS si absent).
+        rng (BattleRNG, optional): Générateur du combat (module random global si absent).
 
     Returns:
         tuple: (dégâts: int, critique: bool, type_multiplier: float)
     """
-    atk_level = attacker.get("level", 5)
     move_power = move.get("power")
     if move_power is None or move_power == 0:
         return 0, False, 1.0
 
-    is_special = move.get("damage_class") == "special"
+    attacker = as_battle_pokemon(attacker)
+    defender = as_battle_pokemon(defender)
+    is_special = is_special_move(move)
 
-    atk_stat = attacker["stats"].get("special-attack" if is_special else "attack", 10)
-    def_stat = defender["stats"].get("special-defense" if is_special else "defense", 10)
+    atk_stat = attacker.special_attack if is_special else attacker.attack
+    def_stat = defender.special_defense if is_special else defender.defense
 
-    base = (((2 * atk_level / 5 + 2) * move_power * atk_stat / def_stat) / 50) + 2
+    # Comparaison par identifiant : l'attaque est typée en français, le Pokémon en anglais
+    chart = get_type_chart()
+    move_type_id = chart.type_id(move.get("type"))
+    is_stab = move_type_id != chart.neutral_id and move_type_id in attacker.type_ids
+    stab = 1.5 if is_stab else 1.0
+    type_multiplier = chart.multiplier(move_type_id, defender.type_ids)
 
-    move_type = move.get("type")
-    stab = 1.5 if move_type in attacker.get("types", []) else 1.0
-    type_multiplier = get_type_multiplier(move_type, defender.get("types", []))
+    if crit_roll is None:
+        crit_roll = get_stream(rng, "crit").random()
+    is_crit = crit_roll < CRIT_CHANCE
+    if random_factor is None:
+        random_factor = roll_random_factor(rng)
 
-    is_crit = random.random() < 0.0625  # 6.25% chance
-    crit_multiplier = 1.5 if is_crit else 1.0
-    random_factor = random.uniform(0.85, 1.0)
+    damage = damage_formula(attacker.level, move_power, atk_stat, def_stat, stab, type_multiplier, is_crit, random_factor)
+    return damage, is_crit, type_multiplier
+
+def build_damage_columns(triples):
+    """
+    Convertit des triplets (attaquant, défenseur, attaque) en colonnes pour calculate_damage_batch.
+
+    Args:
+        triples (iterable[tuple]): Triplets (attaquant, défenseur, attaque) au format de calculate_damage.
+
+    Returns:
+        dict: Colonnes nommées comme les paramètres de calculate_damage_batch.
+    """
+    chart = get_type_chart()
+    neutral_id = chart.neutral_id
+    columns = {
+        "levels": array("H"),
+        "powers": array("H"),
+        "atk_stats": array("l"),
+        "def_stats": array("l"),
+        "move_type_ids": array("B"),
+        "def_type1": array("B"),
+        "def_type2": array("B"),
+        "stab_mask": bytearray(),
+    }
+
+    for attacker, defender, move in triples:
+        attacker = as_battle_pokemon(attacker)
+        defender = as_battle_pokemon(defender)
+        is_special = is_special_move(move)
+        move_type_id = chart.type_id(move.get("type"))
+        defender_type_ids = defender.type_ids + (neutral_id, neutral_id)
+
+        columns["levels"].append(attacker.level)
+        columns["powers"].append(move.get("power") or 0)
+        columns["atk_stats"].append(attacker.special_attack if is_special else attacker.attack)
+        columns["def_stats"].append(defender.special_defense if is_special else defender.defense)
+        columns["move_type_ids"].append(move_type_id)
+        columns["def_type1"].append(defender_type_ids[0])
+        columns["def_type2"].append(defender_type_ids[1])
+        columns["stab_mask"].append(move_type_id != neutral_id and move_type_id in attacker.type_ids)
+    return columns
+
+def calculate_damage_batch(levels, powers, atk_stats, def_stats, move_type_ids, def_type1, def_type2,
+                           stab_mask, crit_rolls=None, random_factors=None, rng=None):
+    """
+    Calcule les dégâts d'un lot de triplets stockés en colonnes (structure de tableaux).
+
+    Les multiplicateurs de types sont lus directement dans la matrice de TypeChart.
+    Avec les mêmes tirages, le résultat est identique à calculate_damage appelé
+    sur chaque triplet ; sans tirages fournis, ils sont faits dans le même ordre
+    (critique puis facteur aléatoire, uniquement pour les attaques de puissance non nulle).
+
+    Args:
+        levels, powers, atk_stats, def_stats (sequence[int]): Une valeur par triplet.
+        move_type_ids (sequence[int]): Identifiant TypeChart du type de chaque attaque.
+        def_type1, def_type2 (sequence[int]): Types du défenseur (neutral_id si absent).
+        stab_mask (sequence[bool]): STAB de chaque triplet.
+        crit_rolls (sequence[float], optional): Tirages du critique dans [0, 1).
+        random_factors (sequence[float], optional): Facteurs aléatoires dans [0.85, 1.0].
+        rng (BattleRNG, optional): Générateur du combat (module random global si absent).
+
+    Returns:
+        tuple: (dégâts: array('l'), critiques: bytearray, multiplicateurs: array('d'))
+    """
+    chart = get_type_chart()
+    matrix = chart.matrix
+    size = chart.size
+    count = len(powers)
+    crit_rng = get_stream(rng, "crit")
+    damage_rng = get_stream(rng, "damage")
+    low_roll, high_roll = DAMAGE_ROLLS[0], DAMAGE_ROLLS[-1]
+
+    damages = array("l", bytes(array("l").itemsize * count))
+    crits = bytearray(count)
+    multipliers = array("d", [1.0]) * count
+
+    for i in range(count):
+        power = powers[i]
+        if not power:
+            continue
+
+        row = move_type_ids[i] * size
+        type_multiplier = matrix[row + def_type1[i]] * matrix[row + def_type2[i]]
+        crit_roll = crit_rolls[i] if crit_rolls is not None else crit_rng.random()
+        random_factor = random_factors[i] if random_factors is not None else damage_rng.randint(low_roll, high_roll) / 100
+        is_crit = crit_roll < CRIT_CHANCE
+
+        damages[i] = damage_formula(
+            levels[i], power, atk_stats[i], def_stats[i],
+            1.5 if stab_mask[i] else 1.0, type_multiplier, is_crit, random_factor
+        )
+        crits[i] = is_crit
+        multipliers[i] = type_multiplier
+
+    return damages, crits, multipliers
+
+class DamageDistribution:
+    """
+    Loi exacte des dégâts d'une attaque (16 tirages × critique ou non).
+
+    Les instances sont partagées par le cache de damage_pmf : ne pas les modifier.
+
+    Attributes:
+        damages (tuple[int]): Valeurs de dégâts possibles, croissantes.
+        probabilities (tuple[float]): Probabilité de chaque valeur.
+        mean (float): Dégâts moyens.
+    """
+
+    __slots__ = ("damages", "probabilities", "mean", "_at_least")
+
+    def __init__(self, masses: dict):
+        self.damages = tuple(sorted(masses))
+        self.probabilities = tuple(masses[damage] for damage in self.damages)
+
+        # _at_least[i] = P(dégâts >= damages[i])
+        at_least = []
+        total = 0.0
+        for probability in reversed(self.probabilities):
+            total += probability
+            at_least.append(total)
+        self._at_least = tuple(reversed(at_least))
+        # Dégâts moyens
+        self.mean = sum(d * p for d, p in zip(self.damages, self.probabilities))
+
+    @property
+    def min(self) -> int:
+        """Dégâts minimum."""
+        return self.damages[0]
+
+    @property
+    def max(self) -> int:
+        """Dégâts maximum."""
+        return self.damages[-1]
+
+    def ko_probability(self, hp: int) -> float:
+        """Probabilité d'infliger au moins hp dégâts (mise K.O. d'un Pokémon à hp PV)."""
+        index = bisect_left(self.damages, hp)
+        return self._at_least[index] if index < len(self.damages) else 0.0
+
+    def capped_mean(self, hp: int) -> float:
+        """Espérance des dégâts utiles contre un Pokémon à hp PV (dégâts plafonnés à hp)."""
+        if hp >= self.damages[-1]:
+            return self.mean
+        if hp <= self.damages[0]:
+            return float(hp)
+        return sum(min(d, hp) * p for d, p in zip(self.damages, self.probabilities))
+
+    def as_dict(self) -> dict:
+        """Retourne la loi sous forme {dégâts: probabilité}."""
+        return dict(zip(self.damages, self.probabilities))
+
+    def __repr__(self):
+        return f"DamageDistribution(min={self.min}, max={self.max}, mean={self.mean:.1f})"
+
+NO_DAMAGE = DamageDistribution({0: 1.0})
+
+@lru_cache(maxsize=DISTRIBUTION_CACHE_SIZE)
+def damage_pmf(level, atk_stat, def_stat, power, type_multiplier, stab):
+    """
+    Loi exacte des dégâts pour une clé compacte (mémoïsée).
+
+    Énumère les 16 tirages de DAMAGE_ROLLS, avec et sans coup critique,
+    via damage_formula : chaque valeur est exactement celle que donnerait
+    calculate_damage avec le même tirage.
+
+    Args:
+        level (int): Niveau de l'attaquant.
+        atk_stat (int): Attaque (ou Attaque Spéciale) de l'attaquant.
+        def_stat (int): Défense (ou Défense Spéciale) du défenseur.
+        power (int): Puissance de l'attaque.
+        type_multiplier (float): Multiplicateur de types.
+        stab (bool): Attaque du type de l'attaquant.
+
+    Returns:
+        DamageDistribution: Loi des dégâts (NO_DAMAGE si power est nul).
+    """
+    if not power:
+        return NO_DAMAGE
+
+    stab_multiplier = 1.5 if stab else 1.0
+    roll_probability = 1.0 / len(DAMAGE_ROLLS)
+    masses = {}
+    for is_crit, crit_probability in ((False, 1.0 - CRIT_CHANCE), (True, CRIT_CHANCE)):
+        probability = crit_probability * roll_probability
+        for roll in DAMAGE_ROLLS:
+            damage = damage_formula(level, power, atk_stat, def_stat, stab_multiplier, type_multiplier, is_crit, roll / 100)
+            masses[damage] = masses.get(damage, 0.0) + probability
+    return DamageDistribution(masses)
+
+def damage_distribution(attacker, defender, move):
+    """
+    Loi exacte des dégâts d'une attaque, sans échantillonnage.
+
+    Args:
+        attacker (BattlePokemon | dict): Le Pokémon attaquant.
+        defender (BattlePokemon | dict): Le Pokémon défenseur.
+        move (dict): Les données de l'attaque.
+
+    Returns:
+        DamageDistribution: Loi des dégâts (voir ko_probability pour la probabilité de K.O.).
+    """
+    move_power = move.get("power")
+    if not move_power:
+        return NO_DAMAGE
+
+    attacker = as_battle_pokemon(attacker)
+    defender = as_battle_pokemon(defender)
+    is_special = is_special_move(move)
+
+    chart = get_type_chart()
+    move_type_id = chart.type_id(move.get("type"))
+    return damage_pmf(
+        attacker.level,
+        attacker.special_attack if is_special else attacker.attack,
+        defender.special_defense if is_special else defender.defense,
+        move_power,
+        chart.multiplier(move_type_id, defender.type_ids),
+        move_type_id != chart.neutral_id and move_type_id in attacker.type_ids,
+    )
+
+def damage_distributions(attacker, defender, moves):
+    """
+    Lois exactes des dégâts de plusieurs attaques d'un même attaquant contre un même défenseur.
+
+    Tout ce qui ne dépend pas de l'attaque est lu une seule fois pour le lot :
+    niveau, paires de statistiques physiques et spéciales, types de l'attaquant
+    et colonne des multiplicateurs contre les types du défenseur
+    (TypeChart.defense_column). Par attaque, il reste la lecture de son type
+    et de sa catégorie ; chaque loi vient du cache de damage_pmf.
+
+    Args:
+        attacker (BattlePokemon | dict): Le Pokémon attaquant.
+        defender (BattlePokemon | dict): Le Pokémon défenseur.
+        moves (iterable[dict]): Attaques à évaluer.
+
+    Returns:
+        list[DamageDistribution]: Une loi par attaque (NO_DAMAGE pour une puissance nulle).
+    """
+    attacker = as_battle_pokemon(attacker)
+    defender = as_battle_pokemon(defender)
+    chart = get_type_chart()
+    type_id = chart.type_id
+    neutral_id = chart.neutral_id
+    column = chart.defense_column(defender.type_ids)
+    level = attacker.level
+    attacker_type_ids = attacker.type_ids
+    physical = (attacker.attack, defender.defense)
+    special = (attacker.special_attack, defender.special_defense)
+
+    distributions = []
+    for move in moves:
+        power = move.get("power")
+        if not power:
+            distributions.append(NO_DAMAGE)
+            continue
 
-    damage = int(base * stab * type_multiplier * crit_multiplier * random_factor)
-    return max(1, damage), is_crit, type_multiplier
+        move_type_id = type_id(move.get("type"))
+        atk_stat, def_stat = special if is_special_move(move) else physical
+        stab = move_type_id != neutral_id and move_type_id in attacker_type_ids
+        distributions.append(damage_pmf(level, atk_stat, def_stat, power, column[move_type_id], stab))
+    return distributions
@@ -0,0 +1,43 @@
+# battle/events.py
+
+"""
+Événements de combat typés.
+
+Les fonctions de combat (move_handler, move_effects, capture_handler,
+simulator) ne construisent aucun texte : elles retournent des événements
+compacts (namedtuples) décrivant ce qui s'est passé. Le texte n'est produit
+que si l'événement doit être affiché, par battle.localization.
+
+Les Pokémon sont désignés par leur nom, ce qui garde les événements valides
+même après copie ou remplacement des BattlePokemon.
+"""
+
+from collections import namedtuple
+
+# === Attaques ===
+MoveUsed = namedtuple("MoveUsed", ("user", "move"))
+MoveFailed = namedtuple("MoveFailed", ("user",))
+MoveMissed = namedtuple("MoveMissed", ("user",))
+Protected = namedtuple("Protected", ("target",))
+OneHitKO = namedtuple("OneHitKO", ("user", "target"))
+Damage = namedtuple("Damage", ("target", "amount", "crit"))
+MultiHit = namedtuple("MultiHit", ("move", "hits"))
+NoEffect = namedtuple("NoEffect", ())
+
+# === Effets secondaires ===
+StatusApplied = namedtuple("StatusApplied", ("target", "status"))
+StatChange = namedtuple("StatChange", ("target", "stat", "delta", "self_inflicted"))
+ProtectRaised = namedtuple("ProtectRaised", ("user",))
+RechargeNeeded = namedtuple("RechargeNeeded", ("user",))
+Flinched = namedtuple("Flinched", ("target",))
+Drained = namedtuple("Drained", ("user", "amount", "move"))
+Recoil = namedtuple("Recoil", ("user", "amount"))
+WeatherChanged = namedtuple("WeatherChanged", ("weather",))
+
+# === Capture et changements ===
+Captured = namedtuple("Captured", ("target",))
+BrokeFree = namedtuple("BrokeFree", ("target", "shakes"))
+SwitchedIn = namedtuple("SwitchedIn", ("pokemon",))
+
+# Instance partagée (événement sans champ)
+NO_EFFECT = NoEffect()
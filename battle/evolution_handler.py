@@ -1,6 +1,7 @@
 # battle/evolution_handler.py
 
-from data.pokemon_loader import get_pokemon_by_id, get_learnable_moves
+from data.evolution_index import get_evolution_index
+from data.pokemon_loader import get_pokemon_by_id, get_pokemon_by_name, get_learnable_moves
 
 def check_evolution(pokemon):
     """
@@ -12,16 +13,10 @@ def check_evolution(pokemon):
     Returns:
         dict | None: Nouvelles données du Pokémon après évolution ou None si aucune.
     """
-    evolution_tree = get_evolution_tree(pokemon)
-    current_level = pokemon.get("level", 1)
-
-    for evo in evolution_tree:
-        evo_level = evo.get("level")
-        if evo_level and current_level >= evo_level:
-            evolved_data = get_pokemon_by_id_name(evo["species"])
-            if evolved_data:
-                return evolved_data
-    return None
+    target_id = get_evolution_index().level_evolution(pokemon["id"], pokemon.get("level", 1))
+    if target_id is None:
+        return None
+    return get_pokemon_by_id(target_id) or None
 
 def get_evolution_tree(pokemon):
     """
@@ -57,8 +52,7 @@ def get_pokemon_by_id_name(name):
     Returns:
         dict | None: Données du Pokémon ou None si introuvable.
     """
-    from data.pokemon_loader import get_all_pokemon
-    return next((poke for poke in get_all_pokemon() if poke["name"].lower() == name.lower()), None)
+    return get_pokemon_by_name(name) or None
 
 def check_and_apply_evolution(pokemon):
     """
@@ -74,10 +68,10 @@ def check_and_apply_evolution(pokemon):
     if evolved_data:
         pokemon["id"] = evolved_data["id"]
         pokemon["name"] = evolved_data["name"]
-        pokemon["base_stats"] = evolved_data["stats"]
-        pokemon["stats"] = evolved_data["stats"].copy()
-        pokemon["types"] = evolved_data.get("types", [])
-        pokemon["sprites"] = evolved_data.get("sprites", {})
+        pokemon["base_stats"] = dict(evolved_data["stats"])
+        pokemon["stats"] = dict(evolved_data["stats"])
+        pokemon["types"] = list(evolved_data.get("types", []))
+        pokemon["sprites"] = dict(evolved_data.get("sprites", {}))
 
         learnset = get_learnable_moves(pokemon["id"], pokemon["level"])
         for new_move in learnset:
@@ -1,7 +1,16 @@
 # battle/item_handler.py
 
+"""
+Utilisation des objets du sac pendant un combat.
+
+Les résultats sont des dicts {success, messages} où messages contient le texte
+à afficher. Pour les Poké Balls, les événements de capture (battle.events)
+sont aussi fournis sous "events", et déjà rendus en texte dans "messages".
+"""
+
 from data.items_loader import get_item_data
 from battle.capture_handler import attempt_capture
+from battle.localization import render_events
 
 # Objets interdits pendant un combat
 NON_BATTLE_ITEMS = [
@@ -30,7 +39,8 @@ def use_item_on_pokemon(item_name, target):
         target (dict): Données du Pokémon cible.
 
     Returns:
-        dict: {success: bool, messages: list[str]} décrivant le résultat.
+        dict: {success: bool, messages: list[str]} décrivant le résultat
+        (plus shakes et events pour une Poké Ball, voir capture_handler.attempt_capture).
     """
     item = get_item_data(item_name)
     if not item:
@@ -47,7 +57,9 @@ def use_item_on_pokemon(item_name, target):
 
     # --- Poké Balls ---
     if item.get("category") == "standard-balls":
-        return attempt_capture(target, item_name, target.get("status"))
+        result = attempt_capture(target, item_name, target.get("status"))
+        result["messages"] = render_events(result["events"])
+        return result
 
     # --- Soins de PV ---
     if "healing" in item:
@@ -0,0 +1,95 @@
+# battle/localization.py
+
+"""
+Rendu texte (français) des événements de combat de battle.events.
+
+Seule la scène de combat appelle ce module, au moment d'afficher les
+événements : les combats simulés et l'exploration de l'IA ne formatent
+jamais de texte.
+"""
+
+from battle import events
+
+# Libellés des stats modifiables
+STAT_LABELS = {
+    "atk": "Attaque",
+    "def": "Défense",
+    "spa": "Attaque Spéciale",
+    "spd": "Défense Spéciale",
+    "spe": "Vitesse",
+    "acc": "Précision",
+    "eva": "Esquive",
+}
+
+# Gabarits à une ligne : type d'événement → texte (champs de l'événement en paramètres)
+TEMPLATES = {
+    events.MoveUsed: "{user} utilise {move} !",
+    events.MoveFailed: "L'attaque de {user} a échoué.",
+    events.MoveMissed: "{user} rate son attaque !",
+    events.Protected: "{target} s'est protégé contre l'attaque !",
+    events.OneHitKO: "{user} a mis KO {target} en un seul coup !",
+    events.Damage: "{target} a subi {amount} dégâts !",
+    events.NoEffect: "Mais cela n'a eu aucun effet...",
+    events.StatusApplied: "{target} est maintenant {status} !",
+    events.ProtectRaised: "{user} se protège contre les attaques !",
+    events.RechargeNeeded: "{user} devra recharger au prochain tour !",
+    events.Flinched: "{target} a eu peur et pourrait ne pas agir !",
+    events.Drained: "{user} récupère {amount} PV grâce à {move} !",
+    events.Recoil: "{user} subit {amount} dégâts de recul !",
+    events.Captured: "{target} est capturé !",
+    events.BrokeFree: "{target} s'est échappé !",
+    events.SwitchedIn: "{pokemon} est envoyé au combat !",
+}
+
+
+def _render_multi_hit(event) -> list:
+    """Un message par coup, puis le total."""
+    lines = [f"Le coup {i + 1} touche !" for i in range(event.hits)]
+    lines.append(f"{event.move} a frappé {event.hits} fois !")
+    return lines
+
+
+def _render_stat_change(event) -> list:
+    """Ex: « Attaque de Bulbizarre baisse ! »."""
+    label = STAT_LABELS.get(event.stat, event.stat.capitalize())
+    who = "de lui-même" if event.self_inflicted else f"de {event.target}"
+    direction = "augmente" if event.delta > 0 else "baisse"
+    return [f"{label} {who} {direction} !"]
+
+
+def _render_weather(event) -> list:
+    """Ex: « Le climat change : Rain ! »."""
+    return [f"Le climat change : {event.weather.capitalize()} !"]
+
+
+# Événements dont le rendu demande plus qu'un gabarit
+RENDERERS = {
+    events.MultiHit: _render_multi_hit,
+    events.StatChange: _render_stat_change,
+    events.WeatherChanged: _render_weather,
+}
+
+
+def render_event(event) -> list:
+    """
+    Convertit un événement en lignes de texte.
+
+    Args:
+        event: Événement de battle.events.
+
+    Returns:
+        list[str]: Lignes à afficher (vide pour un type d'événement inconnu).
+    """
+    template = TEMPLATES.get(type(event))
+    if template is not None:
+        return [template.format(**event._asdict())]
+    renderer = RENDERERS.get(type(event))
+    return renderer(event) if renderer is not None else []
+
+
+def render_events(event_list) -> list:
+    """Convertit une suite d'événements en lignes de texte, dans l'ordre."""
+    lines = []
+    for event in event_list:
+        lines.extend(render_event(event))
+    return lines
@@ -0,0 +1,222 @@
+# battle/matchup.py
+
+"""
+Estimation Monte-Carlo d'un affrontement entre deux équipes.
+
+estimate_matchup() joue des milliers de combats simulés (battle.simulator),
+répartis en lots sur un ProcessPoolExecutor. Chaque lot reçoit une graine
+dérivée de la graine principale : le résultat ne dépend que de la graine et
+du nombre de combats, pas du nombre de workers.
+
+Les workers chargent le bundle compilé (cache/data_bundle.bin) une seule fois
+à leur démarrage ; les tâches ne transportent que la description des équipes
+et une graine, jamais les données JSON.
+"""
+
+import math
+import os
+import random
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from statistics import NormalDist
+
+from battle.battle_pokemon import as_battle_pokemon
+from battle.rng import BattleRNG
+from battle.simulator import BattleState, create_combatant, random_policy, run_battle
+from data.bundle import load_bundle
+from data.moves_loader import get_move_registry
+from data.pokemon_loader import get_pokedex
+from data.types_loader import get_type_chart
+
+# Nombre de combats par tâche envoyée à un worker
+CHUNK_SIZE = 250
+
+MatchupResult = namedtuple(
+    "MatchupResult",
+    ("battles", "wins_a", "wins_b", "draws", "win_rate", "mean_turns", "confidence_interval"),
+)
+
+
+def init_worker():
+    """
+    Charge le bundle et les index utilisés par le simulateur (no-op s'ils sont déjà en mémoire).
+
+    À passer comme initializer d'un ProcessPoolExecutor : chaque worker lit les
+    données compilées une seule fois, avant sa première tâche.
+    """
+    load_bundle()
+    get_pokedex()
+    get_move_registry()
+    get_type_chart()
+
+
+def _build_member(member, level: int):
+    """
+    Convertit un membre d'équipe en BattlePokemon.
+
+    Args:
+        member (int | str | dict | BattlePokemon): ID d'espèce, nom, entrée d'équipe ou Pokémon de combat.
+        level (int): Niveau utilisé pour les IDs et les noms.
+
+    Raises:
+        ValueError: Si l'espèce n'existe pas.
+    """
+    if isinstance(member, str):
+        record = get_pokedex().get_by_name(member)
+        if record is None:
+            raise ValueError(f"Pokémon introuvable : {member}")
+        member = record["id"]
+    if isinstance(member, int):
+        return create_combatant(member, level)
+    return as_battle_pokemon(member)
+
+
+def _play(templates_a: list, templates_b: list, seeds: random.Random, count: int, max_turns: int,
+          policy_a=random_policy, policy_b=random_policy) -> tuple:
+    """
+    Joue `count` combats entre copies des équipes modèles.
+
+    Returns:
+        tuple: (victoires A, victoires B, égalités, tours cumulés).
+    """
+    wins_a = wins_b = draws = turns = 0
+    for _ in range(count):
+        state = BattleState(
+            [p.copy() for p in templates_a],
+            [p.copy() for p in templates_b],
+            rng=BattleRNG(seeds.getrandbits(64)),
+        )
+        run_battle(state, policy_a, policy_b, max_turns=max_turns)
+        if state.winner == "a":
+            wins_a += 1
+        elif state.winner == "b":
+            wins_b += 1
+        else:
+            draws += 1
+        turns += state.turn
+    return wins_a, wins_b, draws, turns
+
+
+def _run_chunk(team_a, team_b, level: int, seed: int, count: int, max_turns: int, policy_a, policy_b) -> tuple:
+    """Tâche d'un worker : construit les équipes une fois puis joue un lot de combats."""
+    templates_a = [_build_member(member, level) for member in team_a]
+    templates_b = [_build_member(member, level) for member in team_b]
+    return _play(templates_a, templates_b, random.Random(seed), count, max_turns, policy_a, policy_b)
+
+
+def win_rate_row(species_id: int, opponents, level: int, battles: int, seed, max_turns: int = 200) -> list:
+    """
+    Taux de victoire d'une espèce contre chaque adversaire, en 1 contre 1 au même niveau.
+
+    Chaque Pokémon connaît les attaques apprises à ce niveau (get_learnable_moves).
+    Une égalité compte pour une demi-victoire.
+
+    Args:
+        species_id (int): ID de l'espèce évaluée.
+        opponents (list[int]): IDs des espèces adverses.
+        level (int): Niveau des deux Pokémon.
+        battles (int): Nombre de combats par affrontement.
+        seed: Graine de la ligne (int ou str, voir random.seed).
+        max_turns (int): Nombre maximal de tours par combat.
+
+    Returns:
+        list[float]: Taux de victoire, dans l'ordre de opponents.
+    """
+    seeds = random.Random(seed)
+    template = [create_combatant(species_id, level)]
+    row = []
+    for opponent_id in opponents:
+        wins, _, draws, _ = _play(template, [create_combatant(opponent_id, level)], seeds, battles, max_turns)
+        row.append((wins + 0.5 * draws) / battles if battles else 0.0)
+    return row
+
+
+def wilson_interval(successes: int, trials: int, confidence: float = 0.95) -> tuple:
+    """
+    Intervalle de confiance de Wilson pour une proportion.
+
+    Args:
+        successes (int): Nombre de succès.
+        trials (int): Nombre d'essais.
+        confidence (float): Niveau de confiance (0.95 = 95 %).
+
+    Returns:
+        tuple[float, float]: Bornes basse et haute (0.0, 1.0 sans essai).
+    """
+    if trials <= 0:
+        return 0.0, 1.0
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+    p = successes / trials
+    denominator = 1 + z * z / trials
+    center = (p + z * z / (2 * trials)) / denominator
+    margin = z * math.sqrt(p * (1 - p) / trials + z * z / (4 * trials * trials)) / denominator
+    return max(0.0, center - margin), min(1.0, center + margin)
+
+
+def estimate_matchup(team_a, team_b, n: int = 10000, workers: int = None, level: int = 20, seed: int = None,
+                     confidence: float = 0.95, max_turns: int = 200,
+                     policy_a=random_policy, policy_b=random_policy) -> MatchupResult:
+    """
+    Estime les chances de victoire de team_a contre team_b par simulation.
+
+    Args:
+        team_a (list): Membres du camp "a" (IDs, noms, entrées d'équipe ou BattlePokemon).
+        team_b (list): Membres du camp "b".
+        n (int): Nombre de combats simulés.
+        workers (int, optional): Nombre de processus (par défaut, un par cœur ; 1 = sans pool).
+        level (int): Niveau des Pokémon donnés par ID ou par nom.
+        seed (int, optional): Graine principale (graine système si absente).
+        confidence (float): Niveau de confiance de l'intervalle.
+        max_turns (int): Nombre maximal de tours par combat (égalité au-delà).
+        policy_a (callable): Politique du camp "a" (fonction de module, pour être envoyée aux workers).
+        policy_b (callable): Politique du camp "b".
+
+    Returns:
+        MatchupResult: Combats joués, victoires, égalités, taux de victoire de "a",
+        nombre moyen de tours et intervalle de confiance (Wilson) du taux de victoire.
+
+    Raises:
+        ValueError: Si n est négatif ou si une espèce est inconnue.
+    """
+    if n < 0:
+        raise ValueError(f"Nombre de combats invalide : {n}")
+
+    team_a, team_b = list(team_a), list(team_b)
+    workers = workers or os.cpu_count() or 1
+
+    # Le bundle est vérifié/reconstruit ici une fois, avant le démarrage des workers
+    init_worker()
+
+    master = random.Random(seed)
+    chunks = []
+    remaining = n
+    while remaining > 0:
+        count = min(CHUNK_SIZE, remaining)
+        chunks.append((master.getrandbits(64), count))
+        remaining -= count
+
+    def chunk_args(chunk):
+        chunk_seed, count = chunk
+        return team_a, team_b, level, chunk_seed, count, max_turns, policy_a, policy_b
+
+    if workers == 1 or len(chunks) <= 1:
+        results = [_run_chunk(*chunk_args(chunk)) for chunk in chunks]
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(chunks)), initializer=init_worker) as pool:
+            futures = [pool.submit(_run_chunk, *chunk_args(chunk)) for chunk in chunks]
+            results = [future.result() for future in futures]
+
+    wins_a = sum(r[0] for r in results)
+    wins_b = sum(r[1] for r in results)
+    draws = sum(r[2] for r in results)
+    turns = sum(r[3] for r in results)
+
+    return MatchupResult(
+        battles=n,
+        wins_a=wins_a,
+        wins_b=wins_b,
+        draws=draws,
+        win_rate=wins_a / n if n else 0.0,
+        mean_turns=turns / n if n else 0.0,
+        confidence_interval=wilson_interval(wins_a, n, confidence),
+    )
@@ -0,0 +1,318 @@
+# battle/mcts.py
+
+"""
+Adversaire Monte-Carlo Tree Search (niveau de difficulté supérieur).
+
+Chaque itération rejoue le combat depuis la position actuelle avec le
+simulateur (mêmes règles que move_handler.use_move) : descente dans l'arbre
+avec UCB1 découplé (chaque camp choisit son attaque sans connaître celle de
+l'autre), ajout d'un nœud, partie aléatoire jusqu'à la fin (ou ROLLOUT_TURNS
+tours), puis remontée du résultat.
+
+L'arbre est « en boucle ouverte » : un nœud correspond à une suite
+d'attaques, pas à un état précis, ce qui absorbe le hasard du combat et
+permet de réutiliser le sous-arbre de l'attaque jouée au tour suivant.
+
+Le nombre de parties jouées dépend du budget de temps (budget_ms) et du
+nombre de processus (workers) : avec plusieurs workers, chaque processus
+construit son propre arbre (parallélisme à la racine) et les visites de la
+racine sont additionnées. Les workers s'arrêtent un peu avant l'échéance de la
+décision ; un résultat qui n'est pas arrivé à l'échéance est ignoré.
+"""
+
+import math
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor, wait
+
+from battle.ai import BattleAI
+from battle.battle_pokemon import as_battle_pokemon
+from battle.matchup import init_worker
+from battle.rng import BattleRNG
+from battle.simulator import ACTION_MOVE, BattleState, move_action
+
+# Constante d'exploration d'UCB1
+EXPLORATION = 1.4
+
+# Nombre maximal de tours d'une partie aléatoire (évaluation aux PV au-delà)
+ROLLOUT_TURNS = 20
+
+# Temps réservé au retour des résultats des workers avant l'échéance d'une décision
+RESULT_MARGIN_MS = 3
+
+
+class _Node:
+    """Nœud de l'arbre : statistiques de chaque attaque des deux camps et enfants par paire d'attaques."""
+
+    __slots__ = ("visits", "stats", "children")
+
+    def __init__(self):
+        self.visits = 0
+        # Camp → {index d'attaque: [visites, somme des valeurs]}
+        self.stats = {"a": {}, "b": {}}
+        self.children = {}
+
+
+def _legal_moves(state: BattleState, side: str) -> list:
+    """Index des attaques jouables par un camp (Lutte si aucune)."""
+    return [action.value for action in state.legal_actions(side) if action.kind == ACTION_MOVE]
+
+
+def _select(node: _Node, side: str, moves: list, rng: random.Random, exploration: float) -> int:
+    """Choisit l'attaque d'un camp par UCB1 (attaques jamais essayées d'abord)."""
+    stats = node.stats[side]
+    untried = [move for move in moves if move not in stats]
+    if untried:
+        return rng.choice(untried)
+
+    log_visits = math.log(max(1, node.visits))
+    best_move, best_score = moves[0], float("-inf")
+    for move in moves:
+        visits, total = stats[move]
+        score = total / visits + exploration * math.sqrt(log_visits / visits)
+        if score > best_score:
+            best_move, best_score = move, score
+    return best_move
+
+
+def _evaluate(state: BattleState) -> float:
+    """Valeur finale pour le camp "a" : 1 victoire, 0 défaite, sinon d'après les PV restants."""
+    if state.winner == "a":
+        return 1.0
+    if state.winner == "b":
+        return 0.0
+    a, b = state.active("a"), state.active("b")
+    return 0.5 + (a.hp / a.max_hp - b.hp / b.max_hp) / 2
+
+
+def _iterate(root: _Node, root_state: BattleState, rng: random.Random, battle_rng: BattleRNG, exploration: float):
+    """Une itération : sélection, expansion, partie aléatoire et remontée."""
+    # Le générateur de combat est partagé par les itérations : ses tirages continuent d'une partie à l'autre
+    state = root_state.clone(rng=battle_rng)
+
+    node = root
+    path = []
+    while not state.is_over:
+        move_a = _select(node, "a", _legal_moves(state, "a"), rng, exploration)
+        move_b = _select(node, "b", _legal_moves(state, "b"), rng, exploration)
+        path.append((node, move_a, move_b))
+        state.step(move_action(move_a), move_action(move_b))
+
+        child = node.children.get((move_a, move_b))
+        if child is None:
+            node.children[(move_a, move_b)] = _Node()
+            break
+        node = child
+
+    # Partie aléatoire
+    limit = state.turn + ROLLOUT_TURNS
+    while not state.is_over and state.turn < limit:
+        moves_a = _legal_moves(state, "a")
+        moves_b = _legal_moves(state, "b")
+        state.step(move_action(rng.choice(moves_a)), move_action(rng.choice(moves_b)))
+
+    value = _evaluate(state)
+    for node, move_a, move_b in path:
+        node.visits += 1
+        for side, move, side_value in (("a", move_a, value), ("b", move_b, 1.0 - value)):
+            stats = node.stats[side].get(move)
+            if stats is None:
+                node.stats[side][move] = [1, side_value]
+            else:
+                stats[0] += 1
+                stats[1] += side_value
+
+
+def search(root: _Node, root_state: BattleState, budget_ms: float = None, iterations: int = None,
+           seed=None, exploration: float = EXPLORATION) -> _Node:
+    """
+    Développe l'arbre jusqu'à épuisement du budget de temps ou du nombre d'itérations.
+
+    Args:
+        root (_Node): Racine (nouvelle ou réutilisée).
+        root_state (BattleState): Position actuelle ; le camp "a" est celui de l'IA.
+        budget_ms (float, optional): Temps de réflexion en millisecondes.
+        iterations (int, optional): Nombre maximal d'itérations.
+        seed: Graine des tirages de la recherche.
+        exploration (float): Constante d'exploration d'UCB1.
+
+    Returns:
+        _Node: La racine développée.
+    """
+    rng = random.Random(seed)
+    battle_rng = BattleRNG(rng.getrandbits(64))
+    deadline = None if budget_ms is None else time.perf_counter() + budget_ms / 1000
+    count = 0
+    while (iterations is None or count < iterations) and (deadline is None or time.perf_counter() < deadline):
+        _iterate(root, root_state, rng, battle_rng, exploration)
+        count += 1
+    return root
+
+
+def _search_worker(root_state: BattleState, deadline, iterations, seed, exploration) -> dict:
+    """
+    Tâche d'un worker : recherche indépendante, retourne les visites de la racine pour le camp "a".
+
+    deadline est une heure absolue (time.time(), commune aux processus) ou None :
+    le temps passé à transmettre la tâche est décompté du budget.
+    """
+    budget_ms = None if deadline is None else max(0.0, (deadline - time.time()) * 1000 - RESULT_MARGIN_MS)
+    root = search(_Node(), root_state, budget_ms, iterations, seed, exploration)
+    return {move: visits for move, (visits, _) in root.stats["a"].items()}
+
+
+class MCTSAI(BattleAI):
+    """
+    Adversaire MCTS à budget de temps, parallélisable à la racine sur plusieurs processus.
+
+    Attributes:
+        budget_ms (float | None): Temps de réflexion par décision.
+        iterations (int | None): Nombre maximal de parties par décision et par processus.
+        workers (int): Nombre de processus (1 = recherche dans le processus courant uniquement).
+        exploration (float): Constante d'exploration d'UCB1.
+        last_visits (dict): Visites de chaque attaque (index dans moves) à la dernière décision.
+    """
+
+    def __init__(self, skill_level=0, budget_ms=100, workers=1, iterations=None, exploration=EXPLORATION, seed=None,
+                 use_book=True):
+        """
+        Args:
+            skill_level (int): Niveau de compétence (utilisé par le repli glouton).
+            budget_ms (float, optional): Temps de réflexion par décision, en millisecondes.
+            workers (int): Nombre de processus ; au-delà de 1, un pool est créé au premier usage.
+            iterations (int, optional): Nombre maximal de parties par décision et par processus.
+            exploration (float): Constante d'exploration d'UCB1.
+            seed: Graine des tirages de la recherche (graine système si absente).
+            use_book (bool): Joue l'ouverture d'un affrontement depuis le livre d'ouverture, sans recherche.
+        """
+        super().__init__(skill_level, use_book=use_book)
+        self.budget_ms = budget_ms
+        self.iterations = iterations
+        self.workers = max(1, workers)
+        self.exploration = exploration
+        self.last_visits = {}
+        self._seeds = random.Random(seed)
+        self._pool = None
+
+        # Sous-arbre conservé pour la décision suivante
+        self._root = None
+        self._matchup = None
+        self._last_move = None
+        self._opponent_pp = None
+        self._observed = None
+
+    def __getstate__(self):
+        # Le pool et l'arbre ne sont pas transmis aux autres processus
+        state = self.__dict__.copy()
+        state.update(_pool=None, _root=None, _matchup=None, _last_move=None, _opponent_pp=None, _observed=None)
+        return state
+
+    def observe_opponent_move(self, index: int):
+        """
+        Indique l'attaque (index dans les attaques de l'adversaire) jouée par l'adversaire ce tour-ci.
+
+        Sans cet appel, elle est déduite des PP de l'adversaire quand c'est possible.
+        """
+        self._observed = index
+
+    def close(self):
+        """Arrête le pool de processus."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def choose_move(self, attacker, defender, moves, rng=None):
+        """
+        Choisit l'attaque la plus visitée après recherche.
+
+        Args:
+            attacker (BattlePokemon | dict): Pokémon de l'IA.
+            defender (BattlePokemon | dict): Pokémon adverse.
+            moves (list): Attaques disponibles de l'IA.
+            rng (BattleRNG, optional): Générateur du combat (utilisé seulement par le repli glouton).
+
+        Returns:
+            dict: L'attaque choisie.
+        """
+        if len(moves) <= 1:
+            return super().choose_move(attacker, defender, moves, rng=rng)
+
+        # Échéance de la décision, en heure absolue (partagée avec les workers)
+        deadline = None if self.budget_ms is None else time.time() + self.budget_ms / 1000
+        attacker = as_battle_pokemon(attacker)
+        defender = as_battle_pokemon(defender)
+        move = self._opening_move(attacker, defender, moves)
+        if move is not None:
+            # Pas d'arbre pour ce tour : la décision suivante repart d'une nouvelle racine
+            self._root = None
+            return move
+        root_state = self._root_state(attacker, defender, moves)
+        root = self._reused_root(attacker, defender)
+
+        futures = []
+        if self.workers > 1:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(max_workers=self.workers - 1, initializer=init_worker)
+            futures = [
+                self._pool.submit(_search_worker, root_state, deadline, self.iterations,
+                                  self._seeds.getrandbits(64), self.exploration)
+                for _ in range(self.workers - 1)
+            ]
+
+        budget_ms = None if deadline is None else max(0.0, (deadline - time.time()) * 1000)
+        search(root, root_state, budget_ms, self.iterations, self._seeds.getrandbits(64), self.exploration)
+
+        visits = {move: stats[0] for move, stats in root.stats["a"].items()}
+        if futures:
+            # Attente bornée par l'échéance : les workers en retard sont ignorés
+            timeout = None if deadline is None else max(0.0, deadline - time.time())
+            done, late = wait(futures, timeout=timeout)
+            for future in late:
+                future.cancel()
+            for future in done:
+                for move, count in future.result().items():
+                    visits[move] = visits.get(move, 0) + count
+        self.last_visits = visits
+
+        if not visits:
+            return super().choose_move(attacker, defender, moves, rng=rng)
+        best = max(visits, key=visits.get)
+
+        self._root = root
+        self._last_move = best
+        self._opponent_pp = list(defender.pp)
+        return moves[best] if best >= 0 else moves[0]
+
+    def _root_state(self, attacker, defender, moves) -> BattleState:
+        """
+        Combat 1 contre 1 à partir de la position actuelle ; l'IA est le camp "a", ses attaques sont moves.
+
+        Les copies ne gardent pas l'entrée d'équipe (entry) : l'état est envoyé
+        tel quel aux workers, et les entrées de la scène contiennent des vues
+        en lecture seule du Pokédex (mappingproxy) qui ne se sérialisent pas.
+        """
+        me = attacker.copy()
+        known_pp = {id(move): pp for move, pp in zip(attacker.moves, attacker.pp)}
+        me.moves = list(moves)
+        me.pp = [known_pp.get(id(move), move.get("pp") or 1) for move in moves]
+        me.entry = None
+        opponent = defender.copy()
+        opponent.entry = None
+        return BattleState([me], [opponent], rng=BattleRNG(0))
+
+    def _reused_root(self, attacker, defender) -> _Node:
+        """Sous-arbre de la paire d'attaques jouée au tour précédent, ou une nouvelle racine."""
+        matchup = (id(attacker.entry) if attacker.entry is not None else attacker.id,
+                   id(defender.entry) if defender.entry is not None else defender.id)
+        opponent_move = self._observed
+        if opponent_move is None and self._opponent_pp is not None and len(self._opponent_pp) == len(defender.pp):
+            used = [i for i, (before, after) in enumerate(zip(self._opponent_pp, defender.pp)) if after < before]
+            if len(used) == 1:
+                opponent_move = used[0]
+        self._observed = None
+
+        root = None
+        if self._root is not None and matchup == self._matchup and opponent_move is not None:
+            root = self._root.children.get((self._last_move, opponent_move))
+        self._matchup = matchup
+        return root if root is not None else _Node()
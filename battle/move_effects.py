@@ -1,93 +1,293 @@
 # battle/move_effects.py
 
-import random
+"""
+Effets secondaires des attaques.
 
-def apply_move_effect(attacker, defender, move, last_damage=0):
+Le champ "effects" de chaque attaque est compilé une seule fois en un tuple
+ordonné de petits gestionnaires (statut, stats, protection, recharge...) :
+appliquer une attaque revient à exécuter sa liste précompilée, sans sonder
+les clés de "effects" à chaque tour.
+
+Les attaques du registre sont compilées toutes ensemble au premier usage
+(puis après chaque rechargement de moves.json). De nouveaux types d'effets
+s'ajoutent avec le décorateur @register_effect.
+
+Les gestionnaires émettent des événements typés (battle.events), jamais de texte.
+"""
+
+from abc import ABC, abstractmethod
+
+from battle import events
+from battle.battle_pokemon import as_battle_pokemon, sync_converted
+from battle.rng import get_stream
+from data.moves_loader import Move, get_move_registry
+
+# Classes de gestionnaires, dans l'ordre d'application
+EFFECT_HANDLERS = []
+
+# Attaques du registre compilées : ID → (Move, gestionnaires)
+_compiled = {}
+_compiled_records = None
+
+
+def register_effect(cls):
+    """
+    Décorateur : enregistre un type d'effet (appliqué après ceux déjà enregistrés).
+
+    La classe doit fournir compile(effects) (classmethod retournant un
+    gestionnaire ou None si l'attaque n'a pas cet effet) et
+    apply(attacker, defender, move, last_damage, effects_rng, emitted).
+    """
+    global _compiled_records
+    EFFECT_HANDLERS.append(cls)
+    _compiled_records = None
+    return cls
+
+
+class EffectHandler(ABC):
+    """Gestionnaire d'effet de base (compile et apply sont à fournir par chaque type d'effet)."""
+
+    __slots__ = ()
+
+    @classmethod
+    @abstractmethod
+    def compile(cls, effects):
+        """Retourne un gestionnaire pour ces effets, ou None si l'effet est absent."""
+
+    @abstractmethod
+    def apply(self, attacker, defender, move, last_damage, effects_rng, emitted):
+        """Applique l'effet et ajoute ses événements à emitted."""
+
+
+@register_effect
+class StatusEffect(EffectHandler):
+    """Statut infligé à la cible (ex: poison), avec une probabilité en %."""
+
+    __slots__ = ("status", "chance")
+
+    def __init__(self, status, chance):
+        self.status = status
+        self.chance = chance
+
+    @classmethod
+    def compile(cls, effects):
+        status = effects.get("status")
+        return cls(status, effects.get("status_chance", 100)) if status else None
+
+    def apply(self, attacker, defender, move, last_damage, effects_rng, emitted):
+        if effects_rng.randint(1, 100) <= self.chance and not defender.status:
+            defender.status = self.status
+            emitted.append(events.StatusApplied(defender.name, self.status))
+
+
+class StatChange:
+    """Une modification de stat précompilée."""
+
+    __slots__ = ("stat", "delta", "chance", "on_user")
+
+    def __init__(self, change):
+        self.stat = change.get("stat")
+        self.delta = change.get("change", 0)
+        self.chance = change.get("chance", 100)
+        self.on_user = change.get("target") == "user"
+
+
+@register_effect
+class StatChangesEffect(EffectHandler):
+    """Modificateurs de stats (boosts) sur le lanceur ou la cible."""
+
+    __slots__ = ("changes",)
+
+    def __init__(self, changes):
+        self.changes = changes
+
+    @classmethod
+    def compile(cls, effects):
+        changes = effects.get("stat_changes")
+        return cls(tuple(StatChange(change) for change in changes)) if changes else None
+
+    def apply(self, attacker, defender, move, last_damage, effects_rng, emitted):
+        for change in self.changes:
+            if effects_rng.randint(1, 100) <= change.chance:
+                target = attacker if change.on_user else defender
+                target.boosts[change.stat] = target.boosts.get(change.stat, 0) + change.delta
+                emitted.append(events.StatChange(target.name, change.stat, change.delta, change.on_user))
+
+
+@register_effect
+class ProtectEffect(EffectHandler):
+    """Protection pour le tour (Abri, Détection, etc.)."""
+
+    __slots__ = ()
+
+    @classmethod
+    def compile(cls, effects):
+        return cls() if effects.get("protect") else None
+
+    def apply(self, attacker, defender, move, last_damage, effects_rng, emitted):
+        attacker.protected = True
+        emitted.append(events.ProtectRaised(attacker.name))
+
+
+@register_effect
+class RechargeEffect(EffectHandler):
+    """Tour de recharge après l'attaque (ex: Ultralaser)."""
+
+    __slots__ = ()
+
+    @classmethod
+    def compile(cls, effects):
+        return cls() if effects.get("recharge") else None
+
+    def apply(self, attacker, defender, move, last_damage, effects_rng, emitted):
+        attacker.recharging = True
+        emitted.append(events.RechargeNeeded(attacker.name))
+
+
+@register_effect
+class FlinchEffect(EffectHandler):
+    """Peur infligée à la cible, avec une probabilité en %."""
+
+    __slots__ = ("chance",)
+
+    def __init__(self, chance):
+        self.chance = chance
+
+    @classmethod
+    def compile(cls, effects):
+        chance = effects.get("flinch_chance")
+        return cls(chance) if chance else None
+
+    def apply(self, attacker, defender, move, last_damage, effects_rng, emitted):
+        if effects_rng.randint(1, 100) <= self.chance:
+            defender.flinched = True
+            emitted.append(events.Flinched(defender.name))
+
+
+@register_effect
+class DrainEffect(EffectHandler):
+    """Récupération d'un pourcentage des dégâts infligés (ex: Vampigraine)."""
+
+    __slots__ = ("percent",)
+
+    def __init__(self, percent):
+        self.percent = percent
+
+    @classmethod
+    def compile(cls, effects):
+        percent = effects.get("drain_percent")
+        return cls(percent) if percent else None
+
+    def apply(self, attacker, defender, move, last_damage, effects_rng, emitted):
+        if last_damage > 0:
+            heal = int(last_damage * self.percent / 100)
+            attacker.hp = min(attacker.hp + heal, attacker.max_hp)
+            emitted.append(events.Drained(attacker.name, heal, move["name"]))
+
+
+@register_effect
+class RecoilEffect(EffectHandler):
+    """Dégâts de recul proportionnels aux dégâts infligés (ex: Bélier)."""
+
+    __slots__ = ("percent",)
+
+    def __init__(self, percent):
+        self.percent = percent
+
+    @classmethod
+    def compile(cls, effects):
+        percent = effects.get("recoil_percent")
+        return cls(percent) if percent else None
+
+    def apply(self, attacker, defender, move, last_damage, effects_rng, emitted):
+        if last_damage > 0:
+            recoil = int(last_damage * self.percent / 100)
+            attacker.hp = max(0, attacker.hp - recoil)
+            emitted.append(events.Recoil(attacker.name, recoil))
+
+
+@register_effect
+class WeatherEffect(EffectHandler):
+    """Changement climatique."""
+
+    __slots__ = ("event",)
+
+    def __init__(self, weather):
+        self.event = events.WeatherChanged(weather)
+
+    @classmethod
+    def compile(cls, effects):
+        weather = effects.get("weather")
+        return cls(weather) if weather else None
+
+    def apply(self, attacker, defender, move, last_damage, effects_rng, emitted):
+        emitted.append(self.event)
+
+
+def compile_effects(effects) -> tuple:
+    """
+    Compile le champ "effects" d'une attaque.
+
+    Args:
+        effects (Mapping): Effets de l'attaque (voir moves.json).
+
+    Returns:
+        tuple[EffectHandler]: Gestionnaires à appliquer, dans l'ordre d'enregistrement.
+    """
+    if not effects:
+        return ()
+    handlers = (handler_cls.compile(effects) for handler_cls in EFFECT_HANDLERS)
+    return tuple(handler for handler in handlers if handler is not None)
+
+
+def compile_registry():
+    """Compile les effets de toutes les attaques du registre (si ce n'est pas déjà fait)."""
+    global _compiled, _compiled_records
+    records = get_move_registry().records
+    if _compiled_records is records:
+        return
+    _compiled = {move.id: (move, compile_effects(move.effects)) for move in records}
+    _compiled_records = records
+
+
+def get_effect_handlers(move) -> tuple:
+    """
+    Retourne les gestionnaires précompilés d'une attaque.
+
+    Les attaques du registre sont lues dans la table compilée ; les autres
+    (dicts ad hoc) sont compilées à la volée.
+    """
+    if isinstance(move, Move):
+        compile_registry()
+        compiled = _compiled.get(move.id)
+        if compiled is not None and compiled[0] is move:
+            return compiled[1]
+        return compile_effects(move.effects)
+    return compile_effects(move.get("effects"))
+
+
+def apply_move_effect(attacker, defender, move, last_damage=0, rng=None):
     """
     Applique les effets secondaires d'une attaque après l'exécution des dégâts.
 
     Args:
-        attacker (dict): Le Pokémon utilisateur.
-        defender (dict): Le Pokémon adverse.
+        attacker (BattlePokemon | dict): Le Pokémon utilisateur (un dict d'équipe est converti puis mis à jour).
+        defender (BattlePokemon | dict): Le Pokémon adverse (idem).
         move (dict): Données de l'attaque.
         last_damage (int): Dégâts infligés (utile pour le drain ou le recul).
+        rng (BattleRNG, optional): Générateur du combat (module random global si absent).
 
     Returns:
-        list[str]: Messages décrivant les effets appliqués.
+        list: Événements (battle.events) décrivant les effets appliqués.
     """
-    messages = []
-    effects = move.get("effects", {})
-
-    print(f"[DEBUG] apply_move_effect for {move.get('name', '???')} - effects: {effects}")
-
-    # === Effets de statut ===
-    status = effects.get("status")
-    status_chance = effects.get("status_chance", 100)
-    if status and random.randint(1, 100) <= status_chance:
-        if not defender.get("status"):
-            defender["status"] = status
-            messages.append(f"{defender['name']} est maintenant {status} !")
-
-    # === Modificateurs de stats ===
-    stat_changes = effects.get("stat_changes", [])
-    for change in stat_changes:
-        if random.randint(1, 100) <= change.get("chance", 100):
-            target = attacker if change.get("target") == "user" else defender
-            stat = change.get("stat")
-            delta = change.get("change", 0)
-
-            if "boosts" not in target:
-                target["boosts"] = {}
-            target["boosts"][stat] = target["boosts"].get(stat, 0) + delta
-
-            stat_label = {
-                "atk": "Attaque",
-                "def": "Défense",
-                "spa": "Attaque Spéciale",
-                "spd": "Défense Spéciale",
-                "spe": "Vitesse",
-                "acc": "Précision",
-                "eva": "Esquive"
-            }.get(stat, stat.capitalize())
-
-            direction = "augmente" if delta > 0 else "baisse"
-            who = "de lui-même" if change["target"] == "user" else f"de {target['name']}"
-            messages.append(f"{stat_label} {who} {direction} !")
-
-    # === Effet de protection (Abri, Détection, etc.) ===
-    if effects.get("protect"):
-        attacker["_protected"] = True
-        messages.append(f"{attacker['name']} se protège contre les attaques !")
-
-    # === Rechargement (ex: Ultralaser) ===
-    if effects.get("recharge"):
-        attacker["_recharging"] = True
-        messages.append(f"{attacker['name']} devra recharger au prochain tour !")
-
-    # === Effet de peur (flinch) ===
-    flinch_chance = effects.get("flinch_chance")
-    if flinch_chance and random.randint(1, 100) <= flinch_chance:
-        defender["_flinched"] = True
-        messages.append(f"{defender['name']} a eu peur et pourrait ne pas agir !")
-
-    # === Drain de PV (ex: Vampigraine) ===
-    drain_percent = effects.get("drain_percent")
-    if drain_percent and last_damage > 0:
-        heal = int(last_damage * drain_percent / 100)
-        max_hp = attacker.get("stats", {}).get("hp", 1)
-        attacker["hp"] = min(attacker.get("hp", 0) + heal, max_hp)
-        messages.append(f"{attacker['name']} récupère {heal} PV grâce à {move['name']} !")
-
-    # === Dégâts de recul (ex: Bélier) ===
-    recoil_percent = effects.get("recoil_percent")
-    if recoil_percent and last_damage > 0:
-        recoil = int(last_damage * recoil_percent / 100)
-        attacker["hp"] = max(0, attacker.get("hp", 0) - recoil)
-        messages.append(f"{attacker['name']} subit {recoil} dégâts de recul !")
-
-    # === Changement climatique ===
-    new_weather = effects.get("weather")
-    if new_weather:
-        messages.append(f"Le climat change : {new_weather.capitalize()} !")
-
-    return messages
+    emitted = []
+    handlers = get_effect_handlers(move)
+    if handlers:
+        attacker_in, defender_in = attacker, defender
+        attacker = as_battle_pokemon(attacker)
+        defender = as_battle_pokemon(defender)
+        effects_rng = get_stream(rng, "effects")
+        for handler in handlers:
+            handler.apply(attacker, defender, move, last_damage, effects_rng, emitted)
+        sync_converted((attacker_in, attacker), (defender_in, defender))
+    return emitted
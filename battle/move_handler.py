@@ -1,6 +1,8 @@
 # battle/move_handler.py
 
-import random
+from battle import events
+from battle.battle_pokemon import as_battle_pokemon, sync_converted
+from battle.engine import calculate_damage
 from battle.move_effects import apply_move_effect
 from battle.move_utils import (
     check_accuracy,
@@ -12,114 +14,119 @@ from battle.move_utils import (
 )
 from data.moves_loader import get_move_by_name
 
-def use_move(attacker, defender, move):
+def use_move(attacker, defender, move, rng=None):
     """
     Traite l'utilisation d'une capacité, infligeant les dégâts et appliquant les effets secondaires.
 
+    Les dicts d'équipe sont acceptés : ils sont convertis en BattlePokemon et
+    leur état (PV, statut, boosts) y est reporté après l'attaque.
+
     Args:
-        attacker (dict): Le Pokémon attaquant.
-        defender (dict): Le Pokémon défenseur.
+        attacker (BattlePokemon | dict): Le Pokémon attaquant.
+        defender (BattlePokemon | dict): Le Pokémon défenseur.
         move (dict): Données de l'attaque (doit contenir au minimum "name").
+        rng (BattleRNG, optional): Générateur du combat (module random global si absent).
 
     Returns:
-        dict: {"damage": int, "messages": list[str], "deferred_damage": Optional[int]}
+        dict: {"damage": int, "events": list, "deferred_damage": Optional[int]}
+        (événements de battle.events, à convertir en texte par battle.localization)
     """
-    messages = []
+    attacker_in, defender_in = attacker, defender
+    attacker = as_battle_pokemon(attacker)
+    defender = as_battle_pokemon(defender)
+    result = _use_move(attacker, defender, move, rng)
+    sync_converted((attacker_in, attacker), (defender_in, defender))
+    return result
+
+def _use_move(attacker, defender, move, rng):
+    """Corps de use_move, sur des BattlePokemon."""
+    emitted = []
     deferred_damage = None
 
     move = get_move_by_name(move["name"], language="fr") or move
-    print(f"[DEBUG] Utilisation de {move.get('name', move.get('name_fr', '???'))}")
 
     if should_fail(attacker, defender, move):
-        messages.append(f"L'attaque de {attacker['name']} a échoué.")
+        emitted.append(events.MoveFailed(attacker.name))
         reset_temp_status(attacker)
         reset_temp_status(defender)
-        return {"damage": 0, "messages": messages, "deferred_damage": None}
+        return {"damage": 0, "events": emitted, "deferred_damage": None}
 
-    if not check_accuracy(attacker, defender, move):
-        messages.append(f"{attacker['name']} rate son attaque !")
+    if not check_accuracy(attacker, defender, move, rng=rng):
+        emitted.append(events.MoveMissed(attacker.name))
         reset_temp_status(attacker)
         reset_temp_status(defender)
-        return {"damage": 0, "messages": messages, "deferred_damage": None}
+        return {"damage": 0, "events": emitted, "deferred_damage": None}
 
     if is_protected(defender):
-        messages.append(f"{defender['name']} s'est protégé contre l'attaque !")
+        emitted.append(events.Protected(defender.name))
         reset_temp_status(attacker)
         reset_temp_status(defender)
-        return {"damage": 0, "messages": messages, "deferred_damage": None}
+        return {"damage": 0, "events": emitted, "deferred_damage": None}
 
     if move.get("effects", {}).get("one_hit_ko"):
-        defender["hp"] = 0
-        messages.append(f"{attacker['name']} a mis KO {defender['name']} en un seul coup !")
+        defender.hp = 0
+        emitted.append(events.OneHitKO(attacker.name, defender.name))
         reset_temp_status(attacker)
         reset_temp_status(defender)
-        return {"damage": 9999, "messages": messages, "deferred_damage": 9999}
+        return {"damage": 9999, "events": emitted, "deferred_damage": 9999}
 
     damage = 0
 
     if move.get("power") or move.get("fixed_damage") or move.get("level_damage"):
-        damage_info = calculate_basic_damage(attacker, defender, move)
-
-        if isinstance(damage_info, tuple):
-            damage, extra_messages = damage_info
-            messages.extend(extra_messages)
-        else:
-            damage = damage_info
+        damage, is_crit, extra_events = calculate_basic_damage(attacker, defender, move, rng=rng)
+        emitted.extend(extra_events)
 
         damage = max(1, damage)
         deferred_damage = damage
-        messages.append(f"{attacker['name']} utilise {move['name_fr']} !")
-        messages.append(f"{defender['name']} a subi {damage} dégâts !")
+        emitted.append(events.MoveUsed(attacker.name, move["name_fr"]))
+        emitted.append(events.Damage(defender.name, damage, is_crit))
 
-        secondary_effects = apply_move_effect(attacker, defender, move, last_damage=damage)
-        if secondary_effects:
-            messages.extend(secondary_effects)
+        emitted.extend(apply_move_effect(attacker, defender, move, last_damage=damage, rng=rng))
 
     else:
-        messages.append(f"{attacker['name']} utilise {move['name_fr']} !")
+        emitted.append(events.MoveUsed(attacker.name, move["name_fr"]))
 
-        secondary_effects = apply_move_effect(attacker, defender, move, last_damage=0)
+        secondary_effects = apply_move_effect(attacker, defender, move, last_damage=0, rng=rng)
 
         if secondary_effects:
-            messages.extend(secondary_effects)
+            emitted.extend(secondary_effects)
         else:
-            messages.append("Mais cela n'a eu aucun effet...")
+            emitted.append(events.NO_EFFECT)
 
     reset_temp_status(attacker)
     reset_temp_status(defender)
 
     return {
         "damage": damage,
-        "messages": messages,
+        "events": emitted,
         "deferred_damage": deferred_damage
     }
 
-def calculate_basic_damage(attacker, defender, move):
+def calculate_basic_damage(attacker, defender, move, rng=None):
     """
-    Calcule les dégâts d'une attaque de base (sans effets secondaires).
+    Calcule les dégâts d'une attaque (sans effets secondaires).
+
+    Les attaques à puissance passent par engine.calculate_damage (types, STAB,
+    critique, attaques spéciales) : c'est la formule dont engine.damage_distribution
+    donne la loi exacte, utilisée par les IA.
 
     Args:
-        attacker (dict): Pokémon attaquant.
-        defender (dict): Pokémon défenseur.
+        attacker (BattlePokemon): Pokémon attaquant.
+        defender (BattlePokemon): Pokémon défenseur.
         move (dict): Attaque utilisée.
+        rng (BattleRNG, optional): Générateur du combat (module random global si absent).
 
     Returns:
-        int | tuple[int, list[str]]: Dégâts infligés, ou (1, messages) pour attaques multi-coups.
+        tuple[int, bool, list]: (dégâts infligés, coup critique, événements supplémentaires) ;
+        1 dégât et un événement MultiHit pour les attaques multi-coups.
     """
     fixed_damage = get_fixed_damage(attacker, defender, move)
     if fixed_damage is not None:
-        return fixed_damage
+        return fixed_damage, False, []
 
     if move.get("multi_hit"):
-        multi_hit_info = process_multi_hit(attacker, defender, move)
-        return 1, multi_hit_info["messages"]
-
-    attack_stat = attacker.get("stats", {}).get("atk", 10)
-    defense_stat = defender.get("stats", {}).get("def", 10)
-    level = attacker.get("level", 5)
-    power = move.get("power", 50)
-
-    base_damage = (((2 * level / 5 + 2) * attack_stat * power) / (defense_stat * 50)) + 2
-    base_damage *= random.uniform(0.85, 1.0)
+        multi_hit_info = process_multi_hit(attacker, defender, move, rng=rng)
+        return 1, False, multi_hit_info["events"]
 
-    return int(base_damage)
+    damage, is_crit, _ = calculate_damage(attacker, defender, move, rng=rng)
+    return damage, is_crit, []
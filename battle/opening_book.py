@@ -0,0 +1,144 @@
+# battle/opening_book.py
+
+"""
+Livre d'ouverture de BattleAI : meilleure attaque précalculée par paire d'espèces et tranche de niveaux.
+
+La table est construite hors jeu par tools/build_opening_book.py (même
+évaluation que BattleAI : dégâts espérés et table des types) et enregistrée
+en .npy (uint8) : book[tranche, attaquant, défenseur] est l'index de
+l'attaque à jouer dans les attaques apprises au niveau (NO_MOVE si aucune
+attaque offensive). Elle n'est lue qu'au premier usage.
+
+Une entrée ne vaut que pour la situation calculée : deux Pokémon aux PV
+pleins, sans statut ni boost, dans la même tranche de niveaux, avec les
+statistiques de leur espèce dans le Pokédex (voir has_species_stats).
+"""
+
+import os
+from array import array
+from functools import lru_cache
+
+from battle.battle_pokemon import STAT_ATTRIBUTES
+from core.data_loader import load_npy, save_npy
+from data.pokemon_loader import get_pokemon_by_id
+
+OPENING_BOOK_PATH = os.path.join("cache", "opening_book.npy")
+
+# Largeur d'une tranche de niveaux (tranche 0 : niveaux 1 à LEVEL_BAND)
+LEVEL_BAND = 10
+LEVEL_BANDS = 10
+
+# Entrée sans attaque conseillée
+NO_MOVE = 255
+
+# Livre chargé pour le processus courant (False si le fichier est absent)
+_book = None
+
+
+def level_band(level: int) -> int:
+    """Tranche d'un niveau (bornée aux tranches de la table)."""
+    return min(LEVEL_BANDS - 1, max(0, (level - 1) // LEVEL_BAND))
+
+
+def band_level(band: int) -> int:
+    """Niveau représentatif (milieu) d'une tranche, utilisé pour construire la table."""
+    return band * LEVEL_BAND + (LEVEL_BAND + 1) // 2
+
+
+@lru_cache(maxsize=None)
+def species_stats(pokemon_id: int):
+    """Statistiques d'une espèce dans le Pokédex (celles de la construction de la table), ou None."""
+    base = get_pokemon_by_id(pokemon_id)
+    if not base:
+        return None
+    stats = base["stats"]
+    return tuple(stats.get(key) for key in STAT_ATTRIBUTES)
+
+
+def has_species_stats(pokemon) -> bool:
+    """
+    Indique si un BattlePokemon a encore les statistiques de son espèce.
+
+    Les Pokémon de l'équipe gagnent des statistiques en montant de niveau :
+    la table, calculée avec celles du Pokédex, ne vaut plus pour eux.
+    """
+    return species_stats(pokemon.id) == tuple(getattr(pokemon, attribute) for attribute in STAT_ATTRIBUTES.values())
+
+
+class OpeningBook:
+    """
+    Table (tranche, attaquant, défenseur) → index d'attaque.
+
+    Attributes:
+        size (int): Nombre de lignes par tranche (plus grand ID d'espèce + 1).
+        bands (int): Nombre de tranches de niveaux.
+        table (array): Valeurs uint8, dans l'ordre C.
+    """
+
+    __slots__ = ("size", "bands", "table")
+
+    def __init__(self, table: array, bands: int, size: int):
+        self.table = table
+        self.bands = bands
+        self.size = size
+
+    @classmethod
+    def empty(cls, bands: int, size: int) -> "OpeningBook":
+        """Table vide (toutes les entrées à NO_MOVE)."""
+        return cls(array("B", [NO_MOVE]) * (bands * size * size), bands, size)
+
+    def offset(self, band: int, attacker_id: int, defender_id: int) -> int:
+        """Position d'une entrée dans table."""
+        return (band * self.size + attacker_id) * self.size + defender_id
+
+    def lookup(self, attacker_id: int, defender_id: int, level: int):
+        """
+        Retourne l'index d'attaque conseillé.
+
+        Args:
+            attacker_id (int): Espèce de l'attaquant.
+            defender_id (int): Espèce du défenseur.
+            level (int): Niveau des deux Pokémon.
+
+        Returns:
+            int | None: Index dans les attaques apprises au niveau, ou None (pas d'entrée).
+        """
+        if not (0 <= attacker_id < self.size and 0 <= defender_id < self.size):
+            return None
+        band = min(level_band(level), self.bands - 1)
+        index = self.table[self.offset(band, attacker_id, defender_id)]
+        return None if index == NO_MOVE else index
+
+    def save(self, path: str = OPENING_BOOK_PATH):
+        """Enregistre la table au format .npy."""
+        save_npy(path, self.table, (self.bands, self.size, self.size))
+
+    @classmethod
+    def load(cls, path: str = OPENING_BOOK_PATH) -> "OpeningBook":
+        """
+        Relit une table écrite par save().
+
+        Raises:
+            FileNotFoundError: Si le fichier n'existe pas.
+            ValueError: Si le fichier n'a pas la forme d'un livre d'ouverture.
+        """
+        table, shape = load_npy(path)
+        if table.typecode != "B" or len(shape) != 3 or shape[1] != shape[2]:
+            raise ValueError(f"Livre d'ouverture invalide : {path} (forme {shape})")
+        return cls(table, shape[0], shape[1])
+
+
+def get_opening_book():
+    """
+    Retourne le livre d'ouverture, lu au premier appel.
+
+    Returns:
+        OpeningBook | None: None si la table n'a pas été construite.
+    """
+    global _book
+    if _book is None:
+        try:
+            _book = OpeningBook.load()
+        except (FileNotFoundError, ValueError):
+            _book = False
+    return _book or None
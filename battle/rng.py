@@ -0,0 +1,75 @@
+# battle/rng.py
+
+"""
+Générateur aléatoire de combat, injectable et reproductible.
+
+BattleRNG regroupe plusieurs sous-flux random.Random indépendants (dégâts,
+précision, critiques, effets...) dérivés d'une seule graine : consommer un
+tirage de plus dans un flux ne décale pas les autres. Son état complet peut
+être sauvegardé puis restauré, ce qui permet de rejouer ou de dupliquer un combat.
+
+Toutes les fonctions du combat acceptent un paramètre `rng` optionnel ; sans
+BattleRNG, elles utilisent le module random global comme auparavant.
+"""
+
+import random
+
+# Sous-flux disponibles
+STREAMS = ("damage", "accuracy", "crit", "effects", "capture", "encounter", "ai", "order")
+
+
+class BattleRNG:
+    """
+    Ensemble de sous-flux aléatoires nommés, dérivés d'une graine.
+
+    Chaque sous-flux est accessible comme attribut (rng.damage, rng.crit...)
+    et expose l'API de random.Random (random, uniform, randint, choice...).
+
+    Attributes:
+        seed: Graine d'origine (None = graine système, non reproductible).
+    """
+
+    __slots__ = ("seed",) + STREAMS
+
+    def __init__(self, seed=None):
+        self.seed = seed
+        master = random.Random(seed)
+        for name in STREAMS:
+            setattr(self, name, random.Random(master.getrandbits(64)))
+
+    def stream(self, name: str) -> random.Random:
+        """Retourne le sous-flux de nom donné."""
+        return getattr(self, name)
+
+    def snapshot(self) -> tuple:
+        """Retourne l'état de tous les sous-flux (à passer à restore)."""
+        return tuple(getattr(self, name).getstate() for name in STREAMS)
+
+    def restore(self, snapshot: tuple):
+        """Remet tous les sous-flux dans l'état d'un snapshot."""
+        for name, state in zip(STREAMS, snapshot):
+            getattr(self, name).setstate(state)
+
+    def fork(self):
+        """Retourne une copie indépendante, dans le même état (utile pour explorer un combat)."""
+        clone = BattleRNG.__new__(BattleRNG)
+        clone.seed = self.seed
+        for name in STREAMS:
+            stream = random.Random()
+            stream.setstate(getattr(self, name).getstate())
+            setattr(clone, name, stream)
+        return clone
+
+
+def get_stream(rng, name: str):
+    """
+    Retourne le sous-flux demandé, ou le module random si aucun BattleRNG n'est fourni.
+
+    Args:
+        rng (BattleRNG | None): Générateur du combat.
+        name (str): Nom du sous-flux (voir STREAMS).
+
+    Returns:
+        random.Random | module: Objet exposant l'API de random.
+    """
+    return random if rng is None else getattr(rng, name)
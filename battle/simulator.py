@@ -0,0 +1,344 @@
+# battle/simulator.py
+
+"""
+Simulateur de combat sans interface (aucune dépendance à pygame).
+
+Résout les tours avec les mêmes règles que BattleScene (move_handler,
+move_effects, engine, capture_handler) mais sans file de messages animés :
+chaque tour retourne un TurnResult structuré, dont les événements typés
+(battle.events) ne sont jamais convertis en texte. Sert aux tests
+d'équilibrage, à la recherche de l'IA et aux combats en masse.
+"""
+
+from collections import namedtuple
+from battle.battle_pokemon import BattlePokemon, as_battle_pokemon
+from battle.capture_handler import attempt_capture
+from battle.events import SwitchedIn
+from battle.move_handler import use_move
+from battle.rng import BattleRNG
+from data.moves_loader import get_move_by_name
+from data.pokemon_loader import get_learnable_moves, get_pokemon_by_id
+
+# Types d'actions
+ACTION_MOVE = "move"
+ACTION_SWITCH = "switch"
+ACTION_CAPTURE = "capture"
+
+# Attaque utilisée par un Pokémon qui n'a plus aucune attaque utilisable
+STRUGGLE = {"name": "Lutte"}
+STRUGGLE_INDEX = -1
+
+# Les changements et captures passent avant les attaques
+ACTION_PRIORITY = {ACTION_SWITCH: 10, ACTION_CAPTURE: 10, ACTION_MOVE: 0}
+
+SIDES = ("a", "b")
+
+Action = namedtuple("Action", ("kind", "value"))
+TurnResult = namedtuple("TurnResult", ("turn", "events", "winner", "captured"))
+
+
+def move_action(index: int) -> Action:
+    """Action « utiliser l'attaque n° index du Pokémon actif » (STRUGGLE_INDEX pour Lutte)."""
+    return Action(ACTION_MOVE, index)
+
+
+def switch_action(index: int) -> Action:
+    """Action « envoyer le membre n° index de l'équipe »."""
+    return Action(ACTION_SWITCH, index)
+
+
+def capture_action(ball_name: str) -> Action:
+    """Action « lancer une Ball sur le Pokémon adverse »."""
+    return Action(ACTION_CAPTURE, ball_name)
+
+
+def create_combatant(pokemon_id: int, level: int = 5, moves=None) -> BattlePokemon:
+    """
+    Crée un Pokémon de combat à partir du Pokédex.
+
+    Args:
+        pokemon_id (int): ID de l'espèce.
+        level (int): Niveau du Pokémon.
+        moves (list[dict], optional): Attaques connues (par défaut, celles apprises au niveau).
+
+    Returns:
+        BattlePokemon: Pokémon de combat, PV au maximum.
+
+    Raises:
+        ValueError: Si l'espèce n'existe pas.
+    """
+    base = get_pokemon_by_id(pokemon_id)
+    if not base:
+        raise ValueError(f"Pokémon introuvable : {pokemon_id}")
+
+    return BattlePokemon(
+        base["id"],
+        base["name"],
+        level,
+        base.get("types", ()),
+        base["stats"],
+        moves=list(moves) if moves is not None else get_learnable_moves(base["id"], level),
+    )
+
+
+class BattleSide:
+    """
+    Un camp du combat : une équipe et l'index du Pokémon actif.
+
+    Attributes:
+        team (list[BattlePokemon]): Pokémon du camp (modifiés en place pendant le combat).
+        active (int): Index du Pokémon au combat.
+    """
+
+    __slots__ = ("team", "active")
+
+    def __init__(self, team: list, active: int = 0):
+        self.team = team
+        self.active = active
+
+    @property
+    def pokemon(self) -> BattlePokemon:
+        """Pokémon actuellement au combat."""
+        return self.team[self.active]
+
+    def alive_indexes(self) -> list:
+        """Index des membres de l'équipe encore en état de combattre."""
+        return [i for i, p in enumerate(self.team) if p.hp > 0]
+
+    def is_defeated(self) -> bool:
+        """Indique si tous les Pokémon du camp sont K.O."""
+        return not any(p.hp > 0 for p in self.team)
+
+
+class BattleState:
+    """
+    État complet d'un combat entre deux camps ("a" et "b").
+
+    Attributes:
+        sides (dict[str, BattleSide]): Camps par identifiant.
+        turn (int): Nombre de tours résolus.
+        winner (str | None): Camp vainqueur, None tant que le combat continue.
+        captured (bool): True si le combat s'est terminé par une capture.
+        rng (BattleRNG): Générateur aléatoire du combat (une graine = un combat reproductible).
+    """
+
+    def __init__(self, team_a: list, team_b: list, rng: BattleRNG = None):
+        """
+        Args:
+            team_a (list[BattlePokemon | dict]): Équipe du camp "a" (les dicts d'équipe sont convertis).
+            team_b (list[BattlePokemon | dict]): Équipe du camp "b".
+            rng (BattleRNG, optional): Générateur du combat (graine système si absent).
+        """
+        team_a = [as_battle_pokemon(p) for p in team_a]
+        team_b = [as_battle_pokemon(p) for p in team_b]
+        self.sides = {"a": BattleSide(team_a), "b": BattleSide(team_b)}
+        self.turn = 0
+        self.winner = None
+        self.captured = False
+        self.rng = rng if rng is not None else BattleRNG()
+
+    @classmethod
+    def from_species(cls, species_a, species_b, level: int = 5, rng: BattleRNG = None):
+        """
+        Crée un combat entre deux équipes d'espèces au même niveau.
+
+        Args:
+            species_a (list[int]): IDs des Pokémon du camp "a".
+            species_b (list[int]): IDs des Pokémon du camp "b".
+            level (int): Niveau de tous les Pokémon.
+            rng (BattleRNG, optional): Générateur du combat (graine système si absent).
+
+        Returns:
+            BattleState: Nouvel état de combat.
+        """
+        return cls(
+            [create_combatant(pid, level) for pid in species_a],
+            [create_combatant(pid, level) for pid in species_b],
+            rng=rng,
+        )
+
+    def clone(self, rng: BattleRNG = None):
+        """
+        Retourne une copie indépendante du combat, générateur aléatoire compris.
+
+        Les Pokémon sont copiés (PV, boosts, PP...) mais leurs listes d'attaques,
+        non modifiées pendant un combat, sont partagées.
+
+        Args:
+            rng (BattleRNG, optional): Générateur de la copie (par défaut, une copie de celui du combat).
+        """
+        clone = BattleState.__new__(BattleState)
+        clone.sides = {
+            side: BattleSide([p.copy() for p in battle_side.team], battle_side.active)
+            for side, battle_side in self.sides.items()
+        }
+        clone.turn = self.turn
+        clone.winner = self.winner
+        clone.captured = self.captured
+        clone.rng = self.rng.fork() if rng is None else rng
+        return clone
+
+    @property
+    def is_over(self) -> bool:
+        """Indique si le combat est terminé."""
+        return self.winner is not None
+
+    def active(self, side: str) -> BattlePokemon:
+        """Pokémon actif d'un camp."""
+        return self.sides[side].pokemon
+
+    def legal_actions(self, side: str) -> list:
+        """
+        Actions possibles pour un camp (attaques ayant encore des PP, puis changements).
+
+        Sans aucune attaque utilisable, la seule attaque possible est Lutte.
+        Les captures ne sont pas listées : elles dépendent de l'inventaire du joueur.
+        """
+        battle_side = self.sides[side]
+        actions = [move_action(i) for i, pp in enumerate(battle_side.pokemon.pp) if pp > 0]
+        if not actions:
+            actions.append(move_action(STRUGGLE_INDEX))
+        actions.extend(switch_action(i) for i in battle_side.alive_indexes() if i != battle_side.active)
+        return actions
+
+    def step(self, action_a: Action, action_b: Action) -> TurnResult:
+        """
+        Résout un tour complet.
+
+        Les changements et captures passent en premier, puis les attaques par
+        priorité décroissante et vitesse décroissante (égalité tirée au sort).
+        Un Pokémon K.O. avant d'agir perd son action ; en fin de tour, chaque
+        camp remplace son Pokémon K.O. par le premier membre encore debout.
+
+        Args:
+            action_a (Action): Action du camp "a".
+            action_b (Action): Action du camp "b".
+
+        Returns:
+            TurnResult: (turn, events, winner, captured), où events est la liste
+            des actions résolues sous forme de dicts (clé "events" : événements typés).
+        """
+        if self.is_over:
+            return TurnResult(self.turn, [], self.winner, self.captured)
+
+        self.turn += 1
+        events = []
+        actions = {"a": action_a, "b": action_b}
+
+        for side in self._turn_order(actions):
+            if self.is_over:
+                break
+            if self.active(side).hp <= 0:
+                continue
+            events.append(self._resolve(side, actions[side]))
+
+        if not self.is_over:
+            for side in SIDES:
+                self._replace_fainted(side, events)
+
+        return TurnResult(self.turn, events, self.winner, self.captured)
+
+    def _turn_order(self, actions: dict) -> list:
+        """Retourne les camps dans l'ordre où ils agissent ce tour-ci."""
+        def sort_key(side):
+            action = actions[side]
+            pokemon = self.active(side)
+            priority = ACTION_PRIORITY.get(action.kind, 0)
+            if action.kind == ACTION_MOVE:
+                move = get_move_by_name(self._move(side, action.value)["name"], language="fr")
+                priority += move.get("priority", 0) if move else 0
+            return priority, pokemon.speed, self.rng.order.random()
+
+        return sorted(SIDES, key=sort_key, reverse=True)
+
+    def _move(self, side: str, index: int) -> dict:
+        """Attaque n° index du Pokémon actif (Lutte si elle n'existe pas ou n'a plus de PP)."""
+        pokemon = self.active(side)
+        if 0 <= index < len(pokemon.moves) and pokemon.pp[index] > 0:
+            return pokemon.moves[index]
+        return STRUGGLE
+
+    def _resolve(self, side: str, action: Action) -> dict:
+        """Applique l'action d'un camp et retourne l'événement correspondant."""
+        opponent = "b" if side == "a" else "a"
+        attacker = self.active(side)
+        defender = self.active(opponent)
+        event = {"side": side, "action": action.kind, "pokemon": attacker.name, "events": []}
+
+        if action.kind == ACTION_SWITCH:
+            battle_side = self.sides[side]
+            if action.value in battle_side.alive_indexes():
+                battle_side.active = action.value
+                event["target"] = battle_side.pokemon.name
+                event["events"].append(SwitchedIn(battle_side.pokemon.name))
+
+        elif action.kind == ACTION_CAPTURE:
+            result = attempt_capture(defender, action.value, status=defender.status, rng=self.rng)
+            event.update(ball=action.value, success=result["success"], shakes=result["shakes"])
+            event["events"].extend(result["events"])
+            if result["success"]:
+                self.winner = side
+                self.captured = True
+
+        else:
+            move = self._move(side, action.value)
+            if move is not STRUGGLE:
+                attacker.use_pp(action.value)
+            result = use_move(attacker, defender, move, rng=self.rng)
+            if result["deferred_damage"]:
+                defender.hp = max(0, defender.hp - result["deferred_damage"])
+            event.update(move=move["name"], damage=result["damage"])
+            event["events"].extend(result["events"])
+            self._check_winner()
+
+        return event
+
+    def _replace_fainted(self, side: str, events: list):
+        """Envoie le premier Pokémon encore debout à la place d'un Pokémon K.O."""
+        battle_side = self.sides[side]
+        if battle_side.pokemon.hp > 0:
+            return
+        alive = battle_side.alive_indexes()
+        if alive:
+            battle_side.active = alive[0]
+            events.append({
+                "side": side,
+                "action": ACTION_SWITCH,
+                "pokemon": battle_side.pokemon.name,
+                "target": battle_side.pokemon.name,
+                "events": [SwitchedIn(battle_side.pokemon.name)],
+            })
+
+    def _check_winner(self):
+        """Termine le combat si un camp n'a plus aucun Pokémon debout (le recul peut mettre les deux K.O.)."""
+        defeated = [side for side in SIDES if self.sides[side].is_defeated()]
+        if len(defeated) == 1:
+            self.winner = "b" if defeated[0] == "a" else "a"
+        elif len(defeated) == 2:
+            self.winner = "draw"
+
+
+def random_policy(state: BattleState, side: str) -> Action:
+    """Politique de référence : une attaque au hasard parmi celles qui ont encore des PP."""
+    moves = [action for action in state.legal_actions(side) if action.kind == ACTION_MOVE]
+    return moves[state.rng.ai.randrange(len(moves))]
+
+
+def run_battle(state: BattleState, policy_a=random_policy, policy_b=random_policy, max_turns: int = 200) -> BattleState:
+    """
+    Joue un combat jusqu'à la fin (ou jusqu'à max_turns tours).
+
+    Args:
+        state (BattleState): Combat à jouer (modifié en place).
+        policy_a (callable): (state, side) -> Action pour le camp "a".
+        policy_b (callable): (state, side) -> Action pour le camp "b".
+        max_turns (int): Nombre maximal de tours (égalité au-delà).
+
+    Returns:
+        BattleState: L'état final ; state.winner vaut "a", "b" ou "draw".
+    """
+    while not state.is_over and state.turn < max_turns:
+        state.step(policy_a(state, "a"), policy_b(state, "b"))
+    if not state.is_over:
+        state.winner = "draw"
+    return state
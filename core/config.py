@@ -13,4 +13,18 @@ SCREEN_HEIGHT = 384
 # Nombre d'images par seconde
 FPS = 60
 
+# IA adverse en combat : "greedy" (meilleure valeur espérée, livre d'ouverture et cache de
+# décisions : presque aucun calcul, pour les petites machines), "search" (expectiminimax)
+# ou "mcts" (difficulté supérieure)
+ENEMY_AI = "search"
+
+# Temps de réflexion maximal de l'IA adverse par attaque (ms), pour ne pas figer l'affichage
+ENEMY_AI_BUDGET_MS = 30
+
+# Processus utilisés par l'IA "mcts" (1 = pas de pool ; plus de parties jouées sur une machine multicœur)
+ENEMY_AI_WORKERS = 1
+
+# Nombre maximal de décisions gardées par le cache de l'IA "greedy" (LRU, partagé par les combats de la run)
+AI_DECISION_CACHE_SIZE = 4096
+
 # D'autres constantes pourront être ajoutées ici plus tard
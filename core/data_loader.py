@@ -4,8 +4,18 @@
 Fonctions utilitaires pour la gestion des fichiers JSON et des chemins.
 """
 
+import ast
 import json
 import os
+import sys
+from array import array
+from types import MappingProxyType
+
+# Préfixe des fichiers .npy (format NumPy 1.0)
+NPY_MAGIC = b"\x93NUMPY\x01\x00"
+
+# Code de array.array → descripteur NumPy (petit-boutiste)
+NPY_DTYPES = {"f": "<f4", "d": "<f8", "h": "<i2", "i": "<i4", "B": "|u1"}
 
 def load_json(path: str) -> dict:
     """
@@ -57,3 +67,96 @@ def file_exists(path: str) -> bool:
         bool: True si le fichier existe, False sinon.
     """
     return os.path.exists(path)
+
+def freeze_json(value):
+    """
+    Convertit récursivement des données JSON en vues immuables.
+
+    Les dicts deviennent des MappingProxyType et les listes des tuples,
+    ce qui permet de partager les données chargées sans risque de modification.
+
+    Args:
+        value: Données JSON décodées.
+
+    Returns:
+        Données équivalentes en lecture seule.
+    """
+    if isinstance(value, dict):
+        return MappingProxyType({key: freeze_json(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(freeze_json(item) for item in value)
+    return value
+
+def save_npy(path: str, values: array, shape: tuple):
+    """
+    Enregistre un array.array au format NumPy .npy (lisible par numpy.load), sans dépendre de NumPy.
+
+    L'écriture passe par un fichier temporaire : un fichier interrompu n'écrase
+    jamais la version précédente.
+
+    Args:
+        path (str): Chemin du fichier .npy.
+        values (array): Valeurs, dans l'ordre C (ligne par ligne).
+        shape (tuple[int]): Dimensions du tableau.
+
+    Raises:
+        ValueError: Si le type de values n'est pas géré ou ne correspond pas à shape.
+    """
+    if values.typecode not in NPY_DTYPES:
+        raise ValueError(f"Type non géré pour .npy : {values.typecode}")
+    size = 1
+    for dimension in shape:
+        size *= dimension
+    if size != len(values):
+        raise ValueError(f"{len(values)} valeurs pour la forme {shape}")
+
+    header = "{'descr': '%s', 'fortran_order': False, 'shape': %r, }" % (NPY_DTYPES[values.typecode], tuple(shape))
+    # En-tête complété pour aligner les données sur 64 octets
+    padding = -(len(NPY_MAGIC) + 2 + len(header) + 1) % 64
+    header = (header + " " * padding + "\n").encode("latin1")
+
+    if sys.byteorder == "big":
+        values = array(values.typecode, values)
+        values.byteswap()
+
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    temp_path = path + ".tmp"
+    with open(temp_path, "wb") as f:
+        f.write(NPY_MAGIC)
+        f.write(len(header).to_bytes(2, "little"))
+        f.write(header)
+        values.tofile(f)
+    os.replace(temp_path, path)
+
+def load_npy(path: str) -> tuple:
+    """
+    Relit un fichier .npy écrit par save_npy.
+
+    Args:
+        path (str): Chemin du fichier .npy.
+
+    Returns:
+        tuple[array, tuple[int]]: Valeurs (array.array) et dimensions.
+
+    Raises:
+        FileNotFoundError: Si le fichier n'existe pas.
+        ValueError: Si le fichier n'est pas un .npy 1.0 d'un type géré.
+    """
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"NPY file not found: {path}")
+    with open(path, "rb") as f:
+        if f.read(len(NPY_MAGIC)) != NPY_MAGIC:
+            raise ValueError(f"Fichier .npy invalide : {path}")
+        header_length = int.from_bytes(f.read(2), "little")
+        header = ast.literal_eval(f.read(header_length).decode("latin1"))
+        typecodes = {descr: code for code, descr in NPY_DTYPES.items()}
+        if header["fortran_order"] or header["descr"] not in typecodes:
+            raise ValueError(f"Format .npy non géré : {header}")
+        values = array(typecodes[header["descr"]])
+        values.frombytes(f.read())
+
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values, tuple(header["shape"])
@@ -15,9 +15,17 @@ class RunManager:
         self.starters = []     # Liste des starters possibles
         self.active = False    # Indique si une run est en cours
 
-        # === Données de référence ===
-        self.pokemon_data = get_all_pokemon()
-        self.item_data = get_all_items()
+    # === Données de référence (chargées au premier accès, pas à l'import) ===
+
+    @property
+    def pokemon_data(self):
+        """Tous les Pokémon du Pokédex (lecture seule)."""
+        return get_all_pokemon()
+
+    @property
+    def item_data(self):
+        """Tous les objets par nom."""
+        return get_all_items()
 
     # ======================================================
     # === Pokémon Management ===
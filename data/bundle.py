@@ -0,0 +1,403 @@
+# data/bundle.py
+
+"""
+Bundle binaire compilé des fichiers data/*.json.
+
+Les JSON sources sont décodés une seule fois puis sérialisés avec `marshal`
+dans cache/data_bundle.bin. Au lancement suivant, le bundle est relu directement
+(beaucoup plus rapide que json.load). Chaque source est vérifiée par mtime/taille,
+puis par empreinte SHA-1 en cas de doute : un bundle périmé est reconstruit
+automatiquement.
+
+Les champs volumineux et rarement lus de pokemon.json (attaques apprises, arbre
+d'évolution, sprites) sont sortis des tables : ils sont écrits dans un fichier
+de shards (cache/pokemon_shards.<empreinte>.bin) avec un index d'offsets, et ne
+sont décodés qu'au premier accès, espèce par espèce (voir ShardedRecord).
+Le nom du fichier de shards dépend de son contenu : une reconstruction
+n'écrase jamais les octets lus par des enregistrements plus anciens.
+"""
+
+import hashlib
+import json
+import marshal
+import os
+import sys
+from collections.abc import Mapping
+from core.data_loader import freeze_json
+
+CACHE_DIR = "cache"
+BUNDLE_PATH = os.path.join(CACHE_DIR, "data_bundle.bin")
+
+# Incrémenter à chaque changement du format du bundle
+BUNDLE_VERSION = 2
+
+SOURCE_PATHS = {
+    "pokemon": os.path.join("data", "pokemon.json"),
+    "moves": os.path.join("data", "moves.json"),
+    "types": os.path.join("data", "types.json"),
+    "items": os.path.join("data", "items.json"),
+}
+
+# Champs décodés à la demande, par table
+LAZY_FIELDS = {
+    "pokemon": ("moves", "evolution", "sprites"),
+}
+
+# Versions antérieures des fichiers de shards conservées à chaque construction
+# (pour les enregistrements créés avant un rechargement, dans ce processus ou un autre)
+KEPT_SHARD_VERSIONS = 1
+
+# Bundle chargé en mémoire pour le processus courant
+_bundle = None
+
+
+def _bundle_header() -> tuple:
+    """Identifie le format du bundle (marshal dépend de la version de Python)."""
+    return (BUNDLE_VERSION, marshal.version, sys.version_info[:2])
+
+
+def _file_stat(path: str) -> tuple:
+    """Retourne (mtime_ns, taille) d'un fichier."""
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _tmp_path(path: str) -> str:
+    """Fichier temporaire propre au processus (deux constructions simultanées ne se marchent pas dessus)."""
+    return f"{path}.{os.getpid()}.tmp"
+
+
+def _file_hash(path: str) -> str:
+    """Retourne l'empreinte SHA-1 du contenu d'un fichier."""
+    with open(path, "rb") as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+
+def build_bundle(path: str = BUNDLE_PATH) -> dict:
+    """
+    Décode tous les JSON sources et écrit le bundle compilé.
+
+    Args:
+        path (str): Chemin de destination du bundle.
+
+    Returns:
+        dict: Bundle construit ({"header", "sources", "tables", "shards"}).
+    """
+    sources = {}
+    tables = {}
+    shards = {}
+    for name, source_path in SOURCE_PATHS.items():
+        with open(source_path, encoding="utf-8") as f:
+            tables[name] = json.load(f)
+        mtime_ns, size = _file_stat(source_path)
+        sources[name] = {
+            "path": source_path,
+            "mtime_ns": mtime_ns,
+            "size": size,
+            "sha1": _file_hash(source_path),
+        }
+
+    # Table dérivée : une chaîne d'évolution par famille (l'arbre complet de
+    # chaque espèce reste disponible à la demande dans les shards)
+    tables["evolution_chains"] = _evolution_chains(tables["pokemon"])
+
+    for name, fields in LAZY_FIELDS.items():
+        shards[name] = _write_shards(tables[name], fields, os.path.dirname(path), name)
+
+    bundle = {"header": _bundle_header(), "sources": sources, "tables": tables, "shards": shards}
+    _write_bundle(bundle, path)
+    return bundle
+
+
+def _evolution_chains(pokemon: list) -> list:
+    """Retourne les chaînes d'évolution distinctes (une par espèce racine), dans l'ordre du fichier."""
+    chains = []
+    roots = set()
+    for entry in pokemon:
+        chain = entry.get("evolution") or {}
+        root = chain.get("species")
+        if root and root not in roots:
+            roots.add(root)
+            chains.append(chain)
+    return chains
+
+
+def _shard_versions(directory: str, name: str) -> list:
+    """Fichiers de shards d'une table présents dans directory, du plus récent au plus ancien."""
+    prefix = f"{name}_shards."
+    try:
+        paths = [os.path.join(directory, file) for file in os.listdir(directory)
+                 if file.startswith(prefix) and file.endswith(".bin")]
+    except OSError:
+        return []
+    return sorted(paths, key=lambda shard_path: os.stat(shard_path).st_mtime_ns, reverse=True)
+
+
+def _prune_shards(directory: str, name: str, current: str):
+    """Supprime les anciens fichiers de shards d'une table, sauf les KEPT_SHARD_VERSIONS plus récents."""
+    older = [shard_path for shard_path in _shard_versions(directory, name) if shard_path != current]
+    for shard_path in older[KEPT_SHARD_VERSIONS:]:
+        try:
+            os.remove(shard_path)
+        except OSError:
+            pass
+
+
+def _write_shards(entries: list, fields: tuple, directory: str, name: str) -> dict:
+    """
+    Retire les champs paresseux des entrées et les écrit dans un fichier de shards.
+
+    Chaque entrée est sérialisée séparément avec marshal ; l'index d'offsets
+    permet d'en relire une seule sans décoder les autres. Le fichier est nommé
+    d'après l'empreinte de son contenu ({name}_shards.<sha1>.bin).
+
+    Args:
+        entries (list[dict]): Entrées de la table (modifiées en place).
+        fields (tuple[str]): Champs à déplacer dans les shards.
+        directory (str): Dossier de destination.
+        name (str): Nom de la table.
+
+    Returns:
+        dict: Métadonnées des shards ({"path", "fields", "offsets", "mtime_ns", "size"}).
+    """
+    blob = bytearray()
+    offsets = []
+    for entry in entries:
+        chunk = marshal.dumps({field: entry.pop(field) for field in fields if field in entry})
+        offsets.append((len(blob), len(chunk)))
+        blob += chunk
+
+    path = os.path.join(directory, f"{name}_shards.{hashlib.sha1(blob).hexdigest()[:16]}.bin")
+    meta = {"path": path, "fields": fields, "offsets": tuple(offsets)}
+    try:
+        os.makedirs(directory, exist_ok=True)
+        # Même empreinte : le fichier existant a déjà ce contenu
+        if not os.path.exists(path) or os.path.getsize(path) != len(blob):
+            tmp_path = _tmp_path(path)
+            with open(tmp_path, "wb") as f:
+                f.write(blob)
+            os.replace(tmp_path, path)
+        meta["mtime_ns"], meta["size"] = _file_stat(path)
+        _prune_shards(directory, name, path)
+    except OSError as e:
+        # Dossier en lecture seule : les shards restent en mémoire
+        print(f"[⚠️] Impossible d'écrire les shards {path} : {e}")
+        meta["data"] = bytes(blob)
+    return meta
+
+
+def _shards_present(bundle: dict) -> bool:
+    """Vérifie que les fichiers de shards référencés par le bundle sont ceux écrits avec lui."""
+    shards = bundle.get("shards", {})
+    if set(shards) != set(LAZY_FIELDS):
+        return False
+    for meta in shards.values():
+        if "data" in meta:
+            continue
+        try:
+            if _file_stat(meta["path"]) != (meta["mtime_ns"], meta["size"]):
+                return False
+        except OSError:
+            return False
+    return True
+
+
+def _write_bundle(bundle: dict, path: str):
+    """Écrit le bundle de façon atomique (un cache illisible n'est jamais laissé sur disque)."""
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = _tmp_path(path)
+        with open(tmp_path, "wb") as f:
+            f.write(marshal.dumps(bundle))
+        os.replace(tmp_path, path)
+    except OSError as e:
+        # Dossier en lecture seule : on garde simplement le bundle en mémoire
+        print(f"[⚠️] Impossible d'écrire le bundle {path} : {e}")
+
+
+def _read_bundle(path: str):
+    """Lit un bundle existant, ou None s'il est absent, corrompu ou d'un autre format."""
+    try:
+        # marshal.loads sur le contenu complet : marshal.load(f) lit par petits blocs
+        with open(path, "rb") as f:
+            bundle = marshal.loads(f.read())
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    if not isinstance(bundle, dict) or bundle.get("header") != _bundle_header():
+        return None
+    return bundle
+
+
+def is_bundle_fresh(bundle: dict, path: str = BUNDLE_PATH) -> bool:
+    """
+    Vérifie que le bundle correspond encore aux JSON sources.
+
+    Un mtime/taille identique suffit. Sinon, on compare l'empreinte SHA-1 :
+    un fichier simplement « touché » ne déclenche pas de recompilation
+    (les métadonnées du bundle sont mises à jour en place).
+
+    Args:
+        bundle (dict): Bundle à vérifier.
+        path (str): Fichier du bundle (réécrit si seules ses métadonnées changent).
+
+    Returns:
+        bool: True si toutes les sources sont à jour.
+    """
+    sources = bundle.get("sources", {})
+    if set(sources) != set(SOURCE_PATHS):
+        return False
+
+    touched = False
+    for name, source_path in SOURCE_PATHS.items():
+        meta = sources[name]
+        try:
+            mtime_ns, size = _file_stat(source_path)
+        except OSError:
+            return False
+        if meta["path"] == source_path and (meta["mtime_ns"], meta["size"]) == (mtime_ns, size):
+            continue
+        if meta["size"] != size or meta["sha1"] != _file_hash(source_path):
+            return False
+        meta.update(path=source_path, mtime_ns=mtime_ns)
+        touched = True
+
+    if touched:
+        _write_bundle(bundle, path)
+    return True
+
+
+def load_bundle(refresh: bool = False) -> dict:
+    """
+    Retourne le bundle du processus, en le (re)construisant si nécessaire.
+
+    Args:
+        refresh (bool): Revérifie les sources même si un bundle est déjà en mémoire.
+
+    Returns:
+        dict: Bundle à jour.
+    """
+    global _bundle
+    if _bundle is not None and not refresh:
+        return _bundle
+
+    bundle = _bundle if _bundle is not None else _read_bundle(BUNDLE_PATH)
+    if bundle is None or not _shards_present(bundle) or not is_bundle_fresh(bundle):
+        bundle = build_bundle()
+
+    _bundle = bundle
+    return _bundle
+
+
+def load_table(name: str, refresh: bool = False):
+    """
+    Retourne le contenu décodé d'un fichier source ("pokemon", "moves", "types", "items"),
+    ou une table dérivée ("evolution_chains").
+
+    Les champs de LAZY_FIELDS sont absents des entrées retournées : voir get_shard_reader().
+
+    Args:
+        name (str): Nom de la table.
+        refresh (bool): Revérifie la fraîcheur du bundle avant lecture.
+
+    Returns:
+        list | dict: Données JSON décodées (partagées, ne pas modifier).
+    """
+    return load_bundle(refresh=refresh)["tables"][name]
+
+
+def invalidate():
+    """Oublie le bundle en mémoire : le prochain accès revérifiera les sources."""
+    global _bundle
+    _bundle = None
+
+
+class ShardReader:
+    """
+    Lecteur des champs paresseux d'une table.
+
+    Le lecteur est lié aux métadonnées d'un bundle précis : les enregistrements
+    créés avant un rechargement continuent de lire leurs propres offsets, dans
+    leur propre fichier de shards (nommé d'après son contenu, donc jamais
+    réécrit). Les constructions suivantes gardent KEPT_SHARD_VERSIONS anciens
+    fichiers ; au-delà, un enregistrement non encore chargé ne peut plus l'être.
+
+    Attributes:
+        fields (tuple[str]): Champs stockés dans les shards.
+    """
+
+    __slots__ = ("fields", "_path", "_offsets", "_data")
+
+    def __init__(self, meta: dict):
+        self.fields = tuple(meta["fields"])
+        self._path = meta["path"]
+        self._offsets = meta["offsets"]
+        self._data = meta.get("data")
+
+    def read(self, index: int) -> dict:
+        """Décode les champs paresseux de l'entrée d'index donné (ordre du fichier source)."""
+        offset, length = self._offsets[index]
+        if self._data is not None:
+            chunk = self._data[offset:offset + length]
+        else:
+            with open(self._path, "rb") as f:
+                f.seek(offset)
+                chunk = f.read(length)
+        return marshal.loads(chunk)
+
+
+def get_shard_reader(name: str, refresh: bool = False) -> ShardReader:
+    """Retourne le lecteur des champs paresseux d'une table ("pokemon")."""
+    return ShardReader(load_bundle(refresh=refresh)["shards"][name])
+
+
+class ShardedRecord(Mapping):
+    """
+    Enregistrement en lecture seule dont une partie des champs est chargée à la demande.
+
+    Les champs principaux sont gelés dès la construction ; les champs des shards
+    sont décodés (puis gelés et mémorisés) au premier accès à l'un d'eux.
+    L'itération, dict(record) ou {**record} chargent donc l'enregistrement complet.
+    """
+
+    __slots__ = ("_core", "_reader", "_index", "_lazy")
+
+    def __init__(self, core: dict, reader: ShardReader, index: int):
+        self._core = freeze_json(core)
+        self._reader = reader
+        self._index = index
+        self._lazy = None
+
+    def _load(self):
+        """Décode les champs paresseux de l'enregistrement."""
+        if self._lazy is None:
+            self._lazy = freeze_json(self._reader.read(self._index))
+        return self._lazy
+
+    def __getitem__(self, key):
+        try:
+            return self._core[key]
+        except KeyError:
+            if key not in self._reader.fields:
+                raise
+        return self._load()[key]
+
+    def __contains__(self, key):
+        return key in self._core or (key in self._reader.fields and key in self._load())
+
+    def __iter__(self):
+        yield from self._core
+        yield from self._load()
+
+    def __len__(self):
+        return len(self._core) + len(self._load())
+
+    def __bool__(self):
+        # Sans cela, `record or {}` appellerait __len__ et chargerait les shards
+        return True
+
+    def is_loaded(self) -> bool:
+        """Indique si les champs paresseux ont déjà été décodés."""
+        return self._lazy is not None
+
+    def __repr__(self):
+        return f"ShardedRecord(id={self._core.get('id')!r}, name={self._core.get('name')!r})"
@@ -0,0 +1,97 @@
+# data/evolution_index.py
+
+"""
+Index des évolutions précalculé à partir des chaînes de pokemon.json.
+
+Chaque Pokémon y est associé à ses évolutions directes sous forme de tuples
+(ID cible, niveau minimum, condition), ce qui évite de reparcourir récursivement
+les arbres d'évolution et de rechercher les espèces par nom à chaque montée de niveau.
+"""
+
+from collections import namedtuple
+from data.bundle import load_table
+from data.pokemon_loader import get_pokedex
+
+# Évolution par montée de niveau
+CONDITION_LEVEL = "level"
+# Évolution sans niveau connu (pierre, échange, bonheur...)
+CONDITION_OTHER = "other"
+
+Evolution = namedtuple("Evolution", ("target_id", "min_level", "condition"))
+
+
+class EvolutionIndex:
+    """
+    Graphe d'évolution : ID d'espèce → évolutions directes.
+
+    Les espèces absentes de pokemon.json (générations suivantes) sont ignorées.
+
+    Attributes:
+        records (tuple): Enregistrements du Pokédex ayant servi à construire l'index.
+    """
+
+    def __init__(self, pokedex):
+        self.records = pokedex.records
+        self._evolutions = {}
+        self._pre_evolutions = {}
+
+        # Une chaîne par famille, précalculée dans le bundle : les arbres
+        # d'évolution de chaque espèce ne sont pas décodés
+        for chain in load_table("evolution_chains"):
+            self._index_node(pokedex, chain)
+
+    def _index_node(self, pokedex, node):
+        """Ajoute récursivement les évolutions d'un nœud de chaîne."""
+        source = pokedex.get_by_name(node["species"])
+        evolutions = []
+        for child in node.get("evolves_to", ()):
+            target = pokedex.get_by_name(child["species"])
+            if source is not None and target is not None:
+                level = child.get("level")
+                condition = CONDITION_LEVEL if level else CONDITION_OTHER
+                evolutions.append(Evolution(target["id"], level, condition))
+                self._pre_evolutions.setdefault(target["id"], source["id"])
+            self._index_node(pokedex, child)
+
+        if source is not None and evolutions:
+            self._evolutions.setdefault(source["id"], tuple(evolutions))
+
+    def evolutions(self, pokemon_id: int) -> tuple:
+        """Retourne les évolutions directes d'un Pokémon (tuple vide si stade final)."""
+        return self._evolutions.get(pokemon_id, ())
+
+    def can_evolve(self, pokemon_id: int) -> bool:
+        """Indique si le Pokémon a encore au moins une évolution (pas un stade final)."""
+        return pokemon_id in self._evolutions
+
+    def pre_evolution(self, pokemon_id: int):
+        """Retourne l'ID de la pré-évolution du Pokémon, ou None."""
+        return self._pre_evolutions.get(pokemon_id)
+
+    def level_evolution(self, pokemon_id: int, level: int):
+        """
+        Retourne l'ID de l'évolution atteinte au niveau donné.
+
+        Args:
+            pokemon_id (int): ID du Pokémon.
+            level (int): Niveau actuel.
+
+        Returns:
+            int | None: ID de la première évolution par niveau atteinte, ou None.
+        """
+        for target_id, min_level, _ in self._evolutions.get(pokemon_id, ()):
+            if min_level and level >= min_level:
+                return target_id
+        return None
+
+
+_index = None
+
+
+def get_evolution_index() -> EvolutionIndex:
+    """Retourne l'index d'évolution du processus (reconstruit si le Pokédex a été rechargé)."""
+    global _index
+    pokedex = get_pokedex()
+    if _index is None or _index.records is not pokedex.records:
+        _index = EvolutionIndex(pokedex)
+    return _index
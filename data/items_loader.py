@@ -5,17 +5,88 @@ Chargeur d'objets depuis le fichier items.json.
 Contient des fonctions utilitaires pour accéder aux propriétés des objets.
 """
 
-import json
 import os
-from functools import lru_cache
+from types import MappingProxyType
+from core.data_loader import freeze_json
+from data.bundle import SOURCE_PATHS, load_table
+from data.name_index import resolve_name
 
-ITEMS_PATH = os.path.join("data", "items.json")
+ITEMS_PATH = SOURCE_PATHS["items"]
+SPRITES_DIR = os.path.join("assets", "sprites", "items")
+
+# Objets exclus des récompenses de combat
+EXCLUDED_REWARDS = {"master ball"}
+
+_EMPTY_ITEM = MappingProxyType({})
 
-@lru_cache
 def load_items():
-    """Charge tous les objets depuis le fichier JSON (avec mise en cache)."""
-    with open(ITEMS_PATH, encoding="utf-8") as f:
-        return json.load(f)
+    """Charge tous les objets depuis le bundle compilé (avec mise en cache)."""
+    return load_table("items")
+
+class ItemCatalog:
+    """
+    Catalogue des objets construit une seule fois.
+
+    Tous les index sont précalculés au chargement (identifiant, catégorie,
+    chemin du sprite, récompenses valides) et les noms sont résolus par
+    data.name_index (insensible à la casse et aux accents) : les fonctions du module ne font
+    plus qu'une lecture de dict, sans allocation par appel.
+
+    Attributes:
+        records (tuple): Tous les objets (lecture seule), dans l'ordre du fichier.
+        by_name (MappingProxyType): {nom: objet}, noms exacts.
+        rewards (tuple[str]): Noms des objets valides comme récompense de combat.
+    """
+
+    def __init__(self):
+        self.reload()
+
+    def reload(self, refresh: bool = False):
+        """
+        Relit les objets et reconstruit les index.
+
+        Args:
+            refresh (bool): Revérifie le bundle compilé (après réécriture du JSON par un outil).
+        """
+        self.records = tuple(freeze_json(item) for item in load_table("items", refresh=refresh))
+        self.by_name = MappingProxyType({item["name"]: item for item in self.records})
+
+        self._by_id = {}
+        self._sprite_paths = {}
+        categories = {}
+        for item in self.records:
+            self._by_id.setdefault(item["id"], item)
+            sprite = item.get("sprite")
+            self._sprite_paths.setdefault(item["id"], os.path.join(SPRITES_DIR, sprite) if sprite else "")
+            categories.setdefault(item.get("category", ""), []).append(item)
+        self.by_category = MappingProxyType({cat: tuple(items) for cat, items in categories.items()})
+
+        self.rewards = tuple(
+            item["name"] for item in self.by_name.values()
+            if item.get("sprite") and item["name"].casefold() not in EXCLUDED_REWARDS
+        )
+
+    def get(self, item_name: str):
+        """Retourne l'objet de nom donné (insensible à la casse et aux accents), ou None."""
+        return self._by_id.get(resolve_name("items", item_name))
+
+    def sprite_path(self, item_name: str) -> str:
+        """Retourne le chemin du sprite de l'objet, ou une chaîne vide."""
+        return self._sprite_paths.get(resolve_name("items", item_name), "")
+
+_catalog = None
+
+def get_item_catalog() -> ItemCatalog:
+    """Retourne le catalogue d'objets partagé par le processus (construit au premier appel)."""
+    global _catalog
+    if _catalog is None:
+        _catalog = ItemCatalog()
+    return _catalog
+
+def reload_items_data():
+    """Force la relecture de items.json (à appeler après modification du fichier)."""
+    if _catalog is not None:
+        _catalog.reload(refresh=True)
 
 def get_item_data(item_name: str) -> dict:
     """
@@ -25,10 +96,9 @@ def get_item_data(item_name: str) -> dict:
         item_name (str): Nom de l'objet.
 
     Returns:
-        dict: Données de l'objet, ou {} si non trouvé.
+        dict: Données de l'objet (lecture seule), ou {} si non trouvé.
     """
-    items = load_items()
-    return next((item for item in items if item["name"].lower() == item_name.lower()), {})
+    return get_item_catalog().get(item_name) or _EMPTY_ITEM
 
 # Alias pour compatibilité
 get_item_by_name = get_item_data
@@ -67,8 +137,7 @@ def get_item_sprite(item_name: str) -> str:
     Returns:
         str: Chemin du sprite ou chaîne vide.
     """
-    sprite = get_item_data(item_name).get("sprite")
-    return os.path.join("assets", "sprites", "items", sprite) if sprite else ""
+    return get_item_catalog().sprite_path(item_name)
 
 def get_item_category(item_name: str) -> str:
     """
@@ -82,26 +151,34 @@ def get_item_category(item_name: str) -> str:
     """
     return get_item_data(item_name).get("category", "")
 
+def get_items_by_category(category: str) -> tuple:
+    """
+    Retourne tous les objets d'une catégorie (ex: "standard-balls").
+
+    Args:
+        category (str): Nom de la catégorie.
+
+    Returns:
+        tuple[dict]: Objets de la catégorie (vide si inconnue).
+    """
+    return get_item_catalog().by_category.get(category, ())
+
 def get_all_items() -> dict:
     """
     Retourne tous les objets sous forme de dictionnaire {nom: données}.
 
     Returns:
-        dict[str, dict]: Tous les objets par nom.
+        MappingProxyType[str, dict]: Tous les objets par nom (lecture seule, précalculé).
     """
-    return {item["name"]: item for item in load_items()}
+    return get_item_catalog().by_name
 
-def list_available_items() -> list:
+def list_available_items() -> tuple:
     """
     Retourne la liste des objets valides pour les récompenses de combat :
     - Doivent avoir un sprite
     - Ne doivent pas être des Master Balls
 
     Returns:
-        list[str]: Noms des objets valides.
+        tuple[str]: Noms des objets valides (précalculés).
     """
-    items = get_all_items()
-    return [
-        name for name, item in items.items()
-        if item.get("sprite") and name.lower() != "master ball"
-    ]
+    return get_item_catalog().rewards
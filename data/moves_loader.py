@@ -5,17 +5,15 @@ Charge et fournit l'accès aux données des attaques (moves.json).
 Inclut des fonctions utilitaires pour récupérer des informations sur les attaques.
 """
 
-import json
-import os
-from functools import lru_cache
+from core.data_loader import freeze_json
+from data.bundle import SOURCE_PATHS, load_table
+from data.name_index import resolve_name
 
-MOVES_PATH = os.path.join("data", "moves.json")
+MOVES_PATH = SOURCE_PATHS["moves"]
 
-@lru_cache
 def load_moves_data():
-    """Charge toutes les attaques depuis le fichier JSON (avec mise en cache)."""
-    with open(MOVES_PATH, encoding="utf-8") as f:
-        return json.load(f)
+    """Charge toutes les attaques depuis le bundle compilé (avec mise en cache)."""
+    return load_table("moves")
 
 def patch_move_data(move: dict, language: str = "fr") -> dict:
     """
@@ -45,7 +43,110 @@ def patch_move_data(move: dict, language: str = "fr") -> dict:
 
     return move
 
-def get_move_by_id(move_id: int) -> dict:
+_MISSING = object()
+
+class Move:
+    """
+    Fiche d'attaque immuable, normalisée une seule fois au chargement.
+
+    Les champs sont accessibles en attributs (move.power) ou comme un dict en
+    lecture seule (move["power"], move.get("effects", {})) pour rester compatible
+    avec le code de combat existant. Chaque attaque n'existe qu'en un exemplaire.
+    """
+
+    __slots__ = (
+        "id", "name", "name_en", "name_fr", "type", "damage_class", "power",
+        "accuracy", "pp", "max_pp", "priority", "effect", "description",
+        "effect_chance", "ailment", "target", "effects",
+    )
+
+    def __init__(self, data: dict):
+        data = patch_move_data(dict(data))
+        for field in self.__slots__:
+            object.__setattr__(self, field, data.get(field))
+        object.__setattr__(self, "effects", freeze_json(data.get("effects") or {}))
+        if data.get("name") is None:
+            object.__setattr__(self, "name", self.name_fr or self.name_en)
+
+    def __setattr__(self, key, value):
+        raise AttributeError(f"Move est immuable (champ {key!r})")
+
+    def __getitem__(self, key):
+        value = getattr(self, key, _MISSING) if key in self.__slots__ else _MISSING
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key):
+        return key in self.__slots__
+
+    def get(self, key, default=None):
+        """Équivalent de dict.get pour les champs de l'attaque."""
+        return getattr(self, key, default) if key in self.__slots__ else default
+
+    def keys(self):
+        """Noms des champs disponibles."""
+        return self.__slots__
+
+    def __repr__(self):
+        return f"Move(id={self.id}, name={self.name!r})"
+
+class MoveRegistry:
+    """
+    Registre des attaques indexé par ID, nom anglais et nom français.
+
+    Les noms sont résolus par data.name_index (insensible à la casse et aux
+    accents) : la recherche se fait en O(1), sans parcourir les 900+ attaques.
+
+    Attributes:
+        records (tuple[Move]): Toutes les attaques, dans l'ordre du fichier.
+    """
+
+    def __init__(self):
+        self.records = ()
+        self._by_id = {}
+        self.reload()
+
+    def reload(self, refresh: bool = False):
+        """
+        Relit les attaques et reconstruit les index.
+
+        Args:
+            refresh (bool): Revérifie le bundle compilé (après réécriture du JSON par un outil).
+        """
+        self.records = tuple(Move(raw) for raw in load_table("moves", refresh=refresh))
+        self._by_id = {}
+        for move in self.records:
+            # En cas de doublon, la première attaque du fichier est conservée
+            self._by_id.setdefault(move.id, move)
+
+    def __len__(self):
+        return len(self.records)
+
+    def get_by_id(self, move_id: int):
+        """Retourne l'attaque d'ID donné, ou None."""
+        return self._by_id.get(move_id)
+
+    def get_by_name(self, move_name: str, language: str = "en"):
+        """Retourne l'attaque de nom donné ("en" : name_en, "fr" : name_fr), ou None."""
+        namespace = "moves_fr" if language == "fr" else "moves_en"
+        return self._by_id.get(resolve_name(namespace, move_name))
+
+_registry = None
+
+def get_move_registry() -> MoveRegistry:
+    """Retourne le registre d'attaques partagé par le processus (construit au premier appel)."""
+    global _registry
+    if _registry is None:
+        _registry = MoveRegistry()
+    return _registry
+
+def reload_moves_data():
+    """Force la relecture de moves.json (à appeler après modification du fichier)."""
+    if _registry is not None:
+        _registry.reload(refresh=True)
+
+def get_move_by_id(move_id: int) -> Move:
     """
     Récupère une attaque par son identifiant.
 
@@ -53,13 +154,11 @@ def get_move_by_id(move_id: int) -> dict:
         move_id (int): ID de l'attaque.
 
     Returns:
-        dict: Attaque correspondante ou None.
+        Move: Attaque correspondante ou None.
     """
-    moves = load_moves_data()
-    move = next((m for m in moves if m["id"] == move_id), None)
-    return patch_move_data(move)
+    return get_move_registry().get_by_id(move_id)
 
-def get_move_by_name(move_name: str, language: str = "en") -> dict:
+def get_move_by_name(move_name: str, language: str = "en") -> Move:
     """
     Récupère une attaque par son nom (anglais ou français).
 
@@ -68,16 +167,9 @@ def get_move_by_name(move_name: str, language: str = "en") -> dict:
         language (str): Langue à utiliser ("en" ou "fr").
 
     Returns:
-        dict: Attaque trouvée ou None.
+        Move: Attaque trouvée ou None.
     """
-    moves = load_moves_data()
-    key = "name_fr" if language == "fr" else "name"
-
-    for move in moves:
-        if move.get(key, "").lower() == move_name.lower():
-            return patch_move_data(move, language=language)
-
-    return None
+    return get_move_registry().get_by_name(move_name, language=language)
 
 def get_move_type(move_name: str) -> str:
     """
@@ -112,7 +204,7 @@ def get_move_description(move_name: str) -> str:
     move = get_move_data(move_name)
     return move.get("description") if move else None
 
-def get_move_data(move_name: str) -> dict:
+def get_move_data(move_name: str) -> Move:
     """
     Alias vers get_move_by_name en français (compatibilité par défaut).
 
@@ -120,6 +212,6 @@ def get_move_data(move_name: str) -> dict:
         move_name (str): Nom français de l'attaque.
 
     Returns:
-        dict: Données complètes de l'attaque.
+        Move: Données complètes de l'attaque.
     """
     return get_move_by_name(move_name, language="fr")
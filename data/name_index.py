@@ -0,0 +1,136 @@
+# data/name_index.py
+
+"""
+Résolution de noms multilingue (Pokémon, attaques, objets, types).
+
+Les données mélangent noms français ("Bulbizarre", "Feu"), noms anglais de la
+PokéAPI ("grass", "swords-dance") et noms de fichiers ("poke-ball.png").
+NameIndex associe chacun de ces alias, normalisés une seule fois (sans accents,
+casefold), à l'identifiant entier canonique de l'entrée.
+"""
+
+import unicodedata
+from functools import lru_cache
+from data.bundle import load_bundle
+
+NAMESPACES = ("species", "moves_fr", "moves_en", "items", "types")
+
+# Apostrophes typographiques présentes dans moves.json (ex: "Écras’Face")
+_APOSTROPHES = str.maketrans({"’": "'", "‘": "'", "ʼ": "'"})
+
+
+@lru_cache(maxsize=8192)
+def normalize_key(name: str) -> str:
+    """
+    Normalise un nom pour la comparaison : sans accents, casefold, espaces réduits.
+
+    Args:
+        name (str): Nom quelconque ("Salamèche", "SALAMECHE", "Écras’Face"...).
+
+    Returns:
+        str: Clé normalisée ("salameche", "ecras'face"...).
+    """
+    decomposed = unicodedata.normalize("NFKD", name.translate(_APOSTROPHES))
+    stripped = "".join(c for c in decomposed if not unicodedata.combining(c))
+    return " ".join(stripped.casefold().split())
+
+
+@lru_cache(maxsize=2048)
+def asset_stem(name: str, separator: str = "_") -> str:
+    """
+    Retourne le nom de fichier (sans extension) d'un asset associé à un nom.
+
+    Args:
+        name (str): Nom affiché (ex: "M. Mime", "Eau Fraîche").
+        separator (str): Caractère remplaçant les espaces.
+
+    Returns:
+        str: Nom de fichier en minuscules, sans accents (ex: "m._mime", "eau-fraiche").
+    """
+    return normalize_key(name).replace(" ", separator)
+
+
+class NameIndex:
+    """
+    Table alias → identifiant pour chaque espace de noms.
+
+    En cas de conflit dans un même espace, le premier alias enregistré gagne
+    (ordre des fichiers sources, noms français avant alias secondaires).
+
+    Attributes:
+        tables (dict): Tables du bundle ayant servi à construire l'index.
+    """
+
+    def __init__(self, tables: dict):
+        self.tables = tables
+        self._keys = {namespace: {} for namespace in NAMESPACES}
+        # Mémo nom brut → ID des noms trouvés, pour ne normaliser chaque chaîne qu'une fois
+        # (les noms inconnus ne sont pas mémorisés : le mémo reste borné par les alias connus)
+        self._raw = {namespace: {} for namespace in NAMESPACES}
+
+        for pokemon in tables["pokemon"]:
+            self.add("species", pokemon["name"], pokemon["id"])
+
+        for move in tables["moves"]:
+            self.add("moves_fr", move["name_fr"], move["id"])
+        for move in tables["moves"]:
+            name_en = move.get("name_en") or ""
+            self.add("moves_en", name_en, move["id"])
+            self.add("moves_en", name_en.replace("-", " "), move["id"])
+
+        for item in tables["items"]:
+            self.add("items", item["name"], item["id"])
+        for item in tables["items"]:
+            sprite = item.get("sprite") or ""
+            self.add("items", sprite.rsplit(".", 1)[0], item["id"])
+
+        from data.types_loader import ENGLISH_TO_FRENCH
+        for type_id, type_info in enumerate(tables["types"]):
+            self.add("types", type_info["name"], type_id)
+        for english, french in ENGLISH_TO_FRENCH.items():
+            type_id = self.resolve("types", french)
+            if type_id is not None:
+                self.add("types", english, type_id)
+
+    def add(self, namespace: str, alias: str, entry_id: int):
+        """Enregistre un alias (ignoré s'il est vide ou déjà pris)."""
+        if alias:
+            self._keys[namespace].setdefault(normalize_key(alias), entry_id)
+
+    def resolve(self, namespace: str, name: str):
+        """
+        Retourne l'identifiant canonique correspondant à un alias.
+
+        Args:
+            namespace (str): "species", "moves_fr", "moves_en", "items" ou "types".
+            name (str): Nom dans n'importe quelle casse, avec ou sans accents.
+
+        Returns:
+            int | None: Identifiant, ou None si le nom est inconnu.
+        """
+        raw = self._raw[namespace]
+        try:
+            return raw[name]
+        except KeyError:
+            pass
+        entry_id = self._keys[namespace].get(normalize_key(name)) if name else None
+        if entry_id is not None:
+            raw[name] = entry_id
+        return entry_id
+
+
+_index = None
+
+
+def get_name_index() -> NameIndex:
+    """Retourne l'index de noms du processus (reconstruit si le bundle a été rechargé)."""
+    global _index
+    tables = load_bundle()["tables"]
+    if _index is None or _index.tables is not tables:
+        _index = NameIndex(tables)
+    return _index
+
+
+def resolve_name(namespace: str, name: str):
+    """Raccourci vers get_name_index().resolve(namespace, name)."""
+    return get_name_index().resolve(namespace, name)
@@ -5,27 +5,159 @@ Fournit des fonctions pour charger les données des Pokémon à partir de pokemo
 Permet l'accès par ID, nom, ou autre champ utile (types, stats, sprites, etc.).
 """
 
-import json
-import os
+from bisect import bisect_right
+from types import MappingProxyType
+from data.bundle import SOURCE_PATHS, ShardedRecord, get_shard_reader, load_table
 from data.moves_loader import get_move_by_name
+from data.name_index import resolve_name
 
-POKEMON_PATH = os.path.join("data", "pokemon.json")
+POKEMON_PATH = SOURCE_PATHS["pokemon"]
 
 
-def load_pokemon_data() -> list:
-    """Charge tout le fichier pokemon.json en mémoire."""
-    with open(POKEMON_PATH, encoding="utf-8") as f:
-        return json.load(f)
+def _learnset_move(move_data) -> MappingProxyType:
+    """Construit la fiche d'attaque (format UI/combat) à partir des données de moves.json."""
+    return MappingProxyType({
+        "name": move_data["name_fr"],
+        "type": move_data["type"],
+        "power": move_data.get("power", 0),
+        "accuracy": move_data.get("accuracy", 100),
+        "category": move_data.get("damage_class", "unknown"),
+        "pp": move_data.get("pp", 0),
+        "max_pp": move_data.get("pp", 0),
+    })
 
 
-def get_pokemon_by_id(pokemon_id: int) -> dict:
+class Learnset:
+    """
+    Table d'apprentissage d'un Pokémon, dédoublonnée et triée par niveau.
+
+    Chaque attaque n'apparaît qu'une fois (à son premier niveau d'apprentissage)
+    et est déjà résolue dans moves.json : « attaques connues au niveau L » se
+    résume à une recherche dichotomique.
+
+    Attributes:
+        levels (tuple[int]): Niveau d'apprentissage de chaque entrée (croissant).
+        moves (tuple[MappingProxyType]): Fiches d'attaques correspondantes.
+    """
+
+    __slots__ = ("levels", "moves")
+
+    def __init__(self, pokemon: dict):
+        levels = []
+        moves = []
+        seen_moves = set()
+
+        for entry in sorted(pokemon.get("moves", ()), key=lambda x: x["level"]):
+            move_name = entry["name"]
+            if move_name in seen_moves:
+                continue
+            seen_moves.add(move_name)
+
+            move_data = get_move_by_name(move_name, language="fr")
+            if not move_data:
+                print(f"[⚠️] Move introuvable dans moves.json: {move_name} pour Pokémon ID {pokemon['id']}")
+                continue
+            levels.append(entry["level"])
+            moves.append(_learnset_move(move_data))
+
+        self.levels = tuple(levels)
+        self.moves = tuple(moves)
+
+    def moves_up_to(self, level: int) -> tuple:
+        """Retourne les attaques apprises jusqu'au niveau donné inclus, par ordre d'apprentissage."""
+        return self.moves[:bisect_right(self.levels, level)]
+
+
+class PokedexStore:
+    """
+    Pokédex en mémoire : pokemon.json est lu une seule fois puis indexé.
+
+    Les enregistrements retournés sont en lecture seule (ShardedRecord) et
+    partagés par tout le processus : il faut les copier avant de les modifier.
+    Les attaques, l'arbre d'évolution et les sprites d'une espèce ne sont
+    décodés qu'au premier accès à l'un de ces champs.
+
+    Attributes:
+        records (tuple): Tous les Pokémon, dans l'ordre du fichier.
+    """
+
+    def __init__(self):
+        self.records = ()
+        self._by_id = {}
+        self._by_name = {}
+        self._learnsets = {}
+        self.reload()
+
+    def reload(self, refresh: bool = False):
+        """
+        Relit les données et reconstruit les index.
+
+        Args:
+            refresh (bool): Revérifie le bundle compilé (après réécriture du JSON par un outil).
+        """
+        raw = load_table("pokemon", refresh=refresh)
+        reader = get_shard_reader("pokemon")
+
+        self.records = tuple(ShardedRecord(entry, reader, index) for index, entry in enumerate(raw))
+        self._by_id = {p["id"]: p for p in self.records}
+        self._by_name = {p["name"]: p for p in self.records}
+        self._learnsets = {}
+
+    def __len__(self):
+        return len(self.records)
+
+    def get_by_id(self, pokemon_id: int):
+        """Retourne le Pokémon d'ID donné, ou None."""
+        return self._by_id.get(pokemon_id)
+
+    def learnset(self, pokemon_id: int):
+        """Retourne la table d'apprentissage du Pokémon (construite une fois puis mémorisée)."""
+        learnset = self._learnsets.get(pokemon_id)
+        if learnset is None:
+            pokemon = self._by_id.get(pokemon_id)
+            if pokemon is None:
+                return None
+            learnset = self._learnsets[pokemon_id] = Learnset(pokemon)
+        return learnset
+
+    def get_by_name(self, name: str):
+        """Retourne le Pokémon de nom donné (insensible à la casse et aux accents), ou None."""
+        record = self._by_name.get(name)
+        if record is None:
+            record = self._by_id.get(resolve_name("species", name))
+        return record
+
+
+_store = None
+
+
+def get_pokedex() -> PokedexStore:
+    """Retourne le Pokédex partagé par le processus (construit au premier appel)."""
+    global _store
+    if _store is None:
+        _store = PokedexStore()
+    return _store
+
+
+def reload_pokemon_data():
+    """Force la relecture de pokemon.json (à appeler après modification du fichier)."""
+    if _store is not None:
+        _store.reload(refresh=True)
+
+
+def load_pokemon_data() -> tuple:
+    """Retourne tous les Pokémon (lecture seule, chargés une seule fois)."""
+    return get_pokedex().records
+
+
+def get_pokemon_by_id(pokemon_id: int):
     """Retourne un Pokémon à partir de son ID numérique."""
-    return next((p for p in load_pokemon_data() if p["id"] == pokemon_id), {})
+    return get_pokedex().get_by_id(pokemon_id) or {}
 
 
-def get_pokemon_by_name(name: str) -> dict:
+def get_pokemon_by_name(name: str):
     """Retourne un Pokémon à partir de son nom (insensible à la casse)."""
-    return next((p for p in load_pokemon_data() if p["name"].lower() == name.lower()), {})
+    return get_pokedex().get_by_name(name) or {}
 
 
 def get_pokemon_stats(pokemon_id: int) -> dict:
@@ -65,11 +197,16 @@ def get_pokemon_evolution_chain(pokemon_id: int) -> dict:
     return get_pokemon_by_id(pokemon_id).get("evolution", {})
 
 
-def get_all_pokemon() -> list:
-    """Retourne la liste complète des Pokémon du fichier JSON."""
+def get_all_pokemon() -> tuple:
+    """Retourne la liste complète des Pokémon du fichier JSON (lecture seule)."""
     return load_pokemon_data()
 
 
+def get_learnset(pokemon_id: int):
+    """Retourne la table d'apprentissage précalculée d'un Pokémon (ou None si ID inconnu)."""
+    return get_pokedex().learnset(pokemon_id)
+
+
 def get_learnable_moves(pokemon_id: int, level: int = 5) -> list:
     """
     Retourne une liste des mouvements que le Pokémon peut apprendre jusqu'à un certain niveau.
@@ -79,37 +216,12 @@ def get_learnable_moves(pokemon_id: int, level: int = 5) -> list:
         level (int): Niveau maximum des attaques à inclure.
 
     Returns:
-        list: Liste de 4 attaques maximum sous forme de dict.
+        list: Liste de 4 attaques maximum sous forme de dict (copies modifiables).
     """
-    pokemon = get_pokemon_by_id(pokemon_id)
-    if not pokemon:
+    learnset = get_learnset(pokemon_id)
+    if learnset is None:
         return []
-
-    moves = []
-    seen_moves = set()
-
-    learnset = sorted(pokemon.get("moves", []), key=lambda x: x["level"])
-
-    for entry in learnset:
-        move_name = entry["name"]
-        if entry["level"] <= level and move_name not in seen_moves:
-            move_data = get_move_by_name(move_name, language="fr")
-            if move_data:
-                move = {
-                    "name": move_data["name_fr"],
-                    "type": move_data["type"],
-                    "power": move_data.get("power", 0),
-                    "accuracy": move_data.get("accuracy", 100),
-                    "category": move_data.get("damage_class", "unknown"),
-                    "pp": move_data.get("pp", 0),
-                    "max_pp": move_data.get("pp", 0),
-                }
-                moves.append(move)
-                seen_moves.add(move_name)
-            else:
-                print(f"[⚠️] Move introuvable dans moves.json: {move_name} pour Pokémon ID {pokemon_id}")
-
-    return moves[:4]
+    return [dict(move) for move in learnset.moves_up_to(level)[:4]]
 
 
 def get_pokemon_by_id_name(name: str) -> dict:
@@ -0,0 +1,147 @@
+# data/stat_table.py
+
+"""
+Table colonnaire des statistiques de base de toutes les espèces.
+
+Chaque statistique est stockée dans un array('H') indexé par ID d'espèce, avec
+le total (BST), les types et l'indicateur « peut encore évoluer » précalculés.
+Les requêtes de masse (ex: « espèces avec un BST dans [a, b] qui peuvent encore
+évoluer ») se font par recherche dichotomique sur les BST triés, sans reparcourir
+les 649 dicts du Pokédex.
+"""
+
+from array import array
+from bisect import bisect_left, bisect_right
+from data.evolution_index import get_evolution_index
+from data.pokemon_loader import get_pokedex
+from data.types_loader import get_type_chart
+
+# Clés de pokemon.json (PokéAPI), dans l'ordre des colonnes
+STAT_KEYS = ("hp", "attack", "defense", "special-attack", "special-defense", "speed")
+
+# Abréviations utilisées par moves.json / move_effects → clé de pokemon.json
+STAT_ALIASES = {
+    "atk": "attack",
+    "def": "defense",
+    "spa": "special-attack",
+    "spd": "special-defense",
+    "spe": "speed",
+}
+
+
+def canonical_stat(stat: str) -> str:
+    """Retourne la clé de pokemon.json d'une statistique ("atk" → "attack")."""
+    return STAT_ALIASES.get(stat, stat)
+
+
+def stat_value(stats: dict, stat: str, default: int = 0) -> int:
+    """
+    Lit une statistique dans un dict de stats, quelle que soit la clé utilisée.
+
+    Args:
+        stats (dict): Statistiques d'un Pokémon.
+        stat (str): Clé complète ("attack") ou abrégée ("atk").
+        default (int): Valeur si la statistique est absente.
+
+    Returns:
+        int: Valeur de la statistique.
+    """
+    value = stats.get(canonical_stat(stat))
+    if value is None:
+        value = stats.get(stat, default)
+    return value
+
+
+class StatTable:
+    """
+    Statistiques de base en colonnes, indexées par ID d'espèce.
+
+    Les IDs absents du Pokédex ont toutes leurs colonnes à 0 et present[id] == 0.
+
+    Attributes:
+        records (tuple): Enregistrements du Pokédex ayant servi à construire la table.
+        size (int): Taille des colonnes (plus grand ID + 1).
+        columns (dict[str, array]): Une colonne array('H') par clé de STAT_KEYS.
+        bst (array): Total des statistiques de base.
+        type1 (array), type2 (array): Identifiants TypeChart (neutral_id si absent).
+        can_evolve (bytearray): 1 si l'espèce a encore une évolution.
+        present (bytearray): 1 si l'ID existe dans le Pokédex.
+    """
+
+    def __init__(self, pokedex, evolution_index, type_chart):
+        self.records = pokedex.records
+        self.size = max((p["id"] for p in self.records), default=0) + 1
+
+        self.columns = {stat: array("H", bytes(2 * self.size)) for stat in STAT_KEYS}
+        self.bst = array("H", bytes(2 * self.size))
+        self.type1 = array("B", [type_chart.neutral_id]) * self.size
+        self.type2 = array("B", [type_chart.neutral_id]) * self.size
+        self.can_evolve = bytearray(self.size)
+        self.present = bytearray(self.size)
+
+        for pokemon in self.records:
+            pid = pokemon["id"]
+            stats = pokemon.get("stats", {})
+            total = 0
+            for stat in STAT_KEYS:
+                value = stats.get(stat, 0)
+                self.columns[stat][pid] = value
+                total += value
+            self.bst[pid] = total
+
+            type_ids = type_chart.type_ids(pokemon.get("types", ())[:2])
+            if type_ids:
+                self.type1[pid] = type_ids[0]
+            if len(type_ids) > 1:
+                self.type2[pid] = type_ids[1]
+
+            self.can_evolve[pid] = evolution_index.can_evolve(pid)
+            self.present[pid] = 1
+
+        # Index secondaire : IDs triés par (BST, ID) pour les requêtes par intervalle
+        order = sorted((self.bst[p["id"]], p["id"]) for p in self.records)
+        self._sorted_bst = array("H", (total for total, _ in order))
+        self._sorted_ids = array("H", (pid for _, pid in order))
+
+    def stat(self, pokemon_id: int, stat: str) -> int:
+        """Retourne une statistique de base (clé complète ou abrégée), 0 si inconnue."""
+        column = self.columns.get(canonical_stat(stat))
+        if column is None or not 0 <= pokemon_id < self.size:
+            return 0
+        return column[pokemon_id]
+
+    def base_stats(self, pokemon_id: int) -> dict:
+        """Retourne les statistiques de base d'une espèce sous forme de dict."""
+        return {stat: self.stat(pokemon_id, stat) for stat in STAT_KEYS}
+
+    def species_in_bst_range(self, bst_min: int, bst_max: int, evolving_only: bool = False) -> list:
+        """
+        Retourne les espèces dont le BST est compris dans [bst_min, bst_max].
+
+        Args:
+            bst_min (int): Borne inférieure incluse.
+            bst_max (int): Borne supérieure incluse.
+            evolving_only (bool): Exclut les stades finaux.
+
+        Returns:
+            list[int]: IDs triés par ordre croissant.
+        """
+        start = bisect_left(self._sorted_bst, bst_min)
+        end = bisect_right(self._sorted_bst, bst_max)
+        ids = self._sorted_ids[start:end]
+        if evolving_only:
+            can_evolve = self.can_evolve
+            ids = [pid for pid in ids if can_evolve[pid]]
+        return sorted(ids)
+
+
+_table = None
+
+
+def get_stat_table() -> StatTable:
+    """Retourne la table des statistiques du processus (reconstruite si le Pokédex a été rechargé)."""
+    global _table
+    pokedex = get_pokedex()
+    if _table is None or _table.records is not pokedex.records:
+        _table = StatTable(pokedex, get_evolution_index(), get_type_chart())
+    return _table
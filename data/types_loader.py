@@ -2,22 +2,166 @@
 
 """
 Fournit des fonctions utilitaires pour interagir avec les données de types Pokémon.
-Charge automatiquement types.json en mémoire.
+Les types sont lus depuis le bundle compilé au premier accès (pas à l'import).
+
+types.json utilise des noms français ("Feu", "plante") alors que pokemon.json
+utilise les noms anglais de la PokéAPI ("fire", "grass") : TypeChart unifie les
+deux et précalcule une matrice dense des multiplicateurs de dégâts.
 """
 
-import json
-import os
+from array import array
+from data.bundle import SOURCE_PATHS, load_table
+from data.name_index import get_name_index
+
+TYPES_PATH = SOURCE_PATHS["types"]
+
+# Nom anglais (PokéAPI) → nom français (types.json)
+ENGLISH_TO_FRENCH = {
+    "normal": "Normal",
+    "fighting": "Combat",
+    "flying": "Vol",
+    "poison": "Poison",
+    "ground": "Sol",
+    "rock": "Roche",
+    "bug": "Insecte",
+    "ghost": "Spectre",
+    "steel": "Acier",
+    "fire": "Feu",
+    "water": "Eau",
+    "grass": "Plante",
+    "electric": "Électrik",
+    "psychic": "Psy",
+    "ice": "Glace",
+    "dragon": "Dragon",
+    "dark": "Ténèbres",
+}
+
+# Multiplicateur appliqué par chaque liste de damage_relations
+RELATION_MULTIPLIERS = (
+    ("double_damage_to", 2.0),
+    ("half_damage_to", 0.5),
+    ("no_damage_to", 0.0),
+)
+
+
+class TypeChart:
+    """
+    Table des types indexée par identifiant entier.
+
+    L'identifiant d'un type est son index dans types.json. Un identifiant
+    supplémentaire (neutral_id) représente les types inconnus (ex: "fairy",
+    "shadow") : sa ligne et sa colonne valent 1.0, ce qui évite tout test
+    dans le calcul des dégâts.
+
+    Attributes:
+        types (list[dict]): Types bruts de types.json.
+        size (int): Côté de la matrice (nombre de types + 1).
+        neutral_id (int): Identifiant des types inconnus.
+        matrix (array): Multiplicateurs aplatis, matrix[atk * size + def].
+    """
 
-TYPES_PATH = os.path.join("data", "types.json")
+    def __init__(self, types: list):
+        self.types = types
+        self.neutral_id = len(types)
+        self.size = len(types) + 1
+
+        self._names = get_name_index()
+        self._english_names = {}
+        for english, french in ENGLISH_TO_FRENCH.items():
+            type_id = self.type_id(french)
+            if type_id != self.neutral_id:
+                self._english_names.setdefault(type_id, english)
+
+        self.matrix = array("d", [1.0]) * (self.size * self.size)
+        for atk_id, type_info in enumerate(types):
+            relations = type_info.get("damage_relations", {})
+            row = atk_id * self.size
+            for relation, multiplier in RELATION_MULTIPLIERS:
+                for target in relations.get(relation, []):
+                    def_id = self.type_id(target)
+                    if def_id != self.neutral_id:
+                        self.matrix[row + def_id] = multiplier
+
+        # Colonnes de multiplicateurs déjà calculées, par combinaison de types défensifs
+        self._columns = {}
+
+    def type_id(self, type_name: str) -> int:
+        """Retourne l'identifiant d'un type (nom français ou anglais), neutral_id si inconnu."""
+        type_id = self._names.resolve("types", type_name)
+        return self.neutral_id if type_id is None else type_id
+
+    def type_ids(self, type_names) -> tuple:
+        """Convertit une liste de noms de types en identifiants."""
+        return tuple(self.type_id(name) for name in type_names)
+
+    def multiplier(self, atk_id: int, def_ids) -> float:
+        """Multiplicateur total d'un type offensif contre un ou plusieurs types défensifs."""
+        row = atk_id * self.size
+        result = 1.0
+        for def_id in def_ids:
+            result *= self.matrix[row + def_id]
+        return result
+
+    def defense_column(self, def_ids) -> tuple:
+        """
+        Multiplicateurs de chaque type offensif contre une combinaison de types défensifs.
+
+        Calculée une fois par combinaison : pour un même défenseur, le
+        multiplicateur d'une attaque est column[atk_id], sans produit à refaire.
+
+        Args:
+            def_ids (tuple[int]): Identifiants des types du défenseur.
+
+        Returns:
+            tuple[float]: size multiplicateurs, indexés par identifiant de type offensif.
+        """
+        column = self._columns.get(def_ids)
+        if column is None:
+            column = self._columns[def_ids] = tuple(self.multiplier(atk_id, def_ids) for atk_id in range(self.size))
+        return column
+
+    def french_name(self, type_id: int) -> str:
+        """Nom français d'un type, ou chaîne vide pour neutral_id."""
+        return self.types[type_id]["name"] if type_id < self.neutral_id else ""
+
+    def english_name(self, type_id: int) -> str:
+        """Nom anglais d'un type, ou chaîne vide s'il n'est pas connu."""
+        return self._english_names.get(type_id, "")
+
+
+_chart = None
+
+
+def get_type_chart() -> TypeChart:
+    """
+    Retourne la table des types partagée par le processus.
 
-# Chargement en mémoire dès l'import pour améliorer les performances
-with open(TYPES_PATH, encoding="utf-8") as f:
-    _types_data = json.load(f)
+    Elle est reconstruite (avec l'index de noms courant) si le bundle a été rechargé.
+    """
+    global _chart
+    types = get_all_types()
+    if _chart is None or _chart.types is not types:
+        _chart = TypeChart(types)
+    return _chart
+
+
+def reload_types_data():
+    """Force la relecture de types.json (à appeler après modification du fichier)."""
+    global _chart
+    load_table("types", refresh=True)
+    _chart = None
 
 
 def get_all_types() -> list:
     """Retourne la liste complète des types (dicts)."""
-    return _types_data
+    return load_table("types")
+
+
+def _find_type(type_name: str):
+    """Retourne les données brutes d'un type (nom français ou anglais), ou None."""
+    chart = get_type_chart()
+    type_id = chart.type_id(type_name)
+    return chart.types[type_id] if type_id != chart.neutral_id else None
 
 
 def get_type_index(type_name: str) -> int:
@@ -30,7 +174,9 @@ def get_type_index(type_name: str) -> int:
     Returns:
         int: Index dans la liste ou 0 si non trouvé.
     """
-    return next((i for i, t in enumerate(_types_data) if t["name"].lower() == type_name.lower()), 0)
+    chart = get_type_chart()
+    type_id = chart.type_id(type_name)
+    return type_id if type_id != chart.neutral_id else 0
 
 
 def get_type_relations(type_name: str) -> dict:
@@ -43,7 +189,8 @@ def get_type_relations(type_name: str) -> dict:
     Returns:
         dict: Dictionnaire des relations ou {} si non trouvé.
     """
-    return next((t.get("damage_relations", {}) for t in _types_data if t["name"].lower() == type_name.lower()), {})
+    type_info = _find_type(type_name)
+    return type_info.get("damage_relations", {}) if type_info else {}
 
 
 def get_type_color(type_name: str) -> str:
@@ -56,12 +203,13 @@ def get_type_color(type_name: str) -> str:
     Returns:
         str: Code couleur hexadécimal ou "#FFFFFF" par défaut.
     """
-    return next((t.get("color", "#FFFFFF") for t in _types_data if t["name"].lower() == type_name.lower()), "#FFFFFF")
+    type_info = _find_type(type_name)
+    return type_info.get("color", "#FFFFFF") if type_info else "#FFFFFF"
 
 
 def get_type_english_name(type_name: str) -> str:
     """
-    Retourne le nom anglais du type (si défini dans le JSON).
+    Retourne le nom anglais du type.
 
     Args:
         type_name (str): Nom français.
@@ -69,4 +217,9 @@ def get_type_english_name(type_name: str) -> str:
     Returns:
         str: Nom anglais ou nom original si non défini.
     """
-    return next((t.get("english_name", t["name"]) for t in _types_data if t["name"].lower() == type_name.lower()), type_name)
+    chart = get_type_chart()
+    type_id = chart.type_id(type_name)
+    type_info = chart.types[type_id] if type_id != chart.neutral_id else None
+    if type_info and "english_name" in type_info:
+        return type_info["english_name"]
+    return chart.english_name(type_id) or type_name
@@ -4,11 +4,17 @@ import random
 import time
 import pygame
 
+from core.config import ENEMY_AI, ENEMY_AI_BUDGET_MS, ENEMY_AI_WORKERS
 from core.scene_manager import Scene
 from core.run_manager import run_manager
 
+from battle.ai import BattleAI, ExpectiminimaxAI
+from battle.mcts import MCTSAI
+from battle.battle_pokemon import BattlePokemon
 from battle.capture_handler import attempt_capture
 from battle.enemy_selector import get_balanced_enemy
+from battle.localization import render_events
+from battle.rng import BattleRNG
 
 from data.pokemon_loader import get_learnable_moves
 
@@ -61,6 +67,9 @@ class BattleScene(Scene):
         self.hide_enemy_sprite = False
         self.ball_animation = None
 
+        # === Aléatoire du combat (un seul générateur, injecté dans toute la logique) ===
+        self.rng = BattleRNG()
+
         # === Préparation de l'équipe du joueur ===
         for pkm in run_manager.get_team():
             pkm.setdefault("level", 5)
@@ -87,19 +96,34 @@ class BattleScene(Scene):
         self.ally_xp_bar.displayed_xp = self.ally_xp
 
         # === Génération de l’adversaire équilibré ===
-        base_enemy = get_balanced_enemy(starter)
+        base_enemy = get_balanced_enemy(starter, rng=self.rng)
         self.enemy_id = base_enemy["id"]
         self.enemy_name = base_enemy["name"]
         self.enemy_level = base_enemy["level"]
 
-        self.enemy_data = base_enemy.copy()
-        self.enemy_data["stats"] = base_enemy["stats"]
+        # Les données du Pokédex sont partagées en lecture seule : on copie ce qui sera modifié
+        self.enemy_data = dict(base_enemy)
+        self.enemy_data["stats"] = dict(base_enemy["stats"])
+        self.enemy_data["types"] = list(base_enemy.get("types", []))
         self.enemy_data["hp"] = base_enemy["stats"]["hp"]
         self.enemy_data["moves"] = get_learnable_moves(base_enemy["id"], base_enemy["level"])
-        self.enemy_data["gender"] = self.enemy_gender = random.choice(["♂", "♀"])
+        self.enemy_data["gender"] = self.enemy_gender = self.rng.encounter.choice(["♂", "♀"])
         self.enemy_base_exp = base_enemy.get("base_experience", 50)
         self.enemy_hp = self.enemy_max_hp = self.enemy_data["hp"]
 
+        # === Pokémon de combat (reportés dans les dicts d'équipe après chaque action) ===
+        self.enemy_battler = BattlePokemon.from_team_entry(self.enemy_data)
+        self._ally_battler = None
+
+        # === IA adverse (réflexion limitée à ENEMY_AI_BUDGET_MS par décision) ===
+        if ENEMY_AI == "mcts":
+            self.enemy_ai = MCTSAI(budget_ms=ENEMY_AI_BUDGET_MS, workers=ENEMY_AI_WORKERS)
+        elif ENEMY_AI == "greedy":
+            # Décisions servies par le livre d'ouverture ou le cache partagé dès qu'une situation se répète
+            self.enemy_ai = BattleAI()
+        else:
+            self.enemy_ai = ExpectiminimaxAI(max_depth=3, time_budget_ms=ENEMY_AI_BUDGET_MS)
+
         self.enemy_hp_bar = HealthBar((116, 73), (98, 9), self.enemy_max_hp)
         self.enemy_hp_bar.current_hp = self.enemy_hp
         self.enemy_hp_bar.displayed_hp = self.enemy_hp
@@ -109,33 +133,52 @@ class BattleScene(Scene):
         self.capture_effect = CaptureEffect(sprite=self.sprites[1], pos=(360, 130))
         self.fight_menu = None
 
+    def choose_enemy_move(self):
+        """Retourne l'attaque choisie par l'IA adverse contre le Pokémon allié actuel."""
+        return self.enemy_ai.choose_move(self.enemy_battler, self.ally_battler(), self.enemy_data["moves"], rng=self.rng)
+
     def enemy_turn(self):
         """
-        Le Pokémon ennemi choisit une attaque aléatoire et l'utilise sur l'allié.
+        Le Pokémon ennemi choisit une attaque avec son IA et l'utilise sur l'allié.
         Applique les effets et met à jour les PV alliés.
         """
         if self.enemy_hp <= 0:
             return
 
-        move = random.choice(self.enemy_data["moves"])
-        attacker = {
-            "name": self.enemy_name,
-            "level": self.enemy_level,
-            "types": self.enemy_data.get("types", []),
-            "stats": self.enemy_data["stats"]
-        }
-        defender = run_manager.get_team()[0]
-        defender.setdefault("stats", defender.get("base_stats", {}))
-        defender.setdefault("hp", defender["stats"].get("hp", 1))
+        move = self.choose_enemy_move()
+        attacker = self.enemy_battler
+        defender = self.ally_battler()
 
         self.queue_message(f"{self.enemy_name} utilise {move['name']} !")
 
         from battle.move_handler import use_move as core_use_move
-        result = core_use_move(attacker, defender, move)
-        for msg in result["messages"]:
-            self.queue_message(msg)
+        result = core_use_move(attacker, defender, move, rng=self.rng)
+        attacker.to_team_entry()
+        defender.to_team_entry()
+        self.queue_events(result["events"])
+
+        self.ally_hp = defender.hp
+        self.enemy_hp = attacker.hp
 
-        self.ally_hp = defender["hp"]
+    def ally_battler(self):
+        """
+        Retourne le BattlePokemon du Pokémon allié au combat.
+
+        Il est recréé quand le Pokémon actif change (envoi, montée de niveau,
+        évolution) ; sinon, seuls ses PV et son statut sont relus depuis l'équipe
+        (ils peuvent être modifiés hors combat, par le sac par exemple).
+        """
+        starter = run_manager.get_team()[0]
+        battler = self._ally_battler
+        if (battler is None or battler.entry is not starter
+                or battler.id != starter["id"] or battler.level != starter.get("level", 5)):
+            starter.setdefault("stats", starter.get("base_stats", {}))
+            starter.setdefault("hp", starter["stats"].get("hp", 1))
+            battler = self._ally_battler = BattlePokemon.from_team_entry(starter)
+        else:
+            battler.hp = starter.get("hp", battler.hp)
+            battler.status = starter.get("status")
+        return battler
 
     def queue_message(self, text_or_callable):
         """
@@ -148,72 +191,79 @@ class BattleScene(Scene):
         elif callable(text_or_callable):
             self.message_queue.append(text_or_callable)
 
+    def queue_events(self, battle_events):
+        """
+        Convertit des événements de combat (battle.events) en texte et les ajoute à la file des messages.
+        """
+        for text in render_events(battle_events):
+            self.queue_message(text)
+
     def use_move(self, move):
         """
         Applique une attaque lancée par le Pokémon allié contre l’ennemi.
         Affiche les messages associés et enchaîne le tour de l’ennemi si nécessaire.
         """
         from battle.move_handler import use_move as core_use_move
-        starter = run_manager.get_team()[0]
-
-        self.ally_hp = starter.get("hp", starter["stats"]["hp"])
-        self.ally_max_hp = starter["stats"]["hp"]
+        attacker = self.ally_battler()
+        defender = self.enemy_battler
 
-        attacker = {
-            "name": starter["name"],
-            "level": starter.get("level", 5),
-            "types": starter.get("types", []),
-            "stats": starter.get("stats") or starter.get("base_stats")
-        }
-        defender = self.enemy_data
-
-        if "hp" not in defender:
-            defender["hp"] = defender["stats"]["hp"]
+        self.ally_hp = attacker.hp
+        self.ally_max_hp = attacker.max_hp
 
         self.queue_message(f"{self.ally_name} utilise {move['name']} !")
-        result = core_use_move(attacker, defender, move)
+        result = core_use_move(attacker, defender, move, rng=self.rng)
+        attacker.to_team_entry()
+        defender.to_team_entry()
+
+        # L'IA adverse apprend l'attaque jouée (réutilisation de son arbre de recherche)
+        move_names = [known["name"] for known in attacker.moves]
+        if move["name"] in move_names:
+            self.enemy_ai.observe_opponent_move(move_names.index(move["name"]))
 
-        for msg in result["messages"]:
-            self.queue_message(msg)
+        self.queue_events(result["events"])
 
         def apply_player_damage():
             if result["deferred_damage"]:
-                defender["hp"] = max(0, defender["hp"] - result["deferred_damage"])
-            self.enemy_hp = defender["hp"]
+                defender.hp = max(0, defender.hp - result["deferred_damage"])
+                defender.to_team_entry()
+            self.enemy_hp = defender.hp
+            self.ally_hp = attacker.hp
 
         self.message_queue.append(apply_player_damage)
 
-        if defender["hp"] <= 0:
-            self.queue_message(f"{defender['name']} est K.O. !")
+        if defender.hp <= 0:
+            self.queue_message(f"{defender.name} est K.O. !")
             self.hide_enemy_sprite = True
             self.message_queue.append(self.handle_victory)
         else:
             def delayed_enemy_turn():
-                move = random.choice(self.enemy_data["moves"])
+                move = self.choose_enemy_move()
                 self.queue_message(f"{self.enemy_name} utilise {move['name']} !")
 
-                attacker = {
-                    "name": self.enemy_name,
-                    "level": self.enemy_level,
-                    "types": self.enemy_data.get("types", []),
-                    "stats": self.enemy_data["stats"]
-                }
-                defender = run_manager.get_team()[0]
-                defender.setdefault("stats", defender.get("base_stats", {}))
-                defender.setdefault("hp", defender["stats"].get("hp", 1))
+                attacker = self.enemy_battler
+                defender = self.ally_battler()
 
-                result = core_use_move(attacker, defender, move)
+                result = core_use_move(attacker, defender, move, rng=self.rng)
+                attacker.to_team_entry()
+                defender.to_team_entry()
 
-                for msg in result["messages"]:
-                    self.queue_message(msg)
+                self.queue_events(result["events"])
 
                 def apply_enemy_damage():
                     if result["deferred_damage"]:
-                        defender["hp"] = max(0, defender["hp"] - result["deferred_damage"])
-                        self.ally_hp = defender["hp"]
+                        defender.hp = max(0, defender.hp - result["deferred_damage"])
+                        defender.to_team_entry()
+                    self.ally_hp = defender.hp
+                    # Drain ou contrecoup : les PV de l'ennemi changent aussi
+                    self.enemy_hp = attacker.hp
 
                 self.message_queue.append(apply_enemy_damage)
 
+                if attacker.hp <= 0:
+                    self.queue_message(f"{attacker.name} est K.O. !")
+                    self.hide_enemy_sprite = True
+                    self.message_queue.append(self.handle_victory)
+
             self.message_queue.append(delayed_enemy_turn)
 
         self.state = "command"
@@ -316,10 +366,10 @@ class BattleScene(Scene):
                         p.update({
                             "id": evolved_data["id"],
                             "name": evolved_data["name"],
-                            "stats": evolved_data["stats"],
-                            "base_stats": evolved_data["stats"],
-                            "types": evolved_data["types"],
-                            "sprites": evolved_data["sprites"],
+                            "stats": dict(evolved_data["stats"]),
+                            "base_stats": dict(evolved_data["stats"]),
+                            "types": list(evolved_data["types"]),
+                            "sprites": dict(evolved_data["sprites"]),
                             "moves": get_learnable_moves(evolved_data["id"], p["level"])
                         })
 
@@ -402,13 +452,11 @@ class BattleScene(Scene):
         if self.state != "command":
             return
 
-        if "hp" not in self.enemy_data:
-            self.enemy_data["hp"] = self.enemy_data["stats"]["hp"]
-
         self.capture_result = attempt_capture(
-            self.enemy_data,
+            self.enemy_battler,
             ball_name,
-            status=self.enemy_data.get("status")
+            status=self.enemy_battler.status,
+            rng=self.rng
         )
         self.capture_result["ball_used"] = ball_name
 
@@ -421,8 +469,7 @@ class BattleScene(Scene):
         """
         Applique les effets d'une tentative de capture après l’animation.
         """
-        for msg in self.capture_result["messages"]:
-            self.queue_message(msg)
+        self.queue_events(self.capture_result["events"])
 
         if self.capture_effect and not self.capture_result.get("success"):
             self.capture_effect.trigger_out()
@@ -567,8 +614,8 @@ class BattleScene(Scene):
         pass
 
     def on_exit(self):
-        """Méthode appelée à la sortie de la scène (non utilisée ici)."""
-        pass
+        """Méthode appelée à la sortie de la scène : arrête les processus de l'IA adverse."""
+        self.enemy_ai.close()
 
     def update(self, dt):
         """Met à jour tous les éléments dynamiques du combat (animations, effets, barres)."""
@@ -0,0 +1,136 @@
+# tools/bench_battle_ai.py
+
+import os
+import random
+import sys
+import time
+
+# Ajoute le dossier racine au path pour les imports relatifs
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from battle.ai import BattleAI, DecisionCache
+from battle.engine import calculate_damage, damage_distributions
+from battle.move_handler import use_move
+from battle.rng import BattleRNG
+from battle.simulator import create_combatant
+from data.pokemon_loader import get_all_pokemon
+
+MATCHUPS = 500
+REPEATS = 5
+
+# Passes de mesure, alternées entre les évaluations (le débit retenu est la médiane)
+ROUNDS = 7
+
+# Attaques résolues par attaque offensive pour comparer la loi modélisée aux dégâts réels
+MODEL_SAMPLES = 2000
+
+
+def legacy_choose_move(attacker, defender, moves, rng):
+    """Ancienne évaluation de BattleAI : un tirage de calculate_damage par attaque."""
+    best_score = float("-inf")
+    best_move = None
+    for move in moves:
+        if not move.get("power"):
+            continue
+        damage, _, type_multiplier = calculate_damage(attacker, defender, move, rng=rng)
+        score = damage * ((move.get("accuracy") or 100) / 100)
+        if type_multiplier > 1:
+            score *= 1.5
+        elif type_multiplier < 1:
+            score *= 0.5
+        if score > best_score:
+            best_score = score
+            best_move = move
+    return best_move if best_move else rng.ai.choice(moves)
+
+
+def measure(choose, matchups, rng) -> tuple:
+    """Retourne (décisions/s, part des matchs où les REPEATS décisions sont identiques) pour une passe."""
+    stable = 0
+    start = time.perf_counter()
+    for attacker, defender in matchups:
+        choices = {choose(attacker, defender, attacker.moves, rng)["name"] for _ in range(REPEATS)}
+        stable += len(choices) == 1
+    elapsed = time.perf_counter() - start
+    return len(matchups) * REPEATS / elapsed, stable / len(matchups)
+
+
+def compare(chooses, matchups, rng) -> list:
+    """
+    Mesure plusieurs évaluations en ROUNDS passes alternées.
+
+    Alterner les passes expose chaque évaluation aux mêmes variations de
+    charge de la machine ; la médiane écarte les passes perturbées.
+
+    Returns:
+        list[tuple]: (décisions/s médian, choix stables) par évaluation, dans l'ordre de chooses.
+    """
+    rates = [[] for _ in chooses]
+    stables = [0.0] * len(chooses)
+    for _ in range(ROUNDS):
+        for i, choose in enumerate(chooses):
+            rate, stables[i] = measure(choose, matchups, rng)
+            rates[i].append(rate)
+    return [(sorted(r)[len(r) // 2], stable) for r, stable in zip(rates, stables)]
+
+
+def model_gap(matchups, rng) -> float:
+    """
+    Plus grand écart relatif entre les dégâts moyens modélisés (damage_distributions)
+    et ceux infligés en jeu par move_handler.use_move (attaques touchées seulement).
+    """
+    worst = 0.0
+    for attacker, defender in matchups:
+        offensive = [move for move in attacker.moves if move.get("power")]
+        for move, distribution in zip(offensive, damage_distributions(attacker, defender, offensive)):
+            total = hits = 0
+            for _ in range(MODEL_SAMPLES):
+                damage = use_move(attacker, defender, move, rng=rng)["damage"]
+                if damage:
+                    total += damage
+                    hits += 1
+            if hits:
+                worst = max(worst, abs(total / hits - distribution.mean) / distribution.mean)
+    return worst
+
+
+def main():
+    """
+    Compare l'évaluation espérée (par lots, sans tirage) de BattleAI à l'ancienne
+    évaluation par un tirage de dégâts : débit de décisions et stabilité des choix,
+    avec et sans cache de décisions. Vérifie aussi que la loi de dégâts utilisée
+    par l'IA est bien celle que le jeu applique.
+    """
+    picker = random.Random(0)
+    species = [p["id"] for p in get_all_pokemon()]
+    matchups = []
+    while len(matchups) < MATCHUPS:
+        level = picker.randint(10, 60)
+        attacker = create_combatant(picker.choice(species), level)
+        defender = create_combatant(picker.choice(species), level)
+        if sum(1 for move in attacker.moves if move.get("power")) >= 2:
+            matchups.append((attacker, defender))
+
+    ai = BattleAI(use_cache=False, use_book=False)
+    cached_ai = BattleAI(cache=DecisionCache(), use_book=False)
+    rng = BattleRNG(0)
+    # Premier passage : remplit le cache des lois de dégâts
+    measure(ai.choose_move, matchups, rng)
+    (legacy_rate, legacy_stable), (rate, stable), (cached_rate, cached_stable) = compare(
+        (legacy_choose_move, ai.choose_move, cached_ai.choose_move), matchups, rng)
+    stats = cached_ai.cache.stats()
+    gap = model_gap(matchups[:20], rng)
+
+    print(f"{MATCHUPS} matchs, {REPEATS} décisions chacun (médiane de {ROUNDS} passes alternées) :")
+    print(f"  - Ancienne évaluation (1 tirage)  {legacy_rate:>9.0f} décisions/s   choix stables : {legacy_stable:.1%}")
+    print(f"  - Valeur espérée (par lots)       {rate:>9.0f} décisions/s   choix stables : {stable:.1%}"
+          f"   ({rate / legacy_rate:.2f}× l'ancienne)")
+    print(f"  - Valeur espérée + cache (LRU)    {cached_rate:>9.0f} décisions/s   choix stables : {cached_stable:.1%}")
+    print(f"    cache ({ROUNDS} passes) : {stats['entries']} entrées, {stats['hits']} succès / {stats['misses']} échecs "
+          f"({stats['hit_rate']:.1%})")
+    print(f"Dégâts moyens modélisés vs appliqués par use_move (20 matchs, {MODEL_SAMPLES} attaques) : "
+          f"écart max {gap:.1%}")
+
+
+if __name__ == "__main__":
+    main()
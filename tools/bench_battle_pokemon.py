@@ -0,0 +1,90 @@
+# tools/bench_battle_pokemon.py
+
+import gc
+import os
+import sys
+import time
+import tracemalloc
+
+# Ajoute le dossier racine au path pour les imports relatifs
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from battle.battle_pokemon import BattlePokemon
+from battle.move_handler import use_move
+from battle.rng import BattleRNG
+from battle.simulator import create_combatant
+
+COUNT = 10000
+TURNS = 20000
+
+
+def retained_memory(factory) -> int:
+    """Mémoire retenue par COUNT objets créés par factory."""
+    gc.collect()
+    tracemalloc.start()
+    objects = [factory() for _ in range(COUNT)]
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+    return current
+
+
+def turns_per_second(step) -> float:
+    """Nombre d'appels de step par seconde."""
+    start = time.perf_counter()
+    for _ in range(TURNS):
+        step()
+    return TURNS / (time.perf_counter() - start)
+
+
+def main():
+    """
+    Compare le modèle BattlePokemon (__slots__) aux dicts d'équipe reconstruits
+    à chaque tour : mémoire par Pokémon et débit de lecture / résolution de tours.
+    """
+    ally = create_combatant(6, 50)
+    enemy = create_combatant(9, 50)
+    ally_entry = ally.to_team_entry()
+    enemy_entry = enemy.to_team_entry()
+
+    # === Mémoire ===
+    dict_bytes = retained_memory(lambda: dict(ally_entry, stats=dict(ally_entry["stats"])))
+    slot_bytes = retained_memory(lambda: BattlePokemon.from_team_entry(ally_entry))
+    print("Mémoire par Pokémon :")
+    print(f"  - dict d'équipe       {dict_bytes / COUNT:>7.0f} octets")
+    print(f"  - BattlePokemon       {slot_bytes / COUNT:>7.0f} octets")
+
+    # === Lecture des stats d'un tour (ancien schéma : dict attaquant reconstruit + setdefault) ===
+    def dict_turn():
+        attacker = {
+            "name": ally_entry["name"],
+            "level": ally_entry.get("level", 5),
+            "types": ally_entry.get("types", []),
+            "stats": ally_entry.get("stats") or ally_entry.get("base_stats"),
+        }
+        enemy_entry.setdefault("stats", enemy_entry.get("base_stats", {}))
+        enemy_entry.setdefault("hp", enemy_entry["stats"].get("hp", 1))
+        return (attacker.get("stats", {}).get("attack", 10), enemy_entry.get("stats", {}).get("defense", 10),
+                attacker.get("level", 5), enemy_entry.get("_protected", False))
+
+    def slot_turn():
+        return ally.attack, enemy.defense, ally.level, enemy.protected
+
+    print("Préparation d'un tour (lectures) :")
+    print(f"  - dicts               {turns_per_second(dict_turn):>10.0f} tours/s")
+    print(f"  - BattlePokemon       {turns_per_second(slot_turn):>10.0f} tours/s")
+
+    # === Résolution complète d'attaques ===
+    rng = BattleRNG(0)
+    move = ally.moves[0]
+
+    def full_turn():
+        use_move(ally, enemy, move, rng=rng)
+        enemy.hp = enemy.max_hp
+
+    print(f"Résolution d'attaques (move_handler) : {turns_per_second(full_turn):.0f} attaques/s")
+
+
+if __name__ == "__main__":
+    main()
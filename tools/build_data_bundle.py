@@ -0,0 +1,35 @@
+# tools/build_data_bundle.py
+
+import os
+import sys
+import time
+
+# Ajoute le dossier racine au path pour les imports relatifs
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from data.bundle import BUNDLE_PATH, SOURCE_PATHS, build_bundle
+
+
+def main():
+    """
+    Compile data/pokemon.json, moves.json, types.json et items.json
+    en un seul bundle binaire (cache/data_bundle.bin).
+
+    Le jeu reconstruit ce bundle tout seul si un JSON change ; ce script
+    permet de le préparer à l'avance (build, installation...).
+    """
+    start = time.perf_counter()
+    bundle = build_bundle()
+    elapsed = time.perf_counter() - start
+
+    json_size = sum(os.path.getsize(path) for path in SOURCE_PATHS.values())
+    bundle_size = os.path.getsize(BUNDLE_PATH) if os.path.exists(BUNDLE_PATH) else 0
+
+    for name, table in bundle["tables"].items():
+        print(f"  - {name:<16} {len(table):>5} entrées")
+    print(f"✅ Bundle écrit dans {BUNDLE_PATH} en {elapsed:.2f}s "
+          f"({json_size / 1024:.0f} Ko JSON → {bundle_size / 1024:.0f} Ko)")
+
+
+if __name__ == "__main__":
+    main()
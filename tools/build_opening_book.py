@@ -0,0 +1,78 @@
+# tools/build_opening_book.py
+
+import argparse
+import os
+import sys
+import time
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+
+# Ajoute le dossier racine au path pour les imports relatifs
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from battle.ai import BattleAI
+from battle.matchup import init_worker
+from battle.opening_book import LEVEL_BAND, LEVEL_BANDS, NO_MOVE, OPENING_BOOK_PATH, OpeningBook, band_level
+from battle.simulator import create_combatant
+from data.pokemon_loader import get_all_pokemon
+
+
+def book_band(species: list, band: int, size: int) -> bytes:
+    """
+    Calcule une tranche du livre : meilleure attaque de chaque espèce contre chacune des autres.
+
+    Les deux Pokémon sont au niveau représentatif de la tranche, PV pleins,
+    avec les attaques apprises à ce niveau.
+
+    Returns:
+        bytes: size × size index d'attaque (NO_MOVE sans attaque offensive).
+    """
+    level = band_level(band)
+    ai = BattleAI(use_cache=False, use_book=False)
+    combatants = [create_combatant(pokemon_id, level) for pokemon_id in species]
+    table = bytearray([NO_MOVE]) * (size * size)
+    for attacker in combatants:
+        row = attacker.id * size
+        for defender in combatants:
+            index = ai.best_move_index(attacker, defender, attacker.moves)
+            if index is not None:
+                table[row + defender.id] = index
+    return bytes(table)
+
+
+def main():
+    """
+    Construit le livre d'ouverture de BattleAI (cache/opening_book.npy) : pour
+    chaque tranche de niveaux et chaque paire d'espèces, l'index de l'attaque de
+    meilleure valeur espérée parmi celles apprises au niveau.
+
+    En jeu, la décision d'ouverture d'un combat se résume alors à une lecture
+    dans la table. Sans ce fichier, BattleAI évalue les attaques comme avant.
+    """
+    parser = argparse.ArgumentParser(description="Construit le livre d'ouverture de BattleAI.")
+    parser.add_argument("-w", "--workers", type=int, default=None, help="Nombre de processus (défaut : un par cœur).")
+    parser.add_argument("-o", "--output", default=OPENING_BOOK_PATH, help="Fichier .npy de sortie.")
+    args = parser.parse_args()
+
+    species = [p["id"] for p in get_all_pokemon()]
+    size = max(species) + 1
+    book = OpeningBook.empty(LEVEL_BANDS, size)
+
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=args.workers, initializer=init_worker) as pool:
+        futures = [pool.submit(book_band, species, band, size) for band in range(LEVEL_BANDS)]
+        for band, future in enumerate(futures):
+            offset = book.offset(band, 0, 0)
+            book.table[offset:offset + size * size] = array("B", future.result())
+            first = band * LEVEL_BAND + 1
+            print(f"  - Niveaux {first:>2}-{first + LEVEL_BAND - 1:<3} (calculés au niveau {band_level(band)})")
+    elapsed = time.perf_counter() - start
+
+    book.save(args.output)
+    filled = sum(1 for value in book.table if value != NO_MOVE)
+    print(f"✅ Livre écrit dans {args.output} en {elapsed:.1f}s "
+          f"({len(species)} espèces, {filled} entrées, {os.path.getsize(args.output) / 1024:.0f} Ko)")
+
+
+if __name__ == "__main__":
+    main()
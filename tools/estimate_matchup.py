@@ -0,0 +1,48 @@
+# tools/estimate_matchup.py
+
+import argparse
+import os
+import sys
+import time
+
+# Ajoute le dossier racine au path pour les imports relatifs
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from battle.matchup import estimate_matchup
+
+
+def parse_team(value: str) -> list:
+    """Convertit "25,pikachu,4" en liste de membres (IDs ou noms)."""
+    return [int(member) if member.strip().isdigit() else member.strip() for member in value.split(",") if member.strip()]
+
+
+def main():
+    """
+    Estime le taux de victoire d'une équipe contre une autre par simulation
+    Monte-Carlo multiprocessus (utile pour régler les marges de get_balanced_enemy).
+    """
+    parser = argparse.ArgumentParser(description="Estimation d'un affrontement par simulation en masse.")
+    parser.add_argument("team_a", help="Équipe A : IDs ou noms séparés par des virgules.")
+    parser.add_argument("team_b", help="Équipe B : IDs ou noms séparés par des virgules.")
+    parser.add_argument("-n", "--battles", type=int, default=10000, help="Nombre de combats.")
+    parser.add_argument("-l", "--level", type=int, default=20, help="Niveau des Pokémon.")
+    parser.add_argument("-w", "--workers", type=int, default=None, help="Nombre de processus (défaut : un par cœur).")
+    parser.add_argument("-s", "--seed", type=int, default=None, help="Graine aléatoire.")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    result = estimate_matchup(
+        parse_team(args.team_a), parse_team(args.team_b),
+        n=args.battles, workers=args.workers, level=args.level, seed=args.seed
+    )
+    elapsed = time.perf_counter() - start
+
+    low, high = result.confidence_interval
+    print(f"✅ {result.battles} combats en {elapsed:.2f}s ({result.battles / elapsed:.0f} combats/s)")
+    print(f"  - Taux de victoire A : {result.win_rate:.1%}  (IC 95 % : {low:.1%} – {high:.1%})")
+    print(f"  - Victoires A : {result.wins_a}  |  Victoires B : {result.wins_b}  |  Égalités : {result.draws}")
+    print(f"  - Tours moyens : {result.mean_turns:.1f}")
+
+
+if __name__ == "__main__":
+    main()
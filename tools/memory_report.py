@@ -0,0 +1,73 @@
+# tools/memory_report.py
+
+import gc
+import json
+import os
+import sys
+import tracemalloc
+
+# Ajoute le dossier racine au path pour les imports relatifs
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from core.data_loader import freeze_json
+from data.bundle import SOURCE_PATHS, build_bundle, invalidate
+
+
+def measure(label, loader):
+    """
+    Mesure la mémoire Python encore allouée après l'appel de loader.
+
+    Args:
+        label (str): Libellé affiché.
+        loader (callable): Fonction de chargement ; son résultat est gardé en vie pendant la mesure.
+
+    Returns:
+        int: Octets alloués et conservés.
+    """
+    gc.collect()
+    tracemalloc.start()
+    result = loader()
+    gc.collect()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"  - {label:<42} {current / 1024:>8.0f} Ko  (pic {peak / 1024:.0f} Ko)")
+    del result
+    return current
+
+
+def load_full_json():
+    """Chargement historique : pokemon.json entièrement décodé et gelé."""
+    with open(SOURCE_PATHS["pokemon"], encoding="utf-8") as f:
+        return tuple(freeze_json(entry) for entry in json.load(f))
+
+
+def load_pokedex(touched=0):
+    """Chargement du Pokédex depuis le bundle, en décodant les champs paresseux de quelques espèces."""
+    import data.pokemon_loader as pokemon_loader
+
+    invalidate()
+    pokemon_loader._store = None
+    pokedex = pokemon_loader.get_pokedex()
+    for record in pokedex.records[:touched]:
+        record.get("moves")
+    return pokedex
+
+
+def main():
+    """
+    Compare la mémoire résidente du Pokédex complet (JSON) et du Pokédex paresseux (bundle + shards).
+    """
+    build_bundle()
+
+    print("Mémoire retenue après chargement de pokemon.json :")
+    full = measure("JSON complet (toutes les espèces)", load_full_json)
+    lazy = measure("Bundle, champs paresseux non chargés", load_pokedex)
+    measure("Bundle, 50 espèces consultées", lambda: load_pokedex(50))
+    measure("Bundle, 649 espèces consultées", lambda: load_pokedex(649))
+
+    if full:
+        print(f"✅ Réduction au démarrage : {100 * (1 - lazy / full):.0f} %")
+
+
+if __name__ == "__main__":
+    main()
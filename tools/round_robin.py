@@ -0,0 +1,107 @@
+# tools/round_robin.py
+
+import argparse
+import math
+import os
+import sys
+import time
+from array import array
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+# Ajoute le dossier racine au path pour les imports relatifs
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from battle.matchup import init_worker, win_rate_row
+from core.data_loader import load_npy, save_npy
+from data.pokemon_loader import get_all_pokemon
+
+OUTPUT_DIR = os.path.join("cache", "round_robin")
+
+# Nombre de lignes terminées entre deux sauvegardes de la matrice
+CHECKPOINT_EVERY = 8
+
+
+def matrix_path(output_dir: str, level: int) -> str:
+    """Chemin de la matrice de taux de victoire d'un niveau."""
+    return os.path.join(output_dir, f"winrate_L{level}.npy")
+
+
+def load_checkpoint(path: str, size: int) -> array:
+    """
+    Relit une matrice partielle (lignes non calculées à NaN), ou en crée une vide.
+
+    Une matrice de taille différente (autre liste d'espèces) est ignorée.
+    """
+    if os.path.exists(path):
+        values, shape = load_npy(path)
+        if shape == (size, size) and values.typecode == "f":
+            return values
+        print(f"⚠️ {path} ignoré (forme {shape}, {size}×{size} attendu)")
+    return array("f", [math.nan]) * (size * size)
+
+
+def pending_rows(matrix: array, size: int) -> list:
+    """Index des lignes pas encore calculées."""
+    return [row for row in range(size) if math.isnan(matrix[row * size])]
+
+
+def run_level(pool, species: list, level: int, battles: int, seed, output_dir: str):
+    """Calcule (ou reprend) la matrice d'un niveau, ligne par ligne sur les workers."""
+    size = len(species)
+    path = matrix_path(output_dir, level)
+    matrix = load_checkpoint(path, size)
+    rows = pending_rows(matrix, size)
+    if not rows:
+        print(f"✅ Niveau {level} : déjà complet ({path})")
+        return
+
+    print(f"🔁 Niveau {level} : {len(rows)}/{size} lignes à calculer ({len(rows) * size * battles} combats)")
+    start = time.perf_counter()
+    futures = {
+        # Graine propre à (niveau, ligne) : une reprise donne le même résultat qu'un calcul d'une traite
+        pool.submit(win_rate_row, species[row], species, level, battles, f"{seed}:{level}:{row}"): row
+        for row in rows
+    }
+
+    done = 0
+    for future in as_completed(futures):
+        row = futures[future]
+        matrix[row * size:(row + 1) * size] = array("f", future.result())
+        done += 1
+        if done % CHECKPOINT_EVERY == 0 or done == len(rows):
+            save_npy(path, matrix, (size, size))
+            elapsed = time.perf_counter() - start
+            print(f"  - {done}/{len(rows)} lignes ({done * size * battles / elapsed:.0f} combats/s)")
+
+    print(f"✅ Niveau {level} : {path}")
+
+
+def main():
+    """
+    Tournoi toutes rondes : chaque espèce affronte chacune des autres (1 contre 1,
+    attaques apprises au niveau choisi), K combats par affrontement.
+
+    Produit une matrice de taux de victoire par niveau (float32, format .npy,
+    ligne = espèce évaluée, colonne = adversaire, une égalité compte pour 1/2)
+    ainsi que species.npy (ID de chaque ligne). La matrice sert de point de reprise :
+    relancer la commande ne recalcule que les lignes manquantes.
+    """
+    parser = argparse.ArgumentParser(description="Tournoi toutes rondes entre toutes les espèces.")
+    parser.add_argument("-l", "--levels", type=int, nargs="+", default=[20], help="Niveaux à évaluer.")
+    parser.add_argument("-k", "--battles", type=int, default=10, help="Combats par affrontement.")
+    parser.add_argument("-w", "--workers", type=int, default=None, help="Nombre de processus (défaut : un par cœur).")
+    parser.add_argument("-s", "--seed", type=int, default=0, help="Graine du tournoi.")
+    parser.add_argument("--limit", type=int, default=None, help="Ne garder que les N premières espèces.")
+    parser.add_argument("-o", "--output", default=OUTPUT_DIR, help="Dossier de sortie.")
+    args = parser.parse_args()
+
+    species = [p["id"] for p in get_all_pokemon()][:args.limit]
+    save_npy(os.path.join(args.output, "species.npy"), array("h", species), (len(species),))
+
+    with ProcessPoolExecutor(max_workers=args.workers, initializer=init_worker) as pool:
+        for level in args.levels:
+            run_level(pool, species, level, args.battles, args.seed, args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+# tools/simulate_battles.py
+
+import argparse
+import os
+import platform
+import random
+import sys
+import time
+
+# Ajoute le dossier racine au path pour les imports relatifs
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from battle.ai import AIPolicy, BattleAI, ExpectiminimaxAI
+from battle.mcts import MCTSAI
+from battle.rng import BattleRNG
+from battle.simulator import BattleState, random_policy, run_battle
+from data.pokemon_loader import get_all_pokemon
+
+
+# Politiques du camp A ; les IA de recherche ont un effort fixe (sans budget de temps) pour rester reproductibles
+POLICIES = {
+    "random": lambda args: random_policy,
+    "greedy": lambda args: AIPolicy(BattleAI()),
+    "search": lambda args: AIPolicy(ExpectiminimaxAI(max_depth=args.depth, time_budget_ms=None)),
+    "mcts": lambda args: AIPolicy(MCTSAI(budget_ms=None, iterations=args.playouts, seed=args.seed)),
+}
+
+
+def main():
+    """
+    Joue des combats 1 contre 1 aléatoires sans interface et affiche le débit
+    (combats/s) ainsi que la répartition des résultats.
+
+    La configuration (politique, niveau, graine, Python, machine) est affichée
+    avec le débit : un chiffre cité doit être accompagné de cette ligne. Le
+    temps mesuré comprend la création des combattants et le premier décodage
+    des attaques de chaque espèce.
+    """
+    parser = argparse.ArgumentParser(description="Simulation de combats en masse (sans pygame).")
+    parser.add_argument("-n", "--battles", type=int, default=1000, help="Nombre de combats.")
+    parser.add_argument("-l", "--level", type=int, default=20, help="Niveau des Pokémon.")
+    parser.add_argument("-s", "--seed", type=int, default=None, help="Graine aléatoire.")
+    parser.add_argument("--ai", choices=sorted(POLICIES), default="random", help="Politique du camp A (B joue au hasard).")
+    parser.add_argument("--depth", type=int, default=2, help="Profondeur de l'IA de recherche (en tours).")
+    parser.add_argument("--playouts", type=int, default=200, help="Parties simulées par décision (IA mcts).")
+    args = parser.parse_args()
+
+    policy_a = POLICIES[args.ai](args)
+
+    # Une graine donne toujours la même série de combats
+    master = random.Random(args.seed)
+    species = [p["id"] for p in get_all_pokemon()]
+    results = {"a": 0, "b": 0, "draw": 0}
+    turns = 0
+
+    print(f"Configuration : --ai {args.ai}, niveau {args.level}, graine {args.seed}, {args.battles} combats "
+          f"(Python {platform.python_version()}, {platform.machine()}, {os.cpu_count()} cœur(s))")
+
+    start = time.perf_counter()
+    for _ in range(args.battles):
+        state = BattleState.from_species(
+            [master.choice(species)], [master.choice(species)], args.level,
+            rng=BattleRNG(master.getrandbits(64))
+        )
+        run_battle(state, policy_a)
+        results[state.winner] += 1
+        turns += state.turn
+    elapsed = time.perf_counter() - start
+
+    print(f"✅ {args.battles} combats en {elapsed:.2f}s ({args.battles / elapsed:.0f} combats/s, "
+          f"{turns / max(1, args.battles):.1f} tours en moyenne)")
+    print(f"  - Victoires A : {results['a']}  |  Victoires B : {results['b']}  |  Égalités : {results['draw']}")
+
+
+if __name__ == "__main__":
+    main()
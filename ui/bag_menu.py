@@ -27,6 +27,7 @@ class BagMenu:
         self.background = self.load_image("assets/ui/Bag/bg_items.png", (0, 0, 0))
         self.cursor_img = self.load_image("assets/ui/Bag/cursor.png", (255, 0, 0))
         self.bag_item_img = self.load_image("assets/ui/Bag/bag_items.png", (100, 100, 255))
+        self.icons = {}  # Nom d'objet → icône agrandie (ou None), chargée une seule fois
 
         self.font_items = pygame.font.Font("assets/fonts/power clear.ttf", 22)
         self.font_description = pygame.font.Font("assets/fonts/power clear bold.ttf", 20)
@@ -52,6 +53,17 @@ class BagMenu:
             surface.fill(fallback_color)
             return surface
 
+    def get_icon(self, item_name):
+        """Retourne l'icône agrandie d'un objet (mise en cache), ou None si le sprite est absent."""
+        if item_name not in self.icons:
+            icon = None
+            sprite_path = get_item_sprite(item_name)
+            if os.path.exists(sprite_path):
+                icon = pygame.image.load(sprite_path).convert_alpha()
+                icon = pygame.transform.scale(icon, (icon.get_width() * 2, icon.get_height() * 2))
+            self.icons[item_name] = icon
+        return self.icons[item_name]
+
     def queue_message(self, text):
         """Ajoute un message à la file (ex: objet inutile)."""
         self.message_queue.append(text)
@@ -164,12 +176,10 @@ class BagMenu:
         # === Affichage de l’icône et de la description ===
         if not self.empty_mode and self.inventory[self.selected_index]["name"] != "FERMER LE SAC":
             selected_item = self.inventory[self.selected_index]
-            sprite_path = get_item_sprite(selected_item["name"])
+            icon = self.get_icon(selected_item["name"])
 
             # Icône
-            if os.path.exists(sprite_path):
-                icon = pygame.image.load(sprite_path).convert_alpha()
-                icon = pygame.transform.scale(icon, (icon.get_width() * 2, icon.get_height() * 2))
+            if icon is not None:
                 icon_x = self.ICON_BOX_POS[0] + (self.ICON_BOX_SIZE[0] - icon.get_width()) // 2
                 icon_y = self.ICON_BOX_POS[1] + (self.ICON_BOX_SIZE[1] - icon.get_height()) // 2
                 screen.blit(icon, (icon_x, icon_y))
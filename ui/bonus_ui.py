@@ -2,8 +2,8 @@
 
 import os
 import pygame
-import unicodedata
 from data.items_loader import get_item_by_name
+from data.name_index import asset_stem
 
 # === Chemins ===
 FONTS = os.path.join("assets", "fonts")
@@ -14,9 +14,7 @@ def normalize_item_filename(name):
     """
     Normalise un nom d'objet pour correspondre à un nom de fichier image.
     """
-    name = name.lower().replace(" ", "-")
-    name = unicodedata.normalize("NFD", name).encode("ascii", "ignore").decode("utf-8")
-    return name + ".png"
+    return asset_stem(name, "-") + ".png"
 
 class BonusUI:
     """
@@ -43,6 +41,7 @@ class BonusUI:
 
         self.bonus_bg_path = os.path.join(UI_PATH, "dialogue_box_bonus.png")
         self.bonus_bg = None  # Chargé à la première frame
+        self.sprites = {}  # Nom d'objet → Surface (ou None), chargé une seule fois
 
     def set_items(self, items):
         """
@@ -71,23 +70,37 @@ class BonusUI:
         for i, item_name in enumerate(self.items):
             line_y = y + 5 + i * self.spacing
 
-            # Tentative de chargement du sprite de l'objet
-            item_data = get_item_by_name(item_name)
-            if item_data and "sprite" in item_data:
-                sprite_path = os.path.join(SPRITE_PATH, item_data["sprite"])
-                if os.path.exists(sprite_path):
-                    sprite = pygame.image.load(sprite_path).convert_alpha()
-                    screen.blit(sprite, (x - 20, line_y))
-                else:
-                    pygame.draw.rect(screen, (100, 100, 100), (x - 20, line_y, 32, 32))  # fallback
+            sprite = self.get_sprite(item_name)
+            if sprite is not None:
+                screen.blit(sprite, (x - 20, line_y))
             else:
-                pygame.draw.rect(screen, (100, 100, 100), (x - 20, line_y, 32, 32))  # fallback générique
+                pygame.draw.rect(screen, (100, 100, 100), (x - 20, line_y, 32, 32))  # fallback
 
             # Affichage du nom
             color = (255, 0, 0) if i == self.selected else (0, 0, 0)
             name_surface = self.font_items.render(item_name, True, color)
             screen.blit(name_surface, (x + 10, line_y + 4))
 
+    def get_sprite(self, item_name):
+        """
+        Retourne le sprite d'un objet, chargé depuis le disque au premier appel seulement.
+
+        Args:
+            item_name (str): Nom de l'objet.
+
+        Returns:
+            pygame.Surface | None: Sprite, ou None s'il est introuvable.
+        """
+        if item_name not in self.sprites:
+            sprite = None
+            item_data = get_item_by_name(item_name)
+            if item_data and "sprite" in item_data:
+                sprite_path = os.path.join(SPRITE_PATH, item_data["sprite"])
+                if os.path.exists(sprite_path):
+                    sprite = pygame.image.load(sprite_path).convert_alpha()
+            self.sprites[item_name] = sprite
+        return self.sprites[item_name]
+
     def move_selection(self, direction):
         """
         Change la sélection actuelle.
@@ -1,11 +1,11 @@
 # ui/pokemon_menu.py
 
-import unicodedata
 import pygame
 import os, sys
 
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 from core.config import SCREEN_WIDTH, SCREEN_HEIGHT
+from data.name_index import asset_stem
 
 ASSETS = os.path.join("assets", "ui", "party")
 ICONS = os.path.join(ASSETS, "pokemon_icons")
@@ -16,8 +16,8 @@ DIALOGUE_BOX_POS = (2, 322)
 DIALOGUE_BOX_SEL = (350, 258)
 
 def normalize_name(name):
-    """Normalise un nom pour correspondre aux fichiers d’icônes (ex: accents supprimés)."""
-    return unicodedata.normalize("NFD", name).encode("ascii", "ignore").decode("utf-8").upper()
+    """Normalise un nom pour correspondre aux fichiers d’icônes (ex: "M. Mime" → "m._mime")."""
+    return asset_stem(name)
 
 class PokemonMenu:
     """Menu de sélection de Pokémon pour l'équipe du joueur."""